@@ -3,178 +3,23 @@ Convert HTML presentation to native PDF using pdfkit
 This creates a proper PDF document with text and vector graphics
 """
 
+import itertools
 import os
-import subprocess
-import sys
 
-def install_requirements():
-    """Install required packages"""
-    packages = ['pdfkit', 'beautifulsoup4']
-    for package in packages:
-        try:
-            __import__(package)
-        except ImportError:
-            print(f"Installing {package}...")
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+from slide_export.deps import install_hint, missing
+from slide_export.printhtml import compile_template, get_layout
 
-def create_printable_html():
-    """Create a print-optimized version of the presentation"""
-
-    from bs4 import BeautifulSoup
-
-    # Read the original HTML
-    with open('index.html', 'r', encoding='utf-8') as f:
-        html_content = f.read()
-
-    # Parse HTML
-    soup = BeautifulSoup(html_content, 'html.parser')
-
-    # Create new HTML for printing
-    print_html = """<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>가족계획: 미완의 과제 - PDF Version</title>
-    <style>
-        @page {
-            size: A4 landscape;
-            margin: 10mm;
-        }
-
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            font-family: 'Malgun Gothic', 'Segoe UI', sans-serif;
-            line-height: 1.6;
-            color: #333;
-            background: white;
-        }
-
-        .pdf-slide {
-            width: 277mm;
-            height: 190mm;
-            page-break-after: always;
-            page-break-inside: avoid;
-            padding: 20mm;
-            display: flex;
-            flex-direction: column;
-            justify-content: center;
-            position: relative;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-        }
-
-        .pdf-slide:nth-child(even) {
-            background: white;
-            color: #333;
-        }
-
-        .pdf-slide:last-child {
-            page-break-after: auto;
-        }
-
-        h1 {
-            font-size: 36pt;
-            margin-bottom: 20px;
-            text-align: center;
-        }
-
-        h2 {
-            font-size: 28pt;
-            margin-bottom: 15px;
-            color: #4a5568;
-        }
-
-        h3 {
-            font-size: 22pt;
-            margin-bottom: 10px;
-            color: #2d3748;
-        }
-
-        h4 {
-            font-size: 18pt;
-            margin-bottom: 8px;
-            color: #4a5568;
-        }
-
-        p {
-            font-size: 14pt;
-            margin-bottom: 10px;
-            line-height: 1.8;
-        }
-
-        ul, ol {
-            margin-left: 20px;
-            margin-bottom: 15px;
-        }
-
-        li {
-            font-size: 14pt;
-            margin-bottom: 8px;
-        }
-
-        .stats-box {
-            background: rgba(255,255,255,0.1);
-            padding: 15px;
-            border-radius: 10px;
-            margin: 10px 0;
-        }
-
-        .pdf-slide:nth-child(even) .stats-box {
-            background: #f7fafc;
-        }
-
-        .highlight {
-            background: #ffd93d;
-            color: #333;
-            padding: 2px 6px;
-            border-radius: 4px;
-            font-weight: bold;
-        }
-
-        .source {
-            position: absolute;
-            bottom: 20mm;
-            right: 20mm;
-            font-size: 10pt;
-            opacity: 0.8;
-        }
-
-        .page-number {
-            position: absolute;
-            bottom: 10mm;
-            right: 10mm;
-            font-size: 10pt;
-        }
-
-        table {
-            width: 100%;
-            border-collapse: collapse;
-            margin: 20px 0;
-        }
-
-        th, td {
-            padding: 10px;
-            border: 1px solid rgba(255,255,255,0.3);
-            text-align: left;
-        }
-
-        .pdf-slide:nth-child(even) th,
-        .pdf-slide:nth-child(even) td {
-            border-color: #e2e8f0;
-        }
-    </style>
-</head>
-<body>
-"""
+def check_requirements():
+    """Report missing packages (checked without importing them); True if all are present"""
+    absent = missing('pdfkit')
+    if absent:
+        print(f"Missing {', '.join(absent)}. Install with: {install_hint(absent)}")
+    return not absent
 
+# Hand-written print slides; the rest of the deck follows them
+PRINT_SLIDES = (
     # Slide 1: Title
-    print_html += """
+    """
     <div class="pdf-slide">
         <h1>가족계획: 미완의 과제</h1>
         <p style="text-align: center; font-size: 18pt; margin-top: 20px;">Family planning: The unfinished agenda</p>
@@ -199,10 +44,9 @@ def create_printable_html():
         <p class="source">Cleland, J., et al. (2006). The Lancet, 368(9549), 1810-1827.</p>
         <span class="page-number">1</span>
     </div>
-"""
-
+""",
     # Slide 2: Introduction
-    print_html += """
+    """
     <div class="pdf-slide">
         <h1>서론</h1>
         <h3>지난 50년간의 성과</h3>
@@ -219,10 +63,9 @@ def create_printable_html():
         </ul>
         <span class="page-number">2</span>
     </div>
-"""
-
+""",
     # Slide 3: Population Trends
-    print_html += """
+    """
     <div class="pdf-slide">
         <h1>인구 동향과 미충족 수요</h1>
         <h3>2050년 인구 전망</h3>
@@ -260,21 +103,30 @@ def create_printable_html():
         </ul>
         <span class="page-number">3</span>
     </div>
-"""
+""",
+)
+
+# 원본 덱에서 추출한 슬라이드
+EXTRACTED_SLIDE = compile_template('''
+    <div class="pdf-slide">
+        $html
+        <span class="page-number">$number</span>
+    </div>
+''')
 
-    # Continue with remaining slides...
-    # Add slides 4-12 with similar structure
+def create_printable_html(source='index.html', backend=None, output='presentation_for_pdf.html'):
+    """Create a print-optimized version of the presentation
 
-    print_html += """
-</body>
-</html>
-"""
+    Slides after the hand-written ones are taken from `source`; see
+    slide_export.htmlparse for `backend` ('lxml' or 'html.parser').
+    """
 
-    # Save the print-optimized HTML
-    with open('presentation_for_pdf.html', 'w', encoding='utf-8') as f:
-        f.write(print_html)
+    from slide_export.htmlparse import iter_slides
 
-    return 'presentation_for_pdf.html'
+    # Remaining slides: 원본 덱에서 슬라이드 단위로 스트리밍 추출
+    extracted = (EXTRACTED_SLIDE({'html': slide.html.strip(), 'number': slide.number})
+                 for slide in iter_slides(source, backend) if slide.index >= len(PRINT_SLIDES))
+    return get_layout('A4').write(output, itertools.chain(PRINT_SLIDES, extracted))
 
 def convert_with_pdfkit():
     """Convert HTML to PDF using pdfkit (requires wkhtmltopdf)"""
@@ -323,8 +175,9 @@ def main():
     print("Converting HTML presentation to native PDF document...")
     print("This will create a PDF with selectable text and proper formatting.\n")
 
-    # Install requirements if needed
-    install_requirements()
+    # Check requirements
+    if not check_requirements():
+        return
 
     # Try pdfkit conversion
     pdf_file = convert_with_pdfkit()
@@ -3,32 +3,31 @@
 """
 
 import os
-from PIL import Image
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4, landscape
-from reportlab.lib.utils import ImageReader
-import io
 
-def create_fullscreen_pdf():
-    """전체화면 비율(16:9)로 PDF 생성"""
+from slide_export import assemble_pdf
+from slide_export.assemble import A4_LANDSCAPE, FULLSCREEN_16X9, PageNumbers
+from slide_export.encode import AdaptiveEncoder
+from slide_export.manifest import discover_images
+from slide_export.trace import tracing
 
-    # 커스텀 페이지 크기 설정 (16:9 비율)
-    # A4 landscape는 297mm x 210mm
-    # 16:9 비율로 조정: 297mm x 167mm
-    page_width = 842  # 297mm in points
-    page_height = 473  # 167mm in points (16:9 ratio)
+# 전체화면 버전의 페이지 번호: 우측 하단 회색 "3 / 12"
+FULLSCREEN_PAGE_NUMBERS = PageNumbers(template='{page} / {total}', size=9, margin=30,
+                                      align='right', gray=0.5)
 
-    # 이미지 파일 수집
-    image_files = []
-    image_dir = '.playwright-mcp'
+def create_fullscreen_pdf(budget=None):
+    """전체화면 비율(16:9)로 PDF 생성
+
+    페이지마다 팔레트 PNG / Flate / JPEG 중 가장 작은 형식을 선택.
+    `budget`(바이트)을 주면 전체 이미지 크기를 그 안에 맞춤
+    """
+
+    # 16:9 비율: 297mm x 167mm
+    page_width, page_height = FULLSCREEN_16X9
 
-    # 슬라이드 1-12 이미지 확인
-    for i in range(1, 13):
-        file_name = f'slide_{i:02d}.png'
-        file_path = os.path.join(image_dir, file_name)
-        if os.path.exists(file_path):
-            image_files.append(file_path)
-            print(f"Found: {file_name}")
+    # 이미지 파일 수집 (slide_NN.png 전부, 번호 순)
+    image_files = discover_images('.playwright-mcp')
+    for file_path in image_files:
+        print(f"Found: {os.path.basename(file_path)}")
 
     if not image_files:
         print("No slide images found!")
@@ -40,55 +39,10 @@ def create_fullscreen_pdf():
     output_file = 'FamilyPlanning_FullScreen_16x9.pdf'
     print(f"Creating PDF with 16:9 aspect ratio: {output_file}")
 
-    # PDF 캔버스 생성 (커스텀 크기)
-    c = canvas.Canvas(output_file, pagesize=(page_width, page_height))
-
-    for idx, img_path in enumerate(image_files):
-        print(f"Processing slide {idx + 1}/{len(image_files)}...")
-
-        # 이미지 열기
-        img = Image.open(img_path)
-        img_width, img_height = img.size
-        img_aspect = img_width / img_height
-
-        # 16:9 페이지에 맞게 크기 계산
-        page_aspect = page_width / page_height
-
-        if img_aspect > page_aspect:
-            # 너비 기준으로 스케일링
-            new_width = page_width
-            new_height = page_width / img_aspect
-        else:
-            # 높이 기준으로 스케일링
-            new_height = page_height
-            new_width = page_height * img_aspect
-
-        # 중앙 정렬
-        x_offset = (page_width - new_width) / 2
-        y_offset = (page_height - new_height) / 2
-
-        # 이미지를 메모리 스트림으로 저장
-        img_buffer = io.BytesIO()
-        img.save(img_buffer, format='PNG')
-        img_buffer.seek(0)
-
-        # PDF에 이미지 그리기
-        c.drawImage(ImageReader(img_buffer),
-                   x_offset, y_offset,
-                   width=new_width, height=new_height,
-                   preserveAspectRatio=True)
-
-        # 페이지 번호 추가 (우측 하단)
-        c.setFont("Helvetica", 9)
-        c.setFillColorRGB(0.5, 0.5, 0.5)
-        c.drawRightString(page_width - 30, 20, f"{idx + 1} / {len(image_files)}")
-
-        # 다음 페이지 (마지막 페이지가 아닌 경우)
-        if idx < len(image_files) - 1:
-            c.showPage()
-
-    # PDF 저장
-    c.save()
+    encoder = AdaptiveEncoder(budget=budget)
+    assemble_pdf(image_files, output_file, FULLSCREEN_16X9,
+                 page_numbers=FULLSCREEN_PAGE_NUMBERS, encoder=encoder, executor='process')
+    print(encoder.summary())
 
     print(f"\nPDF created successfully: {output_file}")
     print(f"  Page size: {page_width:.0f} x {page_height:.0f} points (16:9 ratio)")
@@ -96,18 +50,11 @@ def create_fullscreen_pdf():
 
     return output_file
 
-def create_standard_pdf():
-    """표준 A4 가로 방향 PDF 생성"""
+def create_standard_pdf(budget=None):
+    """표준 A4 가로 방향 PDF 생성 (페이지별 압축 형식 자동 선택)"""
 
     # 이미지 파일 수집
-    image_files = []
-    image_dir = '.playwright-mcp'
-
-    for i in range(1, 13):
-        file_name = f'slide_{i:02d}.png'
-        file_path = os.path.join(image_dir, file_name)
-        if os.path.exists(file_path):
-            image_files.append(file_path)
+    image_files = discover_images('.playwright-mcp')
 
     if not image_files:
         print("No slide images found!")
@@ -117,45 +64,9 @@ def create_standard_pdf():
     output_file = 'FamilyPlanning_Standard_A4.pdf'
     print(f"Creating standard A4 landscape PDF: {output_file}")
 
-    pdf_width, pdf_height = landscape(A4)
-    c = canvas.Canvas(output_file, pagesize=landscape(A4))
-
-    for idx, img_path in enumerate(image_files):
-        print(f"Processing slide {idx + 1}/{len(image_files)}...")
-
-        img = Image.open(img_path)
-        img_width, img_height = img.size
-        aspect = img_width / img_height
-
-        # A4 페이지에 맞게 크기 계산
-        if aspect > pdf_width / pdf_height:
-            new_width = pdf_width
-            new_height = pdf_width / aspect
-        else:
-            new_height = pdf_height
-            new_width = pdf_height * aspect
-
-        # 중앙 정렬
-        x_offset = (pdf_width - new_width) / 2
-        y_offset = (pdf_height - new_height) / 2
-
-        # 이미지 추가
-        img_buffer = io.BytesIO()
-        img.save(img_buffer, format='PNG')
-        img_buffer.seek(0)
-
-        c.drawImage(ImageReader(img_buffer),
-                   x_offset, y_offset,
-                   width=new_width, height=new_height)
-
-        # 페이지 번호
-        c.setFont("Helvetica", 10)
-        c.drawString(pdf_width - 50, 20, f"{idx + 1}/{len(image_files)}")
-
-        if idx < len(image_files) - 1:
-            c.showPage()
-
-    c.save()
+    encoder = AdaptiveEncoder(budget=budget)
+    assemble_pdf(image_files, output_file, A4_LANDSCAPE, encoder=encoder, executor='process')
+    print(encoder.summary())
 
     print(f"\nPDF created successfully: {output_file}")
     print(f"  Page size: A4 Landscape")
@@ -190,4 +101,6 @@ def main():
     print("인쇄나 일반 문서용으로는 A4 버전을 사용하세요.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # SLIDE_EXPORT_TRACE=<path>이면 단계별 구간 기록
+    with tracing():
+        main()
\ No newline at end of file
@@ -3,33 +3,17 @@ Create PDF from captured slide images
 """
 
 import os
-from PIL import Image
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import landscape, A4
-from reportlab.lib.utils import ImageReader
-import io
+
+from slide_export.incremental import IncrementalAssembler
+from slide_export.manifest import discover_images
 
 def create_pdf_from_images(image_folder='.playwright-mcp', output_file='FamilyPlanning_Presentation.pdf'):
     """Merge image files into a single PDF"""
 
-    # List of image files
-    image_files = []
-
-    # First 4 slides were captured earlier
-    for i in range(1, 5):
-        file_name = f'slide_{i:02d}.png'
-        file_path = os.path.join(image_folder, file_name)
-        if os.path.exists(file_path):
-            image_files.append(file_path)
-            print(f"Found: {file_name}")
-
-    # Slides 5-12 captured just now
-    for i in range(5, 13):
-        file_name = f'slide_{i:02d}.png'
-        file_path = os.path.join(image_folder, file_name)
-        if os.path.exists(file_path):
-            image_files.append(file_path)
-            print(f"Found: {file_name}")
+    # Every slide_NN.png in the folder, in slide order
+    image_files = discover_images(image_folder)
+    for file_path in image_files:
+        print(f"Found: {os.path.basename(file_path)}")
 
     if not image_files:
         print("No image files found!")
@@ -38,54 +22,13 @@ def create_pdf_from_images(image_folder='.playwright-mcp', output_file='FamilyPl
     print(f"\nTotal slides found: {len(image_files)}")
     print(f"Creating PDF: {output_file}")
 
-    # Create PDF canvas (landscape orientation for presentations)
-    pdf_width, pdf_height = landscape(A4)
-    c = canvas.Canvas(output_file, pagesize=landscape(A4))
-
-    for idx, img_path in enumerate(image_files):
-        print(f"Processing slide {idx + 1}/{len(image_files)}...")
-
-        # Open image
-        img = Image.open(img_path)
-        img_width, img_height = img.size
-        aspect = img_width / img_height
-
-        # Calculate size to fit PDF page
-        if aspect > pdf_width / pdf_height:
-            # Width-based scaling
-            new_width = pdf_width
-            new_height = pdf_width / aspect
-        else:
-            # Height-based scaling
-            new_height = pdf_height
-            new_width = pdf_height * aspect
-
-        # Center alignment offsets
-        x_offset = (pdf_width - new_width) / 2
-        y_offset = (pdf_height - new_height) / 2
-
-        # Save image to memory stream
-        img_buffer = io.BytesIO()
-        img.save(img_buffer, format='PNG')
-        img_buffer.seek(0)
-
-        # Draw image on PDF
-        c.drawImage(ImageReader(img_buffer),
-                   x_offset, y_offset,
-                   width=new_width, height=new_height)
-
-        # Add page number
-        c.setFont("Helvetica", 10)
-        c.drawString(pdf_width - 50, 20, f"{idx + 1}/{len(image_files)}")
-
-        # Next page (except for the last page)
-        if idx < len(image_files) - 1:
-            c.showPage()
-
-    # Save PDF
-    c.save()
+    # Landscape A4; only slides whose image changed since the last run are
+    # written again (appended as an incremental update, see <output>.index.json)
+    stats = IncrementalAssembler(output_file).build(
+        (os.path.splitext(os.path.basename(path))[0], path) for path in image_files)
 
-    print(f"\nPDF created successfully: {output_file}")
+    print(f"\nPDF {stats['mode']}: {output_file} "
+          f"({stats['rewritten']}/{stats['pages']} pages written)")
     file_size_mb = os.path.getsize(output_file) / 1024 / 1024
     print(f"File size: {file_size_mb:.2f} MB")
 
@@ -3,266 +3,17 @@ HTML 프레젠테이션을 전체화면 비율로 PDF 문서로 변환
 weasyprint 또는 pdfkit을 사용하여 네이티브 PDF 생성
 """
 
+import itertools
 import os
-import subprocess
-import sys
 
-def install_package(package):
-    """패키지 설치"""
-    try:
-        __import__(package)
-        return True
-    except ImportError:
-        print(f"Installing {package}...")
-        try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-            return True
-        except:
-            return False
-
-def create_fullscreen_html():
-    """전체화면 비율로 최적화된 HTML 생성"""
-
-    # 원본 HTML 읽기
-    with open('index.html', 'r', encoding='utf-8') as f:
-        original_html = f.read()
-
-    # 전체화면 비율(16:9)에 최적화된 HTML 생성
-    fullscreen_html = """<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>가족계획: 미완의 과제 - PDF Version</title>
-    <link rel="stylesheet" href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css">
-    <style>
-        @page {
-            size: 297mm 167mm;  /* 16:9 비율 */
-            margin: 0;
-        }
-
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            font-family: 'Malgun Gothic', '맑은 고딕', 'Apple SD Gothic Neo', sans-serif;
-            color: #333;
-            background: white;
-            margin: 0;
-            padding: 0;
-        }
-
-        .pdf-slide {
-            width: 297mm;
-            height: 167mm;  /* 16:9 비율 */
-            page-break-after: always;
-            page-break-inside: avoid;
-            position: relative;
-            overflow: hidden;
-            display: flex;
-            flex-direction: column;
-            justify-content: center;
-            align-items: center;
-            padding: 15mm;
-        }
-
-        .pdf-slide:last-child {
-            page-break-after: auto;
-        }
-
-        /* 슬라이드 1: 타이틀 */
-        .slide-title {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            text-align: center;
-        }
-
-        .slide-title h1 {
-            font-size: 48pt;
-            margin-bottom: 20mm;
-            font-weight: 700;
-        }
-
-        .slide-title .subtitle {
-            font-size: 24pt;
-            margin-bottom: 30mm;
-            opacity: 0.95;
-        }
-
-        .slide-title .features {
-            display: flex;
-            justify-content: space-around;
-            width: 100%;
-            gap: 10mm;
-        }
-
-        .slide-title .feature-box {
-            background: rgba(255,255,255,0.15);
-            padding: 10mm;
-            border-radius: 10px;
-            flex: 1;
-        }
-
-        .slide-title .feature-box h4 {
-            font-size: 18pt;
-            margin-bottom: 5mm;
-        }
-
-        .slide-title .feature-box p {
-            font-size: 12pt;
-        }
-
-        /* 일반 슬라이드 */
-        .slide-content {
-            background: white;
-            color: #333;
-        }
-
-        .slide-content h1 {
-            font-size: 36pt;
-            color: #2d3748;
-            margin-bottom: 15mm;
-            text-align: center;
-            border-bottom: 3px solid #667eea;
-            padding-bottom: 5mm;
-        }
-
-        .slide-content h2 {
-            font-size: 28pt;
-            color: #4a5568;
-            margin-bottom: 10mm;
-            margin-top: 10mm;
-        }
-
-        .slide-content h3 {
-            font-size: 22pt;
-            color: #4a5568;
-            margin-bottom: 8mm;
-            margin-top: 8mm;
-        }
-
-        .slide-content p {
-            font-size: 14pt;
-            line-height: 1.8;
-            margin-bottom: 8mm;
-        }
-
-        .slide-content ul, .slide-content ol {
-            font-size: 14pt;
-            line-height: 1.8;
-            margin-left: 10mm;
-            margin-bottom: 10mm;
-        }
-
-        .slide-content li {
-            margin-bottom: 5mm;
-        }
-
-        /* 통계 박스 */
-        .stats-container {
-            display: flex;
-            justify-content: space-around;
-            margin: 15mm 0;
-            gap: 10mm;
-        }
-
-        .stat-box {
-            background: #f7fafc;
-            border-left: 4px solid #667eea;
-            padding: 10mm;
-            flex: 1;
-            text-align: center;
-        }
-
-        .stat-number {
-            font-size: 36pt;
-            font-weight: bold;
-            color: #667eea;
-            display: block;
-            margin-bottom: 5mm;
-        }
-
-        .stat-label {
-            font-size: 12pt;
-            color: #4a5568;
-        }
-
-        /* 테이블 */
-        table {
-            width: 100%;
-            border-collapse: collapse;
-            margin: 10mm 0;
-            font-size: 12pt;
-        }
-
-        th {
-            background: #667eea;
-            color: white;
-            padding: 5mm;
-            text-align: left;
-        }
-
-        td {
-            padding: 5mm;
-            border-bottom: 1px solid #e2e8f0;
-        }
-
-        tr:nth-child(even) {
-            background: #f7fafc;
-        }
-
-        /* 차트 컨테이너 */
-        .chart-container {
-            width: 100%;
-            height: 80mm;
-            margin: 10mm 0;
-            background: #f7fafc;
-            border-radius: 10px;
-            padding: 10mm;
-        }
-
-        /* 소스 표시 */
-        .source {
-            position: absolute;
-            bottom: 10mm;
-            right: 15mm;
-            font-size: 10pt;
-            color: #718096;
-            font-style: italic;
-        }
-
-        /* 페이지 번호 */
-        .page-number {
-            position: absolute;
-            bottom: 10mm;
-            left: 15mm;
-            font-size: 10pt;
-            color: #718096;
-        }
-
-        /* 강조 */
-        .highlight {
-            background: #ffd93d;
-            color: #333;
-            padding: 2px 6px;
-            border-radius: 4px;
-            font-weight: bold;
-        }
-
-        strong {
-            color: #667eea;
-            font-weight: 600;
-        }
-    </style>
-</head>
-<body>
-"""
+from slide_export.charts import inline_svgs, load_visualizations
+from slide_export.deps import available, install_hint
+from slide_export.printhtml import get_layout, load_citations, slide_records
 
+# 직접 구성한 슬라이드; 이후 슬라이드는 data/slides.json 레코드로 채움
+FULLSCREEN_SLIDES = (
     # 슬라이드 1: 타이틀
-    fullscreen_html += """
+    """
     <div class="pdf-slide slide-title">
         <h1>가족계획: 미완의 과제</h1>
         <p class="subtitle">Family planning: The unfinished agenda</p>
@@ -287,10 +38,9 @@ def create_fullscreen_html():
         <p class="source">Cleland, J., et al. (2006). The Lancet, 368(9549), 1810-1827</p>
         <span class="page-number">1</span>
     </div>
-"""
-
+""",
     # 슬라이드 2: 서론
-    fullscreen_html += """
+    """
     <div class="pdf-slide slide-content">
         <h1>서론</h1>
         <div style="display: flex; gap: 20mm;">
@@ -327,10 +77,9 @@ def create_fullscreen_html():
         </div>
         <span class="page-number">2</span>
     </div>
-"""
-
+""",
     # 슬라이드 3: 인구 동향
-    fullscreen_html += """
+    """
     <div class="pdf-slide slide-content">
         <h1>인구 동향과 미충족 수요</h1>
         <h3>2050년 대륙별 인구 전망</h3>
@@ -376,10 +125,9 @@ def create_fullscreen_html():
         </div>
         <span class="page-number">3</span>
     </div>
-"""
-
+""",
     # 슬라이드 4: 니제르 사례
-    fullscreen_html += """
+    """
     <div class="pdf-slide slide-content">
         <h1>사하라이남 아프리카: 니제르 위기</h1>
         <div style="display: flex; gap: 15mm;">
@@ -418,21 +166,32 @@ def create_fullscreen_html():
         <p class="source">※ 2025년: Niger TFR 6.7명 (세계 최고), 피임률 17% (UN, 2024)</p>
         <span class="page-number">4</span>
     </div>
-"""
+""",
+)
 
-    # 나머지 슬라이드들 추가 (5-12)
-    # ... 각 슬라이드별 상세 내용 추가 ...
+def create_fullscreen_html(output='fullscreen_presentation.html', data_dir='data'):
+    """전체화면 비율로 최적화된 HTML 생성"""
 
-    fullscreen_html += """
-</body>
-</html>
-"""
+    # 전체화면 비율(16:9) 레이아웃 - 템플릿은 프로세스당 한 번만 컴파일
+    layout = get_layout('16:9')
+    records = [record for record in slide_records(data_dir)
+               if (record.get('order') or 0) > len(FULLSCREEN_SLIDES)]
+    # 차트는 브라우저 없이 SVG로 그려 넣음 (WeasyPrint/pdfkit은 스크립트를 실행하지 않음)
+    charts = inline_svgs(load_visualizations(data_dir))
+    parts = layout.render(itertools.chain(FULLSCREEN_SLIDES, records), load_citations(data_dir),
+                          charts=charts)
+
+    # 이미 벤더링된 외부 CSS만 로컬 파일로 교체 - 링크는 <head>에만 있음
+    # (다운로드는 python -m slide_export.bundle 단계에서만; 여기서는 네트워크를 쓰지 않음)
+    from slide_export.bundle import AssetBundle
+    head = next(parts)
 
     # 파일 저장
-    with open('fullscreen_presentation.html', 'w', encoding='utf-8') as f:
-        f.write(fullscreen_html)
+    with open(output, 'w', encoding='utf-8') as f:
+        f.write(AssetBundle().rewrite_html(head, os.path.dirname(output) or '.'))
+        f.writelines(parts)
 
-    return 'fullscreen_presentation.html'
+    return output
 
 def convert_with_weasyprint():
     """WeasyPrint를 사용한 PDF 변환"""
@@ -503,15 +262,15 @@ def main():
     print("16:9 비율로 최적화된 PDF 생성")
     print("=" * 60)
 
-    # WeasyPrint 시도
-    if install_package('weasyprint'):
+    # WeasyPrint 시도 (설치 여부만 확인 - 실행 중 pip 설치는 하지 않음)
+    if available('weasyprint'):
         pdf = convert_with_weasyprint()
         if pdf:
             print(f"\n✓ Successfully created: {pdf}")
             return
 
     # pdfkit 시도
-    if install_package('pdfkit'):
+    if available('pdfkit'):
         pdf = convert_with_pdfkit()
         if pdf:
             print(f"\n✓ Successfully created: {pdf}")
@@ -519,10 +278,10 @@ def main():
             return
 
     # 둘 다 실패한 경우
-    print("\n어떤 PDF 라이브러리도 설치할 수 없습니다.")
-    print("다음 중 하나를 수동으로 설치해주세요:")
-    print("1. pip install weasyprint")
-    print("2. pip install pdfkit (+ wkhtmltopdf 설치 필요)")
+    print("\n사용할 수 있는 PDF 라이브러리가 없습니다.")
+    print("다음 중 하나를 설치해주세요:")
+    print(f"1. {install_hint(['weasyprint'])}")
+    print(f"2. {install_hint(['pdfkit'])} (+ wkhtmltopdf 설치 필요)")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
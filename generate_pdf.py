@@ -4,135 +4,84 @@ HTML 프레젠테이션을 PDF로 변환하는 스크립트
 """
 
 import asyncio
-from playwright.async_api import async_playwright
-from PIL import Image
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import landscape, A4
-from reportlab.lib.utils import ImageReader
 import os
-import io
-
-async def capture_slides():
-    """HTML 프레젠테이션의 각 슬라이드를 스크린샷으로 캡처"""
-
-    # 슬라이드 총 개수 (index.html 분석 결과 기준)
-    total_slides = 17
-    screenshots = []
-
-    async with async_playwright() as p:
-        # 브라우저 실행
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            device_scale_factor=2  # 고해상도 캡처
-        )
-        page = await context.new_page()
-
-        # HTML 파일 열기
-        file_path = f"file:///{os.path.abspath('index.html').replace(os.sep, '/')}"
-        await page.goto(file_path)
-
-        # 페이지 로드 대기
-        await page.wait_for_load_state('networkidle')
-        await asyncio.sleep(2)  # 추가 대기 시간
-
+import shutil
+import tempfile
+
+from slide_export import CaptureCache, CaptureEngine
+from slide_export.assemble import StreamingAssembler
+from slide_export.pipeline import QUEUE_DEPTH, stream_frames
+from slide_export.resample import DEFAULT_DPI
+from slide_export.trace import tracing
+
+# 2배 캡처(3840x2160)는 A4에서 약 330 DPI - PDF에는 이 해상도로 줄여서 삽입
+TARGET_DPI = DEFAULT_DPI
+
+async def capture_slides(workers=None, slides=None, use_cache=True, ahead=QUEUE_DEPTH):
+    """HTML 프레젠테이션의 각 슬라이드를 캡처하여 (번호, 전체 개수, PNG 바이트)를 순서대로 전달
+
+    `slides`는 1부터 시작하는 슬라이드 번호 목록 (기본값: DOM의 모든 슬라이드)
+    `ahead`: 소비되지 않은 채 기다릴 수 있는 캡처 수 (넘으면 렌더링을 멈춤)
+    """
+
+    # 내용이 바뀌지 않은 슬라이드는 캐시에서 재사용
+    cache = CaptureCache() if use_cache else None
+
+    # 여러 페이지에서 병렬로 캡처 (고해상도)
+    async with CaptureEngine('index.html', workers=workers, device_scale_factor=2) as engine:
+        # DOM에서 슬라이드 목록을 한 번만 조회
+        manifest = await engine.manifest()
+        indices = manifest.indices(slides)
+        total_slides = len(indices)
         print(f"총 {total_slides}개 슬라이드를 캡처합니다...")
 
-        for slide_num in range(total_slides):
-            print(f"슬라이드 {slide_num + 1}/{total_slides} 캡처 중...")
-
-            # JavaScript로 슬라이드 전환
-            await page.evaluate(f'showSlide({slide_num})')
-            await asyncio.sleep(1)  # 슬라이드 전환 애니메이션 대기
-
-            # 스크린샷 캡처
-            screenshot_bytes = await page.screenshot(
-                full_page=False,
-                clip={'x': 0, 'y': 0, 'width': 1920, 'height': 1080}
-            )
-
-            # PIL 이미지로 변환
-            img = Image.open(io.BytesIO(screenshot_bytes))
-            screenshots.append(img)
-
-        await browser.close()
-
-    return screenshots
-
-def create_pdf(screenshots, output_file='FamilyPlanning_Presentation.pdf'):
-    """스크린샷 이미지들을 하나의 PDF로 병합"""
-
-    print(f"\nPDF 생성 중: {output_file}")
-
-    # PDF 캔버스 생성 (가로 방향 A4)
-    pdf_width, pdf_height = landscape(A4)
-    c = canvas.Canvas(output_file, pagesize=landscape(A4))
-
-    for idx, img in enumerate(screenshots):
-        print(f"페이지 {idx + 1}/{len(screenshots)} 추가 중...")
+        async for slide_num, screenshot_bytes in engine.capture(
+                indices,
+                cache=cache,
+                ahead=ahead,
+                clip={'x': 0, 'y': 0, 'width': 1920, 'height': 1080}):
+            print(f"슬라이드 {slide_num + 1}/{len(manifest)} 캡처 완료: {manifest[slide_num].title}")
+            yield slide_num, total_slides, screenshot_bytes
 
-        # 이미지를 PDF 크기에 맞게 조정
-        img_width, img_height = img.size
-        aspect = img_width / img_height
-
-        # PDF 페이지에 맞게 크기 계산
-        if aspect > pdf_width / pdf_height:
-            # 너비 기준
-            new_width = pdf_width
-            new_height = pdf_width / aspect
-        else:
-            # 높이 기준
-            new_height = pdf_height
-            new_width = pdf_height * aspect
-
-        # 중앙 정렬을 위한 오프셋 계산
-        x_offset = (pdf_width - new_width) / 2
-        y_offset = (pdf_height - new_height) / 2
-
-        # 이미지를 메모리 스트림으로 저장
-        img_buffer = io.BytesIO()
-        img.save(img_buffer, format='PNG')
-        img_buffer.seek(0)
-
-        # PDF에 이미지 그리기
-        c.drawImage(ImageReader(img_buffer),
-                   x_offset, y_offset,
-                   width=new_width, height=new_height)
-
-        # 페이지 번호 추가
-        c.setFont("Helvetica", 10)
-        c.drawString(pdf_width - 50, 20, f"{idx + 1}/{len(screenshots)}")
-
-        # 다음 페이지로 (마지막 페이지가 아닌 경우)
-        if idx < len(screenshots) - 1:
-            c.showPage()
-
-    # PDF 저장
-    c.save()
-
-    print(f"\nPDF created successfully: {output_file}")
-    print(f"   File size: {os.path.getsize(output_file) / 1024 / 1024:.2f} MB")
-
-    return output_file
+        print(engine.metrics.summary())
+        if cache:
+            print(cache.summary())
 
 async def main():
     """메인 실행 함수"""
+    frame_dir = tempfile.mkdtemp(prefix='slides_')
     try:
-        # 1. 슬라이드 캡처
+        # 1. 슬라이드 캡처와 동시에 PDF 생성 (캡처된 페이지를 바로 기록)
         print("Starting presentation capture...")
-        screenshots = await capture_slides()
-
-        # 2. PDF 생성
         output_file = 'FamilyPlanning_Presentation.pdf'
-        create_pdf(screenshots, output_file)
+        frames = []
+
+        # 축소/인코딩은 워커 프로세스에서, PDF 기록은 기록 스레드에서 순서대로
+        with StreamingAssembler(output_file, dpi=TARGET_DPI, executor='process') as pdf:
+            def write(item):
+                slide_num, total, png = item
+                pdf.total = total
+                pdf.add_frame(png)
+
+                # 개별 이미지는 메모리 대신 임시 폴더에 보관
+                img_file = os.path.join(frame_dir, f'slide_{slide_num+1:02d}.png')
+                with open(img_file, 'wb') as f:
+                    f.write(png)
+                frames.append(img_file)
 
-        # 3. 개별 슬라이드 이미지도 저장 (선택사항)
+            # 다음 슬라이드를 렌더링하는 동안 이전 페이지를 기록 (큐가 차면 캡처가 대기)
+            await stream_frames(capture_slides(), write)
+
+        print(f"\nPDF created successfully: {output_file}")
+        print(f"   File size: {os.path.getsize(output_file) / 1024 / 1024:.2f} MB")
+
+        # 2. 개별 슬라이드 이미지도 저장 (선택사항)
         save_individual = input("\nSave individual slide images? (y/n): ")
         if save_individual.lower() == 'y':
             os.makedirs('slides', exist_ok=True)
-            for idx, img in enumerate(screenshots):
-                img_file = f'slides/slide_{idx+1:02d}.png'
-                img.save(img_file)
+            for frame in frames:
+                img_file = os.path.join('slides', os.path.basename(frame))
+                shutil.move(frame, img_file)
                 print(f"   Saved: {img_file}")
 
         print("\nAll tasks completed successfully!")
@@ -141,14 +90,19 @@ async def main():
         print(f"\nError occurred: {str(e)}")
         import traceback
         traceback.print_exc()
+    finally:
+        shutil.rmtree(frame_dir, ignore_errors=True)
 
 if __name__ == "__main__":
-    # Playwright 설치 확인
-    try:
-        import playwright
-        asyncio.run(main())
-    except ImportError:
+    # Playwright 설치 확인 (import 없이 확인)
+    from slide_export.deps import available
+
+    if available('playwright'):
+        # SLIDE_EXPORT_TRACE=<path>이면 단계별 구간 기록
+        with tracing():
+            asyncio.run(main())
+    else:
         print("playwright가 설치되어 있지 않습니다.")
         print("다음 명령어로 설치해주세요:")
         print("  pip install playwright")
-        print("  playwright install chromium")
\ No newline at end of file
+        print("  playwright install chromium")
@@ -4,13 +4,31 @@ Creates a proper PDF document with each slide as a full page
 """
 
 import asyncio
-from playwright.async_api import async_playwright
 import os
-import PyPDF2
-from PyPDF2 import PdfReader, PdfWriter
-
-async def capture_slides_as_pdf():
-    """Capture each slide as a PDF page using Playwright"""
+import tempfile
+
+from slide_export import SlideManifest, show_slide, wait_for_settle
+from slide_export.charts import inline_svgs, load_visualizations
+from slide_export.deps import install_hint, missing
+from slide_export.incremental import merge_incremental
+from slide_export.merge import merge_pdf_buffers
+from slide_export.printhtml import get_layout, load_citations, slide_records
+from slide_export.store import PageStore
+from slide_export.trace import tracing
+from slide_export.vector import export_vector_pdf
+
+async def capture_slides_as_pdf(store_path=None):
+    """Capture each slide as a PDF page using Playwright
+
+    The per-slide PDFs are packed into a memory-mapped PageStore on disk
+    rather than kept in a list, so long decks do not grow the process.
+    Without `store_path` the store goes into a new temporary directory, so
+    concurrent runs never share (or overwrite) each other's pages.
+    """
+    from playwright.async_api import async_playwright
+
+    if store_path is None:
+        store_path = os.path.join(tempfile.mkdtemp(prefix='slide_pages-'), 'slide_pages.bin')
 
     async with async_playwright() as p:
         # Launch browser
@@ -32,28 +50,21 @@ async def capture_slides_as_pdf():
         await page.goto(file_path, wait_until='networkidle')
 
         # Wait for initial load
-        await asyncio.sleep(2)
+        await wait_for_settle(page)
 
-        # PDF pages list
-        pdf_files = []
+        # Per-slide PDFs, packed into one mapped file
+        pdf_files = PageStore(store_path, create=True)
 
-        # Total slides
-        total_slides = 12
+        # Total slides (enumerated from the DOM)
+        total_slides = len(await SlideManifest.from_page(page))
 
         print(f"\nGenerating PDF with {total_slides} slides...")
 
         for i in range(total_slides):
             print(f"Processing slide {i+1}/{total_slides}...")
 
-            # Navigate to slide
-            await page.evaluate(f'''
-                if (typeof showSlide === 'function') {{
-                    showSlide({i});
-                }}
-            ''')
-
-            # Wait for animation
-            await asyncio.sleep(0.5)
+            # Navigate to slide and wait for animations/charts to settle
+            await show_slide(page, i)
 
             # Hide navigation controls for clean PDF
             await page.evaluate('''
@@ -79,11 +90,9 @@ async def capture_slides_as_pdf():
                 prefer_css_page_size=False
             )
 
-            # Save individual PDF
-            temp_pdf = f"temp_slide_{i+1:02d}.pdf"
-            with open(temp_pdf, 'wb') as f:
-                f.write(pdf_bytes)
-            pdf_files.append(temp_pdf)
+            # Store the slide PDF for the merge step
+            pdf_files.append(pdf_bytes, key=f'slide-{i+1}')
+            del pdf_bytes
 
             # Restore navigation for next slide
             await page.evaluate('''
@@ -95,37 +104,37 @@ async def capture_slides_as_pdf():
 
         await browser.close()
 
+        pdf_files.close()
         return pdf_files
 
-def merge_pdfs(pdf_files, output_filename='FamilyPlanning_NativePresentation.pdf'):
-    """Merge individual PDF files into one"""
+def merge_pdfs(pdf_files, output_filename='FamilyPlanning_NativePresentation.pdf', incremental=True):
+    """Merge individual slide PDFs (bytes, file paths or a PageStore) into one
 
-    print(f"\nMerging {len(pdf_files)} PDF files...")
+    With `incremental`, only slides that changed since the last run are
+    appended to the existing output (see slide_export.incremental).
+    """
 
-    pdf_writer = PdfWriter()
+    print(f"\nMerging {len(pdf_files)} PDF files...")
 
-    for pdf_file in pdf_files:
-        if os.path.exists(pdf_file):
-            pdf_reader = PdfReader(pdf_file)
-            for page in pdf_reader.pages:
-                pdf_writer.add_page(page)
+    if incremental:
+        stats = merge_incremental(
+            ((f'slide-{i + 1}', pdf) for i, pdf in enumerate(pdf_files)), output_filename)
+        print(f"Merged PDF {stats['mode']}: {output_filename} "
+              f"({stats['rewritten']}/{len(pdf_files)} slides written)")
+        return output_filename
 
-    # Write the merged PDF
-    with open(output_filename, 'wb') as output_file:
-        pdf_writer.write(output_file)
+    # Identical fonts/images are stored once and shared across pages
+    stats = merge_pdf_buffers(pdf_files, output_filename)
 
     print(f"Merged PDF created: {output_filename}")
-
-    # Clean up temporary files
-    for pdf_file in pdf_files:
-        if os.path.exists(pdf_file):
-            os.remove(pdf_file)
-            print(f"Cleaned up: {pdf_file}")
+    print(f"Shared {stats['duplicates']} duplicate objects "
+          f"({stats['bytes_saved'] / 1024:.1f} KB of streams)")
 
     return output_filename
 
 async def create_single_pdf_document():
     """Create a single PDF document with all slides"""
+    from playwright.async_api import async_playwright
 
     async with async_playwright() as p:
         browser = await p.chromium.launch(
@@ -138,75 +147,9 @@ async def create_single_pdf_document():
             device_scale_factor=1.0
         )
 
-        # Create a comprehensive HTML with all slides
-        html_content = '''<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>가족계획: 미완의 과제</title>
-    <style>
-        @page {
-            size: A4 landscape;
-            margin: 0;
-        }
-
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            margin: 0;
-            padding: 0;
-            font-family: 'Malgun Gothic', 'Apple SD Gothic Neo', 'Segoe UI', sans-serif;
-            background: white;
-        }
-
-        .pdf-page {
-            width: 297mm;
-            height: 210mm;
-            page-break-after: always;
-            page-break-inside: avoid;
-            position: relative;
-            overflow: hidden;
-            background: white;
-        }
-
-        .pdf-page:last-child {
-            page-break-after: auto;
-        }
-
-        .slide-frame {
-            width: 100%;
-            height: 100%;
-            border: none;
-            display: block;
-        }
-    </style>
-</head>
-<body>
-'''
-
-        # Add placeholder divs for slides
-        for i in range(12):
-            html_content += f'''
-    <div class="pdf-page" id="slide-{i+1}">
-        <div style="width: 100%; height: 100%; display: flex; align-items: center; justify-content: center; font-size: 24pt;">
-            Slide {i+1} Content
-        </div>
-    </div>
-'''
-
-        html_content += '''
-</body>
-</html>'''
-
-        # Save temporary HTML
-        temp_html = 'temp_full_presentation.html'
-        with open(temp_html, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Print document from the slide records (A4 layout, one write)
+        temp_html = get_layout('A4').write('temp_full_presentation.html', slide_records(),
+                                           load_citations(), charts=inline_svgs(load_visualizations()))
 
         # Load the HTML
         temp_path = f"file:///{os.path.abspath(temp_html).replace(os.sep, '/')}"
@@ -235,7 +178,18 @@ async def create_single_pdf_document():
 
         return output_file
 
-async def main():
+async def create_vector_pdf(output_file='FamilyPlanning_NativePresentation.pdf', page_size='16:9'):
+    """Print the whole deck to one vector PDF in a single page.pdf() call"""
+
+    print(f"Rendering all slides in print layout ({page_size})...")
+    await export_vector_pdf('index.html', output_file, page_size=page_size)
+
+    print(f"\nCreated vector PDF: {output_file}")
+    print(f"File size: {os.path.getsize(output_file) / 1024 / 1024:.2f} MB")
+
+    return output_file
+
+async def main(per_slide=False):
     """Main function to create native PDF from HTML presentation"""
 
     try:
@@ -243,23 +197,28 @@ async def main():
         print("HTML to Native PDF Converter")
         print("=" * 50)
 
-        # Method 1: Capture and merge individual slides
-        print("\nMethod 1: Capturing individual slides as PDF...")
-        pdf_files = await capture_slides_as_pdf()
+        if not per_slide:
+            # Method 1: Whole deck in one browser print
+            print("\nMethod 1: Printing the whole deck as one vector PDF...")
+            await create_vector_pdf()
+            pdf_files = []
+        else:
+            # Method 2: Capture and merge individual slides
+            print("\nMethod 2: Capturing individual slides as PDF...")
+            pdf_files = await capture_slides_as_pdf()
 
         if pdf_files:
-            # Check if PyPDF2 is installed
-            try:
-                import PyPDF2
+            # Merging parses the slide PDFs with PyPDF2
+            if missing('PyPDF2'):
+                print(f"\nPyPDF2 not installed. Install it with: {install_hint(['PyPDF2'])}")
+                print(f"The slide PDFs are kept in {pdf_files.path}")
+            else:
                 output_file = merge_pdfs(pdf_files)
+                pdf_files.discard()
+                # capture_slides_as_pdf가 만든 임시 디렉터리
+                os.rmdir(os.path.dirname(pdf_files.path))
                 print(f"\nSuccessfully created native PDF: {output_file}")
                 print(f"File size: {os.path.getsize(output_file) / 1024 / 1024:.2f} MB")
-            except ImportError:
-                print("\nPyPDF2 not installed. Installing...")
-                import subprocess
-                import sys
-                subprocess.check_call([sys.executable, "-m", "pip", "install", "PyPDF2"])
-                print("Please run the script again.")
 
         print("\n" + "=" * 50)
         print("PDF generation complete!")
@@ -276,4 +235,7 @@ if __name__ == "__main__":
     if os.name == 'nt':
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
-    asyncio.run(main())
\ No newline at end of file
+    import sys
+    # SLIDE_EXPORT_TRACE=<path>이면 단계별 구간 기록
+    with tracing():
+        asyncio.run(main(per_slide='--per-slide' in sys.argv))
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""
+Shared slide export tooling for the HTML presentation
+Capture, assembly and output helpers used by the export scripts
+
+Names are loaded from their submodules on first access, so importing the
+package (or running `python -m slide_export --help`) does not pull in
+asyncio, process pools or any rendering backend.
+"""
+
+import importlib
+
+_EXPORTS = {
+    'StreamingAssembler': 'assemble', 'assemble_pdf': 'assemble',
+    'CaptureCache': 'cache',
+    'Scene': 'charts', 'render_svg': 'charts',
+    'CaptureEngine': 'capture', 'capture_slides': 'capture', 'file_url': 'capture',
+    'SlideSection': 'htmlparse', 'iter_slides': 'htmlparse',
+    'EmptyDeck': 'manifest', 'SlideInfo': 'manifest', 'SlideManifest': 'manifest',
+    'PrintLayout': 'printhtml', 'get_layout': 'printhtml',
+    'ExportOptions': 'options', 'Pipeline': 'pipeline', 'export': 'pipeline',
+    'SettleMetrics': 'settle', 'SettleResult': 'settle', 'show_slide': 'settle',
+    'deck_navigation': 'settle', 'wait_for_settle': 'settle',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,242 @@
+"""
+Streaming screenshot-to-PDF assembly
+Each captured frame is embedded and written out as soon as it arrives, so the
+assembler holds at most one frame in memory
+"""
+
+import os
+from collections import deque
+
+from .pdfwriter import PdfWriter, helvetica_width, pdf_string
+from .trace import active, call_traced, span
+
+# A4 가로 (포인트 단위)
+A4_LANDSCAPE = (841.89, 595.28)
+# 16:9 전체화면 비율 (297mm x 167mm)
+FULLSCREEN_16X9 = (842, 473)
+PAGE_SIZES = {'A4': A4_LANDSCAPE, '16:9': FULLSCREEN_16X9}
+
+
+def fit_image(img_width, img_height, page_width, page_height):
+    """Scale an image to fit the page, centered; returns (x, y, width, height)"""
+    aspect = img_width / img_height
+    if aspect > page_width / page_height:
+        # 너비 기준
+        new_width = page_width
+        new_height = page_width / aspect
+    else:
+        # 높이 기준
+        new_height = page_height
+        new_width = page_height * aspect
+    return ((page_width - new_width) / 2, (page_height - new_height) / 2,
+            new_width, new_height)
+
+
+class PageNumbers:
+    """Page number overlay drawn in Helvetica
+
+    The default matches the reportlab scripts: "3/12" at 10pt, 50pt from the
+    right edge. `align='right'` right-aligns the label against `margin`.
+    """
+
+    def __init__(self, template='{page}/{total}', size=10, margin=50, baseline=20,
+                 align='left', gray=0.0):
+        self.template = template
+        self.size = size
+        self.margin = margin
+        self.baseline = baseline
+        self.align = align
+        self.gray = gray
+
+    def content(self, page, total, page_width):
+        label = self.template.format(page=page, total=total)
+        x = page_width - self.margin
+        if self.align == 'right':
+            x -= helvetica_width(label, self.size)
+        return (f'{self.gray:g} g BT /F1 {self.size} Tf {x:.2f} {self.baseline} Td '
+                f'{pdf_string(label)} Tj ET\n')
+
+
+def _release(block):
+    block.close()
+    block.unlink()
+
+
+class StreamingAssembler:
+    """Write PNG/JPEG frames to a PDF one page at a time
+
+    Usage:
+        with StreamingAssembler('out.pdf', total=17) as pdf:
+            async for index, png in engine.capture(range(17)):
+                pdf.add_frame(png)
+
+    Frames are embedded without re-encoding unless an `encoder`
+    (encode.AdaptiveEncoder) is given to pick a format per page, or `dpi`
+    asks for frames to be Lanczos-downscaled to that resolution on the page.
+    Either way the per-frame work runs on `workers` threads (or processes with
+    `executor='process'`) while pages are still written one at a time, in order.
+    """
+
+    file_mode = 'wb'
+
+    def __init__(self, output_file, page_size=A4_LANDSCAPE, total=None,
+                 page_numbers=None, encoder=None, dpi=None, workers=None, executor='thread'):
+        if executor not in ('thread', 'process'):
+            raise ValueError(f"Unknown executor '{executor}' (expected 'thread' or 'process')")
+        self.output_file = output_file
+        self.page_width, self.page_height = page_size
+        self.total = total
+        self.page_numbers = PageNumbers() if page_numbers is None else page_numbers
+        self.encoder = encoder
+        self.dpi = dpi
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = executor
+        self.count = 0
+        self._fp = None
+        self._writer = None
+        self._pool = None
+        self._pending = deque()
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def open(self):
+        # 파일 경로 또는 쓰기 가능한 파일 객체(BytesIO 등)
+        if hasattr(self.output_file, 'write'):
+            self._fp = self.output_file
+        else:
+            self._fp = open(self.output_file, self.file_mode)
+        self._writer = self.create_writer(self._fp)
+        if self.workers > 1 and (self.dpi or self.encoder is not None):
+            if self.executor == 'process':
+                from concurrent.futures import ProcessPoolExecutor
+
+                self._pool = ProcessPoolExecutor(self.workers)
+            else:
+                from concurrent.futures import ThreadPoolExecutor
+
+                self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix='assemble')
+
+    def create_writer(self, fp):
+        return PdfWriter(fp)
+
+    @property
+    def _budgeted(self):
+        # 용량 예산은 페이지 순서대로 계산해야 하므로 인코딩을 기록 쪽에서 수행
+        return self.encoder is not None and bool(self.encoder.budget)
+
+    def _prepare_args(self):
+        encoding = self.encoder.settings if self.encoder is not None else None
+        return (self.page_width, self.page_height), self.dpi, encoding, not self._budgeted
+
+    def add_frame(self, data):
+        """Embed one frame (PNG/JPEG bytes or a store.StoredFrame) as the next page"""
+        from .prepare import prepare_frame, prepare_shared, share_frame
+
+        if self._writer is None:
+            self.open()
+        page = self.count + len(self._pending) + 1
+        if self._pool is None:
+            with span('encode', page=page) as s:
+                prepared = prepare_frame(data, *self._prepare_args())
+                s.set(format=prepared[0])
+            self._write_prepared(prepared)
+            return
+        if self.executor == 'process' and isinstance(data, (bytes, bytearray)):
+            # 프레임은 공유 메모리로 전달 (수 MB 바이트열을 피클링하지 않음)
+            block = share_frame(data)
+            task = (prepare_shared, block.name, len(data)) + self._prepare_args()
+        else:
+            # store.StoredFrame은 위치만 전달되고 워커가 파일을 직접 매핑
+            block = None
+            task = (prepare_frame, data) + self._prepare_args()
+        tracer = active()
+        if tracer is not None:
+            # 워커에서 잰 구간을 결과와 함께 돌려받음
+            future = self._pool.submit(call_traced, 'encode', {'page': page}, *task)
+        else:
+            future = self._pool.submit(*task)
+        if block is not None:
+            future.add_done_callback(lambda _, block=block: _release(block))
+        # 미리 준비할 프레임 수를 제한해서 메모리 사용량을 일정하게 유지
+        self._pending.append((future, tracer))
+        self._drain(2 * self.workers)
+
+    def _drain(self, keep=0):
+        while self._pending and (len(self._pending) > keep or self._pending[0][0].done()):
+            future, tracer = self._pending.popleft()
+            prepared = future.result()
+            if tracer is not None:
+                prepared, record = prepared
+                tracer.add(**record)
+            self._write_prepared(prepared)
+
+    def _write_prepared(self, prepared):
+        fmt, image = prepared
+        if self._budgeted:
+            with span('encode', page=self.count + 1, budget=True):
+                image = self.encoder.encode(image)
+        elif self.encoder is not None:
+            self.encoder.record(fmt, image)
+        self.add_image(image)
+
+    def add_image(self, image, ref=None):
+        """Embed an already prepared pdfwriter.ImageStream as the next page
+
+        Returns the page reference; `ref` rewrites an existing page object.
+        """
+        writer = self._writer
+        self.count += 1
+        with span('write', page=self.count, bytes=len(image.data)):
+            return self._write_page(writer, image, ref)
+
+    def _write_page(self, writer, image, ref):
+        x, y, width, height = fit_image(image.width, image.height,
+                                        self.page_width, self.page_height)
+        content = f'q {width:.4f} 0 0 {height:.4f} {x:.4f} {y:.4f} cm /Im0 Do Q\n'
+        resources = {'XObject': {'Im0': writer.add_image(image)}}
+
+        if self.page_numbers:
+            content += self.page_numbers.content(self.count, self.total or '?', self.page_width)
+            resources['Font'] = {'F1': writer.font('Helvetica')}
+
+        return writer.add_page(self.page_width, self.page_height, content.encode('latin-1'),
+                               resources, ref=ref)
+
+    def close(self):
+        if self._writer is None:
+            return
+        try:
+            self._drain()
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=True)
+                self._pool = None
+            self._pending.clear()
+        self._writer.close()
+        if self._fp is not self.output_file:
+            self._fp.close()
+        self._writer = None
+        self._fp = None
+
+
+def assemble_pdf(frames, output_file, page_size=A4_LANDSCAPE, total=None, page_numbers=None,
+                 encoder=None, dpi=None, workers=None, executor='thread'):
+    """Assemble an iterable of frames (bytes or image file paths) into a PDF"""
+    if total is None and hasattr(frames, '__len__'):
+        total = len(frames)
+    if encoder is not None and encoder.total is None:
+        encoder.total = total
+    with StreamingAssembler(output_file, page_size, total=total, page_numbers=page_numbers,
+                            encoder=encoder, dpi=dpi, workers=workers,
+                            executor=executor) as pdf:
+        for frame in frames:
+            if isinstance(frame, (str, os.PathLike)):
+                with open(frame, 'rb') as f:
+                    frame = f.read()
+            pdf.add_frame(frame)
+    return output_file
@@ -0,0 +1,181 @@
+"""
+Batch builds of several decks and formats from one browser
+Every (source, mode, page size) combination becomes a job; the jobs run a few
+at a time on a single shared Chromium, each in its own browser contexts, so a
+nightly build of all deck variants costs one browser start.
+
+    python -m slide_export.batch                                  # every known variant
+    python -m slide_export.batch index.html index2.html --modes raster,vector --page-sizes A4,16:9
+    python -m slide_export.batch --jobs-file nightly.json -o build/
+
+A jobs file is a JSON list of objects with `source` and optionally `mode`,
+`page_size`, `output`, `slides` and `dpi`. Raster jobs of the same deck share
+screenshots through the capture cache when their render settings match.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import sys
+import time
+
+from .manifest import EmptyDeck
+from .pipeline import ExportOptions, Pipeline, default_output
+from .trace import span, track, tracing
+
+# 저장소에 있는 발표자료 변형들 (슬라이드 전환 방식은 settle.DECK_NAVIGATION)
+# slides_final.html(스크롤형, showSlide 없음)과 presentation-refined.html(slides/를
+# fetch로 불러와 HTML에 .slide가 없음)은 슬라이드별로 이동할 수 없어 제외
+VARIANTS = (
+    'index.html',
+    'index2.html',
+    'slides_integrated.html',
+    'integrated-presentation.html',
+    'consolidated-presentation.html',
+)
+MODES = ('raster', 'vector')
+PAGE_SIZES = ('A4', '16:9')
+
+
+class BrowserPool:
+    """One Playwright Chromium shared by every job of a batch
+
+    Usage:
+        async with BrowserPool() as browser:
+            await Pipeline(options, browser=browser).run()
+    """
+
+    def __init__(self, headless=True, launch_args=None):
+        self.headless = headless
+        self.launch_args = launch_args or ['--disable-dev-shm-usage']
+        self._playwright = None
+        self.browser = None
+
+    async def __aenter__(self):
+        from playwright.async_api import async_playwright
+
+        with span('browser launch', shared=True):
+            self._playwright = await async_playwright().start()
+            self.browser = await self._playwright.chromium.launch(
+                headless=self.headless, args=self.launch_args)
+        return self.browser
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self.browser is not None:
+            await self.browser.close()
+            self.browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+def plan_jobs(sources, modes=MODES, page_sizes=PAGE_SIZES, output_dir='.', **options):
+    """ExportOptions for every source x mode x page size"""
+    jobs = []
+    for source, mode, page_size in itertools.product(sources, modes, page_sizes):
+        output = os.path.join(output_dir, default_output(source, mode, page_size))
+        jobs.append(ExportOptions(source, output, page_size=page_size, mode=mode, **options))
+    return jobs
+
+
+def load_jobs(path, output_dir='.', **defaults):
+    """ExportOptions from a JSON jobs file (see module docstring)"""
+    with open(path, encoding='utf-8') as f:
+        entries = json.load(f)
+    jobs = []
+    for entry in entries:
+        settings = dict(defaults, **entry)
+        source = settings.pop('source')
+        settings.setdefault('mode', 'raster')
+        settings.setdefault('page_size', 'A4')
+        output = settings.pop('output', None) or os.path.join(
+            output_dir, default_output(source, settings['mode'], settings['page_size']))
+        jobs.append(ExportOptions(source, output, **settings))
+    return jobs
+
+
+async def run_batch(jobs, concurrency=2, headless=True, log=print):
+    """Run every job on one shared browser, `concurrency` at a time
+
+    A failing job is reported and does not stop the others; a deck without
+    slides is reported as skipped. Returns one result dict per job, in job
+    order.
+    """
+    limit = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(number, options, browser):
+        label = f"{options.source} ({options.mode}, {options.page_size})"
+        async with limit:
+            start = time.perf_counter()
+            result = {'source': options.source, 'mode': options.mode,
+                      'page_size': options.page_size, 'output': options.output}
+            try:
+                os.makedirs(os.path.dirname(options.output) or '.', exist_ok=True)
+                with track(f'job {number}'):
+                    await Pipeline(options, browser=browser).run()
+                result.update(status='ok', bytes=os.path.getsize(options.output))
+                log(f"✓ {label} -> {options.output}")
+            except EmptyDeck as e:
+                result.update(status='skipped', error=str(e))
+                log(f"- {label}: skipped, {e}")
+            except Exception as e:
+                result.update(status='error', error=f'{type(e).__name__}: {e}')
+                log(f"✗ {label}: {result['error']}")
+            result['seconds'] = round(time.perf_counter() - start, 2)
+            return result
+
+    async with BrowserPool(headless=headless) as browser:
+        return await asyncio.gather(*(run(n, options, browser) for n, options in enumerate(jobs, 1)))
+
+
+def _split(value):
+    return [item for item in value.split(',') if item]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m slide_export.batch',
+                                     description='Build several decks and formats with one browser')
+    parser.add_argument('sources', nargs='*',
+                        help='deck HTML files (default: every known variant present on disk)')
+    parser.add_argument('--modes', type=_split, default=list(MODES), help='raster,vector')
+    parser.add_argument('--page-sizes', type=_split, default=list(PAGE_SIZES), help='A4,16:9')
+    parser.add_argument('--jobs-file', help='JSON list of jobs instead of sources x formats')
+    parser.add_argument('-o', '--output-dir', default='.', help='directory for the PDFs')
+    parser.add_argument('-j', '--jobs', type=int, default=2, help='exports running at once')
+    parser.add_argument('--workers', type=int, help='capture pages per raster job')
+    parser.add_argument('--dpi', type=int)
+    parser.add_argument('--no-cache', dest='use_cache', action='store_false')
+    parser.add_argument('--trace', metavar='PATH', help='write spans of the whole batch')
+    parser.add_argument('--report', metavar='PATH', help='write per-job results as JSON')
+    args = parser.parse_args(argv)
+
+    defaults = {'workers': args.workers, 'dpi': args.dpi, 'use_cache': args.use_cache}
+    if args.jobs_file:
+        jobs = load_jobs(args.jobs_file, args.output_dir, **defaults)
+    else:
+        sources = args.sources or [source for source in VARIANTS if os.path.exists(source)]
+        jobs = plan_jobs(sources, args.modes, args.page_sizes, args.output_dir, **defaults)
+    if not jobs:
+        parser.error('nothing to build')
+
+    if os.name == 'nt':
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    print(f"Building {len(jobs)} exports, {args.jobs} at a time on one browser...")
+    start = time.perf_counter()
+    with tracing(args.trace):
+        results = asyncio.run(run_batch(jobs, args.jobs))
+    failed = [result for result in results if result['status'] == 'error']
+    built = sum(result['status'] == 'ok' for result in results)
+    skipped = len(results) - built - len(failed)
+    print(f"{built}/{len(results)} exports built in {time.perf_counter() - start:.1f}s"
+          + (f", {skipped} skipped" if skipped else ''))
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=1, ensure_ascii=False)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,462 @@
+"""
+Export benchmarks
+Runs every backend on fixed synthetic decks and writes JSON results that can
+be diffed between commits:
+
+    python -m slide_export.bench                         # 10/100/1000 slides, all backends
+    python -m slide_export.bench --sizes 10 --backends raster,images
+    python -m slide_export.bench --compare bench-results/a.json bench-results/b.json
+
+Decks are built from the slide fragments in slides/*.html, repeated in order
+until the deck has the requested number of slides. Each (backend, size) case
+runs in a fresh interpreter so peak RSS and import costs are not shared.
+
+Backends:
+    raster      screenshots -> StreamingAssembler (generate_pdf.py, CLI raster mode)
+    vector      one Playwright page.pdf() of the print layout (playwright_pdf_native.py)
+    images      slide images -> AdaptiveEncoder + process pool (create_fullscreen_pdf.py);
+                frames are drawn with Pillow so this one runs without a browser
+    weasyprint  WeasyPrint on the deck with the print stylesheet
+    pdfkit      wkhtmltopdf through pdfkit with the print stylesheet
+"""
+
+import argparse
+import asyncio
+import glob
+import hashlib
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import time
+
+from .deps import install_hint, missing
+from .manifest import VIEWPORT
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+RESULTS_VERSION = 1
+DECK_DIR = '.bench'
+RESULTS_DIR = 'bench-results'
+SIZES = (10, 100, 1000)
+BACKENDS = ('raster', 'vector', 'images', 'weasyprint', 'pdfkit')
+REQUIREMENTS = {
+    'raster': ['playwright'],
+    'vector': ['playwright'],
+    'images': ['PIL'],
+    'weasyprint': ['weasyprint'],
+    'pdfkit': ['pdfkit'],
+}
+
+SLIDE_FRAGMENT = re.compile(r'<div class="slide[ "]')
+ELEMENT_ID = re.compile(r'\bid="([^"]+)"')
+EXCEPTION_LINE = re.compile(r'^[\w.]+(?:Error|Exception)\b')
+
+# 합성 덱의 본문 - index.html의 <head>(스타일, CDN 스크립트)를 그대로 사용
+DECK_BODY = '''<body>
+    <div class="presentation-container">
+        <div class="presentation-viewport">
+%(slides)s
+        </div>
+    </div>
+    <script>
+        const slides = [...document.querySelectorAll('.slide')];
+        const totalSlides = slides.length;
+        let currentSlide = 0;
+        slides[0].classList.add('active');
+        function showSlide(index) {
+            slides.forEach(slide => slide.classList.remove('active'));
+            slides[index].classList.add('active');
+            currentSlide = index;
+        }
+    </script>
+</body>
+</html>
+'''
+
+
+class Stages:
+    """Wall and CPU time per named stage (a stage may be entered many times)"""
+
+    def __init__(self):
+        self.totals = {}
+
+    def add(self, name, wall, cpu):
+        total = self.totals.setdefault(name, {'wall': 0.0, 'cpu': 0.0})
+        total['wall'] += wall
+        total['cpu'] += cpu
+
+    def span(self, name):
+        return _Span(self, name)
+
+    def to_dict(self):
+        return {name: {key: round(value, 4) for key, value in total.items()}
+                for name, total in self.totals.items()}
+
+
+class _Span:
+    def __init__(self, stages, name):
+        self.stages = stages
+        self.name = name
+
+    def __enter__(self):
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stages.add(self.name, time.perf_counter() - self.wall, time.process_time() - self.cpu)
+
+
+def load_templates(directory='slides'):
+    """[(name, html)] of the single-slide fragments in `directory`, in file order"""
+    templates = []
+    for path in sorted(glob.glob(os.path.join(directory, '*.html'))):
+        with open(path, encoding='utf-8') as f:
+            html = f.read()
+        # 개요/패널 페이지 같은 완전한 HTML 문서는 제외
+        if '<body' in html or not SLIDE_FRAGMENT.search(html):
+            continue
+        templates.append((os.path.basename(path), html))
+    return templates
+
+
+def build_deck(count, directory=DECK_DIR, templates=None, shell='index.html'):
+    """Write a `count`-slide deck built from slide templates; returns its path
+
+    Repeated templates get suffixed element ids. The deck is rebuilt only when
+    the templates or the shell page change.
+    """
+    templates = templates if templates is not None else load_templates()
+    if not templates:
+        raise ValueError('no slide templates found in slides/')
+    with open(shell, encoding='utf-8') as f:
+        head = f.read().split('</head>', 1)[0]
+    # 상대 경로(css/, js/, data/)는 저장소 루트 기준으로
+    root = 'file:///' + os.path.abspath(os.path.dirname(shell) or '.').replace(os.sep, '/').lstrip('/') + '/'
+    head = head.replace('<head>', f'<head>\n    <base href="{root}">', 1)
+
+    digest = hashlib.sha256(head.encode('utf-8'))
+    for name, html in templates:
+        digest.update(name.encode('utf-8'))
+        digest.update(html.encode('utf-8'))
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f'deck_{count}_{digest.hexdigest()[:12]}.html')
+    if os.path.exists(path):
+        return path
+
+    parts = []
+    for i in range(count):
+        name, html = templates[i % len(templates)]
+        repeat = i // len(templates)
+        if repeat:
+            html = ELEMENT_ID.sub(lambda m: f'id="{m.group(1)}-r{repeat}"', html)
+        parts.append(f'<!-- {i + 1}: {name} -->\n{html}')
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(head + '</head>\n' + DECK_BODY % {'slides': '\n'.join(parts)})
+    os.replace(tmp, path)
+    return path
+
+
+def print_stylesheet(directory=DECK_DIR):
+    """The vector print layout as a stylesheet file for the non-browser backends"""
+    from .vector import PRINT_CSS, SLIDE_HEIGHT, SLIDE_WIDTH
+
+    path = os.path.join(directory, 'print.css')
+    css = f'@page {{ size: {SLIDE_WIDTH}px {SLIDE_HEIGHT}px; }}\n'
+    css += PRINT_CSS % {'width': SLIDE_WIDTH, 'height': SLIDE_HEIGHT}
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(css)
+    return path
+
+
+def draw_frames(count, directory):
+    """Deterministic slide-like PNG frames (title text, bars, gradient) for the images backend"""
+    from PIL import Image, ImageDraw
+
+    os.makedirs(directory, exist_ok=True)
+    templates = load_templates()
+    width, height = VIEWPORT['width'], VIEWPORT['height']
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f'slide_{i + 1:02d}.png')
+        paths.append(path)
+        if os.path.exists(path):
+            continue
+        name, html = templates[i % len(templates)]
+        seed = hashlib.sha256(name.encode('utf-8')).digest()
+        img = Image.new('RGB', (width, height), 'white')
+        draw = ImageDraw.Draw(img)
+        for y in range(0, 160, 4):
+            draw.rectangle([0, y, width, y + 4], fill=(seed[0], seed[1] // 2 + y // 2, 200))
+        draw.text((80, 60), name, fill='white')
+        for j in range(8):
+            bar = 200 + seed[j + 2] * 2
+            draw.rectangle([160 + j * 200, height - 120 - bar, 300 + j * 200, height - 120],
+                           fill=(seed[j + 10], 120, 255 - seed[j + 10]))
+        for line, text in enumerate(re.sub(r'<[^>]+>', ' ', html).split()[:60:6]):
+            draw.text((80, 220 + line * 28), text, fill=(40, 40, 40))
+        img.save(path, 'PNG')
+    return paths
+
+
+# --- backends (run inside the case subprocess) ---
+
+async def run_raster(deck, output, stages):
+    from .pipeline import ExportOptions, Pipeline, RasterCapture
+
+    class TimedCapture(RasterCapture):
+        # 캡처 대기 시간과 조립 시간을 분리해서 측정
+        async def frames(self, source):
+            frames = super().frames(source)
+            while True:
+                with stages.span('capture'):
+                    try:
+                        frame = await frames.__anext__()
+                    except StopAsyncIteration:
+                        return
+                yield frame
+
+    options = ExportOptions(deck, output, use_cache=False)
+    pipeline = Pipeline(options, capture=TimedCapture(options))
+    with stages.span('export'):
+        await pipeline.run()
+
+
+async def run_vector(deck, output, stages):
+    from .vector import export_vector_pdf
+
+    with stages.span('export'):
+        await export_vector_pdf(deck, output, page_size='16:9')
+
+
+def run_images(deck, output, stages, count):
+    from .assemble import FULLSCREEN_16X9, assemble_pdf
+    from .encode import AdaptiveEncoder
+
+    with stages.span('frames'):
+        paths = draw_frames(count, os.path.splitext(deck)[0] + '_frames')
+    with stages.span('assemble'):
+        assemble_pdf(paths, output, FULLSCREEN_16X9, encoder=AdaptiveEncoder(),
+                     executor='process')
+
+
+def run_weasyprint(deck, output, stages):
+    import weasyprint
+
+    with stages.span('parse'):
+        document = weasyprint.HTML(filename=deck).render(
+            stylesheets=[weasyprint.CSS(filename=print_stylesheet())])
+    with stages.span('write'):
+        document.write_pdf(output)
+
+
+def run_pdfkit(deck, output, stages):
+    import pdfkit
+
+    with stages.span('export'):
+        pdfkit.from_file(deck, output, options={
+            'page-width': '508mm', 'page-height': '285.75mm',
+            'margin-top': '0', 'margin-right': '0', 'margin-bottom': '0', 'margin-left': '0',
+            'enable-local-file-access': None, 'user-style-sheet': print_stylesheet(),
+            'quiet': None,
+        })
+
+
+def _max_rss(who):
+    if resource is None:
+        return None
+    rss = resource.getrusage(who).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def _children_cpu():
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def run_case(backend, count, deck, output):
+    """Run one backend in this process; returns its result dict"""
+    from .trace import Tracer
+
+    stages = Stages()
+    wall, cpu = time.perf_counter(), time.process_time()
+    # 단계 안의 세부 구간(launch, settle, encode, write ...)은 trace 스팬으로 집계
+    with Tracer() as tracer:
+        if backend == 'raster':
+            asyncio.run(run_raster(deck, output, stages))
+        elif backend == 'vector':
+            asyncio.run(run_vector(deck, output, stages))
+        elif backend == 'images':
+            run_images(deck, output, stages, count)
+        elif backend == 'weasyprint':
+            run_weasyprint(deck, output, stages)
+        elif backend == 'pdfkit':
+            run_pdfkit(deck, output, stages)
+        else:
+            raise ValueError(f"Unknown backend '{backend}'")
+    children = _children_cpu()
+    return {
+        'backend': backend,
+        'slides': count,
+        'status': 'ok',
+        'wall': round(time.perf_counter() - wall, 4),
+        'cpu': round(time.process_time() - cpu, 4),
+        'cpu_children': None if children is None else round(children, 4),
+        'peak_rss': _max_rss(resource.RUSAGE_SELF) if resource else None,
+        'peak_rss_children': _max_rss(resource.RUSAGE_CHILDREN) if resource else None,
+        'output_bytes': os.path.getsize(output),
+        'stages': stages.to_dict(),
+        'spans': tracer.totals(),
+    }
+
+
+def skip_reason(backend):
+    absent = missing(*REQUIREMENTS[backend])
+    if absent:
+        return f'missing {", ".join(absent)} ({install_hint(absent)})'
+    if backend == 'pdfkit' and shutil.which('wkhtmltopdf') is None:
+        return 'wkhtmltopdf not found on PATH'
+    return None
+
+
+def _error_line(output):
+    """The exception line of a traceback (Playwright appends a boxed hint after it)"""
+    lines = [line for line in output.strip().splitlines() if line.strip()]
+    for line in reversed(lines):
+        if EXCEPTION_LINE.match(line):
+            return line[:300]
+    return lines[-1][:300] if lines else 'no output'
+
+
+def spawn_case(backend, count, deck, output, timeout=None):
+    """Run one case in a fresh interpreter; returns its result dict"""
+    result = {'backend': backend, 'slides': count}
+    command = [sys.executable, '-m', 'slide_export.bench', '--case', backend,
+               '--deck', deck, '--case-output', output, '--sizes', str(count)]
+    try:
+        proc = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return dict(result, status='error', reason=f'timed out after {timeout}s')
+    if proc.returncode != 0:
+        return dict(result, status='error', reason=_error_line(proc.stderr or proc.stdout))
+    # 마지막 줄이 결과 JSON (그 전은 백엔드의 진행 출력)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(sizes=SIZES, backends=BACKENDS, timeout=None, log=print):
+    """Run every (backend, size) case; returns the results document"""
+    os.makedirs(DECK_DIR, exist_ok=True)
+    results = []
+    for count in sizes:
+        deck = build_deck(count)
+        for backend in backends:
+            reason = skip_reason(backend)
+            if reason:
+                result = {'backend': backend, 'slides': count, 'status': 'skipped', 'reason': reason}
+            else:
+                output = os.path.join(DECK_DIR, f'{backend}_{count}.pdf')
+                result = spawn_case(backend, count, deck, output, timeout)
+            log(format_result(result))
+            results.append(result)
+    return {
+        'version': RESULTS_VERSION,
+        'meta': {
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+
+def format_result(result):
+    label = f"{result['backend']:>10} {result['slides']:>5}"
+    if result['status'] != 'ok':
+        return f"{label}  {result['status']}: {result.get('reason')}"
+    rss = result['peak_rss']
+    return (f"{label}  {result['wall']:8.2f}s  cpu {result['cpu']:7.2f}s  "
+            f"rss {rss / 1024 / 1024 if rss else 0:7.1f} MB  {result['output_bytes'] / 1024:9.1f} KB")
+
+
+def compare(old, new):
+    """Lines describing wall/RSS/size changes between two results documents"""
+    before = {(r['backend'], r['slides']): r for r in old['results'] if r['status'] == 'ok'}
+    lines = [f"{old['meta'].get('commit')} -> {new['meta'].get('commit')}"]
+    for result in new['results']:
+        key = (result['backend'], result['slides'])
+        if result['status'] != 'ok' or key not in before:
+            continue
+        changes = []
+        for field in ('wall', 'peak_rss', 'output_bytes'):
+            a, b = before[key][field], result[field]
+            if a and b is not None:
+                changes.append(f'{field} {(b - a) / a * 100:+.1f}%')
+        lines.append(f'{key[0]:>10} {key[1]:>5}  ' + '  '.join(changes))
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m slide_export.bench',
+                                     description='Benchmark the PDF export backends')
+    parser.add_argument('--sizes', default=','.join(map(str, SIZES)),
+                        help='comma-separated deck sizes (default: 10,100,1000)')
+    parser.add_argument('--backends', default=','.join(BACKENDS),
+                        help=f"comma-separated backends ({', '.join(BACKENDS)})")
+    parser.add_argument('-o', '--output', help='results JSON (default: bench-results/<commit>.json)')
+    parser.add_argument('--timeout', type=float, help='seconds allowed per case')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help='diff two results files')
+    # 내부용: 하위 프로세스에서 한 케이스 실행
+    parser.add_argument('--case', choices=BACKENDS, help=argparse.SUPPRESS)
+    parser.add_argument('--deck', help=argparse.SUPPRESS)
+    parser.add_argument('--case-output', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(',') if size]
+    if args.case:
+        print(json.dumps(run_case(args.case, sizes[0], args.deck, args.case_output)))
+        return 0
+    if args.compare:
+        documents = []
+        for path in args.compare:
+            with open(path, encoding='utf-8') as f:
+                documents.append(json.load(f))
+        print('\n'.join(compare(*documents)))
+        return 0
+
+    backends = [name for name in args.backends.split(',') if name]
+    unknown = set(backends) - set(BACKENDS)
+    if unknown:
+        parser.error(f"unknown backend(s): {', '.join(sorted(unknown))}")
+    document = run_benchmarks(sizes, backends, args.timeout)
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"{document['meta']['commit'] or time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=1, sort_keys=True)
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,297 @@
+"""
+Offline asset bundler
+Vendors every external script, stylesheet, font and map tile used by a deck
+into a local content-hashed directory, rewrites the references, and serves the
+vendored files to Playwright through request routing so capture never touches
+the network.
+
+Run once on a machine with network access:
+    python -m slide_export.bundle index.html
+    python -m slide_export.bundle --record index.html   # also map tiles
+
+--record loads the deck in Chromium and steps through every slide, storing
+whatever it requests (the OSM/CARTO tiles of the Leaflet maps are only known
+at runtime), so offline captures can serve them from vendor/.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import sys
+import urllib.parse
+import urllib.request
+
+VENDOR_DIR = 'vendor'
+MANIFEST = 'manifest.json'
+
+# HTML 속성과 CSS url()/@import 에서 외부 참조 추출
+HTML_REF = re.compile(r'''(?:src|href)\s*=\s*["'](https?://[^"']+)["']''', re.I)
+CSS_REF = re.compile(r'''url\(\s*["']?([^"')]+)["']?\s*\)|@import\s+["']([^"']+)["']''', re.I)
+# HTML 안의 CSS - <style> 블록과 style="" 속성 (@font-face 웹폰트 등)
+STYLE_BLOCK = re.compile(r'(<style\b[^>]*>)(.*?)(</style>)', re.I | re.S)
+STYLE_ATTR = re.compile(r'''(\bstyle\s*=\s*)(["'])(.*?)\2''', re.I | re.S)
+
+CONTENT_TYPES = {
+    '.css': 'text/css',
+    '.js': 'application/javascript',
+    '.woff': 'font/woff',
+    '.woff2': 'font/woff2',
+    '.ttf': 'font/ttf',
+    '.otf': 'font/otf',
+    '.png': 'image/png',
+    '.svg': 'image/svg+xml',
+}
+
+
+def is_external(url):
+    return url.startswith(('http://', 'https://')) and not is_local(url)
+
+
+def is_local(url):
+    host = urllib.parse.urlsplit(url).hostname or ''
+    return host in ('localhost', '127.0.0.1', '::1')
+
+
+def inline_css(html):
+    """CSS text of every <style> block and style="" attribute in `html`"""
+    for match in STYLE_BLOCK.finditer(html):
+        yield match.group(2)
+    for match in STYLE_ATTR.finditer(html):
+        yield match.group(3)
+
+
+def sub_inline_css(html, replace):
+    """Apply `replace(css)` to every <style> block and style="" attribute in `html`"""
+    html = STYLE_BLOCK.sub(lambda m: m.group(1) + replace(m.group(2)) + m.group(3), html)
+    return STYLE_ATTR.sub(lambda m: m.group(1) + m.group(2) + replace(m.group(3)) + m.group(2), html)
+
+
+def css_urls(css, base_url=''):
+    """Absolute external URLs referenced by url()/@import in `css`"""
+    urls = []
+    for match in CSS_REF.finditer(css):
+        ref = (match.group(1) or match.group(2)).strip()
+        absolute = urllib.parse.urljoin(base_url, ref)
+        if not ref.startswith('data:') and is_external(absolute):
+            urls.append(absolute)
+    return urls
+
+
+def guess_extension(url, content_type=''):
+    path = urllib.parse.urlsplit(url).path
+    ext = os.path.splitext(path)[1].lower()
+    if ext in CONTENT_TYPES:
+        return ext
+    if 'css' in content_type:
+        return '.css'
+    if 'javascript' in content_type:
+        return '.js'
+    return mimetypes.guess_extension(content_type.split(';')[0].strip()) or ext or '.bin'
+
+
+class AssetBundle:
+    """Content-addressed store of vendored assets plus a url -> file manifest
+
+    `record=True` lets the Playwright route handler fetch and store anything
+    it has not seen before (e.g. map tiles); without it unknown external
+    requests are aborted so capture fails fast instead of waiting on the network.
+    """
+
+    def __init__(self, directory=VENDOR_DIR, record=False):
+        self.directory = directory
+        self.record = record
+        self.assets = {}
+        self.dirty = False
+        self.load()
+
+    @property
+    def manifest_path(self):
+        return os.path.join(self.directory, MANIFEST)
+
+    def load(self):
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                self.assets = json.load(f)
+        except FileNotFoundError:
+            self.assets = {}
+        return self
+
+    def save(self):
+        if not self.dirty:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        tmp = self.manifest_path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.assets, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.manifest_path)
+        self.dirty = False
+
+    def path(self, url):
+        """Local file path for a vendored URL, or None"""
+        entry = self.assets.get(url)
+        return os.path.join(self.directory, entry['file']) if entry else None
+
+    def store(self, url, data, content_type=''):
+        """Write `data` under its content hash and record it for `url`"""
+        ext = guess_extension(url, content_type)
+        name = hashlib.sha256(data).hexdigest()[:20] + ext
+        os.makedirs(self.directory, exist_ok=True)
+        target = os.path.join(self.directory, name)
+        if not os.path.exists(target):
+            with open(target, 'wb') as f:
+                f.write(data)
+        self.assets[url] = {
+            'file': name,
+            'content_type': content_type.split(';')[0].strip() or CONTENT_TYPES.get(ext, ''),
+        }
+        self.dirty = True
+        return name
+
+    def fetch(self, url):
+        """Download `url` (and, for stylesheets, everything it references)"""
+        if url in self.assets:
+            return self.assets[url]['file']
+        request = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
+        with urllib.request.urlopen(request, timeout=30) as response:
+            data = response.read()
+            content_type = response.headers.get('Content-Type', '')
+        if guess_extension(url, content_type) == '.css':
+            data = self.vendor_css(data.decode('utf-8'), url).encode('utf-8')
+        print(f"Vendored {url}")
+        return self.store(url, data, content_type)
+
+    def vendor_css(self, css, base_url):
+        """Vendor url()/@import targets of a stylesheet and point them at local files"""
+        def replace(match):
+            ref = match.group(1) or match.group(2)
+            if ref.startswith('data:'):
+                return match.group(0)
+            absolute = urllib.parse.urljoin(base_url, ref.strip())
+            if not is_external(absolute):
+                return match.group(0)
+            name = self.fetch(absolute)
+            # 라우팅으로 원래 CSS URL에서 로드될 때도 찾을 수 있도록 별칭 등록
+            self.assets[urllib.parse.urljoin(base_url, name)] = self.assets[absolute]
+            # 벤더 디렉터리 안의 CSS이므로 같은 폴더 기준 상대 경로
+            return match.group(0).replace(ref, name)
+        return CSS_REF.sub(replace, css)
+
+    def bundle_html(self, html):
+        """Vendor every external src/href and inline-CSS url() in `html`; returns the list of URLs"""
+        urls = set(HTML_REF.findall(html))
+        for css in inline_css(html):
+            urls.update(css_urls(css))
+        urls = sorted(urls)
+        for url in urls:
+            try:
+                self.fetch(url)
+            except OSError as e:
+                print(f"Could not vendor {url}: {e}")
+        self.save()
+        return urls
+
+    def rewrite_html(self, html, html_dir='.'):
+        """Replace vendored URLs in `html` (attributes and inline CSS) with paths relative to `html_dir`"""
+        def relative(url):
+            local = self.path(url)
+            return os.path.relpath(local, html_dir).replace(os.sep, '/') if local else None
+
+        def replace(match):
+            url = match.group(1)
+            rel = relative(url)
+            return match.group(0).replace(url, rel) if rel else match.group(0)
+
+        def replace_css(match):
+            ref = (match.group(1) or match.group(2)).strip()
+            rel = relative(ref)
+            return match.group(0).replace(ref, rel) if rel else match.group(0)
+
+        html = HTML_REF.sub(replace, html)
+        return sub_inline_css(html, lambda css: CSS_REF.sub(replace_css, css))
+
+    async def handle_route(self, route):
+        """Playwright route handler: serve external requests from the bundle"""
+        url = route.request.url
+        if not is_external(url):
+            await route.continue_()
+            return
+
+        local = self.path(url)
+        if local and os.path.exists(local):
+            await route.fulfill(
+                path=local,
+                content_type=self.assets[url].get('content_type') or None,
+                headers={'Access-Control-Allow-Origin': '*'}
+            )
+        elif self.record:
+            response = await route.fetch()
+            body = await response.body()
+            if response.ok:
+                self.store(url, body, response.headers.get('content-type', ''))
+            await route.fulfill(response=response, body=body)
+        else:
+            await route.abort('internetdisconnected')
+
+    async def attach(self, context):
+        """Route every request of a Playwright browser context through the bundle"""
+        await context.route('**/*', self.handle_route)
+
+
+def bundle_file(source, directory=VENDOR_DIR, output=None):
+    """Vendor the assets of `source` and write a rewritten offline copy"""
+    with open(source, encoding='utf-8') as f:
+        html = f.read()
+    bundle = AssetBundle(directory)
+    urls = bundle.bundle_html(html)
+    if output is None:
+        root, ext = os.path.splitext(source)
+        output = f'{root}.offline{ext}'
+    with open(output, 'w', encoding='utf-8') as f:
+        f.write(bundle.rewrite_html(html, os.path.dirname(output) or '.'))
+    print(f"{len(urls)} external references vendored into {directory}/, offline copy: {output}")
+    return output
+
+
+async def record_deck(source, directory=VENDOR_DIR, settle_timeout=10.0):
+    """Load `source`, show every slide and vendor every external request it makes
+
+    Returns the number of newly recorded URLs; the manifest is saved when the
+    engine closes.
+    """
+    from .capture import CaptureEngine
+
+    bundle = AssetBundle(directory, record=True)
+    known = len(bundle.assets)
+    async with CaptureEngine(source, workers=1, assets=bundle, settle_timeout=settle_timeout) as engine:
+        page, = await engine.ensure_pages(1)
+        manifest = await engine.manifest()
+        for index in manifest.indices():
+            await engine.show_slide(page, index)
+    recorded = len(bundle.assets) - known
+    print(f"{source}: {len(manifest)} slides shown, {recorded} requests recorded into {directory}/")
+    return recorded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m slide_export.bundle',
+                                     description='Vendor external assets for offline capture')
+    parser.add_argument('sources', nargs='*', help='HTML files to bundle')
+    parser.add_argument('--record', action='append', default=[], metavar='DECK',
+                        help='load DECK in Chromium and record every request it makes, map tiles included')
+    parser.add_argument('--vendor-dir', default=VENDOR_DIR)
+    args = parser.parse_args(argv)
+    if not args.sources and not args.record:
+        parser.error('give HTML files to bundle and/or --record DECK')
+    for source in args.sources:
+        bundle_file(source, args.vendor_dir)
+    for deck in args.record:
+        asyncio.run(record_deck(deck, args.vendor_dir))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
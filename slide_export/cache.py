@@ -0,0 +1,210 @@
+"""
+Content-addressed capture cache
+Rendered slides are stored on disk under a hash of everything that affects
+their pixels: the slide's source markup, the document's styles and scripts,
+the contents of the local scripts and stylesheets it loads, the stylesheets
+in css/ and the slide's records in data/. Keys are taken from
+the HTML as written, before any script runs, so charts, maps and inline
+styles added by initSlideContent do not change them between requests.
+Unchanged slides are served from the cache instead of being re-rendered.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import re
+from urllib.parse import urldefrag, urljoin, urlparse
+
+CACHE_DIR = '.capture-cache'
+
+# 스크립트 실행 전의 원본 HTML에서 슬라이드와 공통 스타일/스크립트 수집
+# (DOMParser 문서는 스크립트를 실행하지 않음; 원본을 넘기지 않으면 페이지 URL에서 다시 받음)
+# 'active' 클래스는 현재 보이는 슬라이드에만 붙으므로 해시에서 제외
+SOURCE_SCRIPT = '''
+async (source) => {
+    if (source === null) {
+        source = await (await fetch(location.href, { cache: 'no-store' })).text();
+    }
+    const doc = new DOMParser().parseFromString(source, 'text/html');
+    const shared = [...doc.querySelectorAll('style, script, link[rel="stylesheet"]')]
+        .map(el => el.outerHTML).join('\\n');
+    const slides = [...doc.querySelectorAll('.slide')].map(slide => {
+        const clone = slide.cloneNode(true);
+        clone.classList.remove('active');
+        return clone.outerHTML;
+    });
+    // 같은 출처(로컬 파일/개발 서버)의 스크립트와 스타일시트 - 내용은 Python에서 해시
+    const assets = [...doc.querySelectorAll('script[src], link[rel="stylesheet"][href]')]
+        .map(el => new URL(el.getAttribute('src') || el.getAttribute('href'), location.href))
+        .filter(url => url.origin === location.origin)
+        .map(url => url.href);
+    return { shared, slides, assets };
+}
+'''
+
+# 로컬 자산이 불러오는 다른 자산 (ES 모듈 import, CSS @import)
+ASSET_IMPORT = re.compile(r'''(?:\bfrom|\bimport\s*\(?|@import(?:\s+url\()?)\s*["'](\.{1,2}/[^"']+)["']''')
+
+
+def sha256(*parts):
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode('utf-8')
+        digest.update(len(part).to_bytes(8, 'big'))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def stylesheet_digest(css_dir='css'):
+    """Hash of every stylesheet in `css_dir`"""
+    parts = []
+    for path in sorted(glob.glob(os.path.join(css_dir, '**', '*.css'), recursive=True)):
+        with open(path, 'rb') as f:
+            parts.extend([os.path.relpath(path, css_dir), f.read()])
+    return sha256(*parts)
+
+
+def read_asset(url):
+    """Bytes of a local asset URL (file:// or the deck's own server); None if unavailable"""
+    try:
+        if url.startswith('file:'):
+            from urllib.request import url2pathname
+            with open(url2pathname(urlparse(url).path), 'rb') as f:
+                return f.read()
+        from urllib.request import urlopen
+        with urlopen(url, timeout=10) as response:
+            return response.read()
+    except (OSError, ValueError):
+        return None
+
+
+def asset_digest(urls):
+    """Hash of the local scripts/stylesheets in `urls` and everything they import"""
+    parts = []
+    seen = set()
+    pending = list(urls)
+    while pending:
+        url = urldefrag(pending.pop(0))[0]
+        if url in seen:
+            continue
+        seen.add(url)
+        data = read_asset(url)
+        parts.extend([url, data if data is not None else b''])
+        if data:
+            text = data.decode('utf-8', 'replace')
+            pending.extend(urljoin(url, ref) for ref in ASSET_IMPORT.findall(text))
+    return sha256(*parts)
+
+
+def read_source(source):
+    """Text of a local presentation file (path or file:// URL); None for http(s) URLs"""
+    if source.startswith(('http://', 'https://')):
+        return None
+    if source.startswith('file:'):
+        # urllib.request는 http.client/email까지 불러오므로 필요할 때만
+        from urllib.request import url2pathname
+        source = url2pathname(urlparse(source).path)
+    with open(source, encoding='utf-8') as f:
+        return f.read()
+
+
+def load_slide_records(data_dir='data'):
+    """Map slide index -> JSON records (slide plus its visualizations) from data/"""
+    try:
+        with open(os.path.join(data_dir, 'slides.json'), encoding='utf-8') as f:
+            slides = json.load(f).get('slides', [])
+    except FileNotFoundError:
+        return {}
+    try:
+        with open(os.path.join(data_dir, 'visualizations.json'), encoding='utf-8') as f:
+            visualizations = {v['id']: v for v in json.load(f).get('visualizations', [])}
+    except FileNotFoundError:
+        visualizations = {}
+
+    records = {}
+    for slide in slides:
+        index = slide.get('order', 0) - 1
+        if index < 0:
+            continue
+        linked = [visualizations[v] for v in slide.get('visualizations', []) if v in visualizations]
+        records[index] = json.dumps([slide, linked], sort_keys=True, ensure_ascii=False)
+    return records
+
+
+class CaptureCache:
+    """On-disk store of rendered slides keyed by content hash
+
+    Usage:
+        cache = CaptureCache()
+        async for index, png in engine.capture(range(17), cache=cache):
+            ...
+    """
+
+    def __init__(self, directory=CACHE_DIR, css_dir='css', data_dir='data', extension='png'):
+        self.directory = directory
+        self.css_dir = css_dir
+        self.data_dir = data_dir
+        self.extension = extension
+        self.hits = 0
+        self.misses = 0
+        self._static = None
+
+    def static_digest(self):
+        """Digest of the on-disk inputs shared by every slide (css/ and data/)"""
+        if self._static is None:
+            self._static = (stylesheet_digest(self.css_dir), load_slide_records(self.data_dir))
+        return self._static
+
+    def slide_keys(self, dom, params=''):
+        """Cache keys for every slide given the output of SOURCE_SCRIPT
+
+        `params` identifies the render settings (viewport, scale, format...),
+        so the same slide rendered differently gets a different entry.
+        """
+        css, records = self.static_digest()
+        shared = sha256(dom['shared'], asset_digest(dom.get('assets', ())), css, params)
+        return [sha256(shared, html, records.get(index, ''))
+                for index, html in enumerate(dom['slides'])]
+
+    async def page_keys(self, page, params='', source=None):
+        """Cache keys for the slides of the presentation `source` loaded in `page`
+
+        The keys hash the source HTML, never the live DOM: local files are
+        read from disk and URLs are fetched again by the page.
+        """
+        html = read_source(source) if source else None
+        return self.slide_keys(await page.evaluate(SOURCE_SCRIPT, html), params)
+
+    def path(self, key):
+        return os.path.join(self.directory, key[:2], f'{key}.{self.extension}')
+
+    def get(self, key):
+        """Cached bytes for `key`, or None"""
+        try:
+            with open(self.path(key), 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def put(self, key, data):
+        """Store `data` under `key` (atomic rename, safe for concurrent writers)"""
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 프로세스마다 다른 임시 파일 (mkstemp는 0600으로 만들어 umask를 무시함)
+        tmp = f'{path}.{os.getpid()}.tmp'
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def summary(self):
+        return f"Cache: {self.hits} reused, {self.misses} rendered"
@@ -0,0 +1,246 @@
+"""
+Parallel slide capture engine
+Opens a pool of browser pages against the presentation and shards the
+slide indices across them, yielding results back in slide order
+"""
+
+import asyncio
+import json
+import os
+
+from .manifest import VIEWPORT, SlideManifest
+from .settle import SettleMetrics, deck_navigation, show_slide, wait_for_settle
+from .trace import span, track
+
+
+def file_url(path):
+    """Return a file:// URL for a local HTML file (URLs are passed through)"""
+    if path.startswith(('http://', 'https://', 'file:')):
+        return path
+    return f"file:///{os.path.abspath(path).replace(os.sep, '/')}"
+
+
+def default_workers(total):
+    """Number of pages to open for `total` slides (one per core, at most one per slide)"""
+    return max(1, min(os.cpu_count() or 1, total))
+
+
+async def screenshot_slide(page, index, **options):
+    """Default render step: PNG screenshot of the current viewport"""
+    return await page.screenshot(full_page=False, **options)
+
+
+class CaptureEngine:
+    """Pool of Playwright pages that render slides concurrently
+
+    Usage:
+        async with CaptureEngine('index.html', workers=8) as engine:
+            async for index, png in engine.capture():
+                ...
+
+    With `browser` (e.g. from batch.BrowserPool) the engine opens its contexts
+    in that already running browser and leaves it running on close.
+    """
+
+    def __init__(self, source='index.html', workers=None, viewport=None,
+                 device_scale_factor=1, headless=True, settle_timeout=10.0,
+                 launch_args=None, assets=None, data_dir='data', browser=None, navigation=None):
+        self.source = source
+        # settle.NAVIGATION 키 - 덱마다 showSlide 규약이 다름
+        self.navigation = navigation or deck_navigation(source)
+        self.data_dir = data_dir
+        self.workers = workers
+        self.viewport = viewport or dict(VIEWPORT)
+        self.device_scale_factor = device_scale_factor
+        self.headless = headless
+        self.settle_timeout = settle_timeout
+        self.metrics = SettleMetrics()
+        self.launch_args = launch_args or ['--disable-dev-shm-usage']
+        # bundle.AssetBundle: 외부 요청을 로컬 벤더 파일로 제공
+        self.assets = assets
+
+        self._playwright = None
+        self.browser = browser
+        self._owns_browser = browser is None
+        self.pages = []
+        self._manifest = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self):
+        """Launch the browser (pages are opened lazily per capture)"""
+        if not self._owns_browser:
+            return
+        from playwright.async_api import async_playwright
+
+        with span('browser launch'):
+            self._playwright = await async_playwright().start()
+            self.browser = await self._playwright.chromium.launch(
+                headless=self.headless,
+                args=self.launch_args
+            )
+
+    async def close(self):
+        """Close every page context and the browser"""
+        for page in self.pages:
+            await page.context.close()
+        self.pages = []
+        if self.assets is not None:
+            self.assets.save()
+        if self.browser and self._owns_browser:
+            await self.browser.close()
+            self.browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def open_page(self, label=None):
+        """Open one isolated context with the presentation loaded"""
+        with track(label or 'page'), span('page load', source=self.source):
+            context = await self.browser.new_context(
+                viewport=self.viewport,
+                device_scale_factor=self.device_scale_factor
+            )
+            if self.assets is not None:
+                await self.assets.attach(context)
+            page = await context.new_page()
+            await page.goto(file_url(self.source), wait_until='networkidle')
+            await wait_for_settle(page, timeout=self.settle_timeout)
+        return page
+
+    async def ensure_pages(self, count):
+        """Grow the page pool to `count` pages, loading them in parallel"""
+        missing = count - len(self.pages)
+        if missing > 0:
+            first = len(self.pages) + 1
+            opened = await asyncio.gather(*(self.open_page(f'page {first + i}')
+                                            for i in range(missing)))
+            self.pages.extend(opened)
+        return self.pages[:count]
+
+    async def manifest(self):
+        """SlideManifest of the loaded presentation (enumerated once)"""
+        if self._manifest is None:
+            page, = await self.ensure_pages(1)
+            with span('manifest') as s:
+                self._manifest = await SlideManifest.from_page(page, self.data_dir)
+                s.set(slides=len(self._manifest))
+        return self._manifest
+
+    def invalidate_manifest(self):
+        """Forget the manifest after the presentation was reloaded"""
+        self._manifest = None
+
+    async def slide_count(self):
+        """Number of `.slide` elements in the loaded presentation"""
+        return len(await self.manifest())
+
+    async def show_slide(self, page, index):
+        """Switch `page` to slide `index` and wait for it to settle"""
+        return await show_slide(page, index, timeout=self.settle_timeout,
+                                metrics=self.metrics, navigation=self.navigation)
+
+    def render_params(self, render, render_options):
+        """Identifies the render settings for cache keys"""
+        return json.dumps([self.viewport, self.device_scale_factor, self.navigation,
+                           render.__name__, render_options], sort_keys=True, default=str)
+
+    async def capture(self, indices=None, render=screenshot_slide, cache=None, ahead=None,
+                      **render_options):
+        """Render every slide in `indices` and yield (index, result) in order
+
+        Slides are handed out to the page pool through a shared queue, so a
+        slow slide on one page does not hold back the others. Results are
+        yielded as soon as every earlier slide has finished. With a
+        CaptureCache, slides whose content hash is already cached are not
+        rendered at all. `ahead` bounds how many rendered slides may wait for
+        a slow consumer; pages pause instead of rendering further.
+        """
+        if indices is None:
+            indices = (await self.manifest()).indices()
+        indices = list(indices)
+        if not indices:
+            return
+
+        loop = asyncio.get_running_loop()
+        results = {index: loop.create_future() for index in indices}
+        keys = {}
+        queue = asyncio.Queue()
+        rendered = set()
+        permits = None
+
+        if cache is not None:
+            page, = await self.ensure_pages(1)
+            with span('cache keys'):
+                slide_keys = await cache.page_keys(page, self.render_params(render, render_options),
+                                                   self.source)
+            keys = {i: slide_keys[i] for i in indices if i < len(slide_keys)}
+
+        for index in indices:
+            cached = cache.get(keys[index]) if index in keys else None
+            if cached is not None:
+                results[index].set_result(cached)
+            else:
+                queue.put_nowait(index)
+
+        async def worker(number, page):
+            # 작업(task)마다 컨텍스트가 복사되므로 이 페이지의 구간만 이 행에 기록됨
+            with track(f'page {number}'):
+                while True:
+                    if permits is not None:
+                        await permits.acquire()
+                    try:
+                        index = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        if permits is not None:
+                            permits.release()
+                        return
+                    rendered.add(index)
+                    await render_one(page, index)
+
+        async def render_one(page, index):
+            try:
+                await self.show_slide(page, index)
+                with span('capture', slide=index + 1) as s:
+                    result = await render(page, index, **render_options)
+                    if isinstance(result, bytes):
+                        s.set(bytes=len(result))
+                if index in keys and isinstance(result, bytes):
+                    cache.put(keys[index], result)
+                results[index].set_result(result)
+            except Exception as e:
+                results[index].set_exception(e)
+
+        tasks = []
+        if queue.qsize():
+            workers = self.workers or default_workers(queue.qsize())
+            pages = await self.ensure_pages(min(workers, queue.qsize()))
+            if ahead is not None:
+                # 렌더링 중인 슬라이드 + 소비를 기다리는 슬라이드 수 제한 (역압)
+                permits = asyncio.Semaphore(len(pages) + ahead)
+            tasks = [asyncio.create_task(worker(n, page)) for n, page in enumerate(pages, 1)]
+        try:
+            for index in indices:
+                result = await results[index]
+                if permits is not None and index in rendered:
+                    permits.release()
+                yield index, result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for future in results.values():
+                if future.done() and not future.cancelled():
+                    future.exception()
+
+
+async def capture_slides(source='index.html', indices=None, workers=None,
+                         render=screenshot_slide, cache=None, **engine_options):
+    """Capture slides with a temporary engine and return the results in order"""
+    async with CaptureEngine(source, workers=workers, **engine_options) as engine:
+        return [result async for _, result in engine.capture(indices, render=render, cache=cache)]
@@ -0,0 +1,521 @@
+"""
+Browser-free chart rendering
+Draws the charts of data/visualizations.json (timeline, bar/horizontalBar,
+line and choropleth map) without Chromium. Each chart becomes a Scene of
+vector shapes that is written as SVG (inlined in the print HTML for
+WeasyPrint/pdfkit) or drawn on a reportlab canvas, so print exports need no
+browser launch or page settling, and charts can be rendered in worker
+processes.
+
+    python -m slide_export.charts                        # every chart -> charts/<id>.svg
+    python -m slide_export.charts unmet-need-chart --format svg,pdf --locale en
+    python -m slide_export.charts --vendor-geodata        # once, for map charts
+
+The map outline (world GeoJSON) is the one LeafletRenderer loads; it is read
+from the vendor/ bundle or a --geojson file and never fetched while rendering.
+"""
+
+import argparse
+import functools
+import html
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+WIDTH, HEIGHT = 800, 450
+FONT_FAMILY = "'Malgun Gothic', 'Apple SD Gothic Neo', 'Segoe UI', sans-serif"
+# js/utils/constants.js 테마 색상
+PALETTE = ('#2E86AB', '#A23B72', '#F18F01', '#C73E1D', '#592E83')
+TEXT = '#333333'
+AXIS = '#4a5568'
+GRID = '#e2e8f0'
+NO_DATA = '#cccccc'
+WORLD_GEOJSON = 'https://raw.githubusercontent.com/holtzy/D3-graph-gallery/master/DATA/world.geojson'
+CHART_DIR = 'charts'
+
+
+def _text(value, locale='ko'):
+    """Localised string of a {'ko': ..., 'en': ...} field"""
+    if isinstance(value, dict):
+        return value.get(locale) or value.get('en') or next(iter(value.values()), '')
+    return '' if value is None else str(value)
+
+
+def _color(value):
+    """'#rrggbb' or '#rrggbbaa' -> ('#rrggbb', opacity)"""
+    if not value or value == 'none':
+        return None, 0
+    if value.startswith('#') and len(value) == 9:
+        return value[:7], int(value[7:], 16) / 255
+    if value.startswith('#') and len(value) == 4:
+        return '#' + ''.join(c * 2 for c in value[1:]), 1
+    return value, 1
+
+
+def _number(value):
+    return f'{value:g}' if isinstance(value, float) else str(value)
+
+
+def text_width(text, size):
+    """Estimated width of `text` at `size` (Hangul/CJK glyphs are about square)"""
+    return sum(size if ord(c) >= 0x2e80 else size * 0.55 for c in text)
+
+
+def wrap(text, width, size):
+    lines, line = [], ''
+    for word in text.split():
+        candidate = f'{line} {word}' if line else word
+        if line and text_width(candidate, size) > width:
+            lines.append(line)
+            candidate = word
+        line = candidate
+    return lines + [line] if line else lines
+
+
+def nice_ticks(low, high, count=5):
+    """Round axis ticks covering low..high"""
+    if high <= low:
+        high = low + 1
+    raw = (high - low) / count
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw)
+    first, last = math.floor(low / step), math.ceil(high / step)
+    return [round(i * step, 10) for i in range(first, last + 1)]
+
+
+class Scene:
+    """Vector shapes in SVG coordinates (origin top left, text placed at its baseline)
+
+    Shapes are (kind, geometry, style); style keys are fill, stroke, width,
+    opacity, size, anchor ('start', 'middle', 'end') and bold (font-weight in
+    SVG; reportlab has no bold Hangul CID font, so the glyphs get an outline).
+    """
+
+    def __init__(self, width=WIDTH, height=HEIGHT):
+        self.width = width
+        self.height = height
+        self.shapes = []
+
+    def add(self, kind, *geometry, **style):
+        self.shapes.append((kind, geometry, style))
+
+    def to_svg(self):
+        parts = [f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {self.width} {self.height}" '
+                 f'width="{self.width}" height="{self.height}" font-family="{html.escape(FONT_FAMILY)}">']
+        for kind, g, style in self.shapes:
+            attrs = _svg_paint(style, kind)
+            if kind == 'rect':
+                parts.append(f'<rect x="{g[0]:.1f}" y="{g[1]:.1f}" width="{g[2]:.1f}" height="{g[3]:.1f}"{attrs}/>')
+            elif kind == 'line':
+                parts.append(f'<line x1="{g[0]:.1f}" y1="{g[1]:.1f}" x2="{g[2]:.1f}" y2="{g[3]:.1f}"{attrs}/>')
+            elif kind == 'polyline':
+                points = ' '.join(f'{x:.1f},{y:.1f}' for x, y in g[0])
+                parts.append(f'<polyline points="{points}"{attrs}/>')
+            elif kind == 'polygon':
+                path = ''.join('M' + 'L'.join(f'{x:.1f},{y:.1f}' for x, y in ring) + 'Z' for ring in g[0])
+                parts.append(f'<path d="{path}" fill-rule="evenodd"{attrs}/>')
+            elif kind == 'circle':
+                parts.append(f'<circle cx="{g[0]:.1f}" cy="{g[1]:.1f}" r="{g[2]:.1f}"{attrs}/>')
+            elif kind == 'text':
+                weight = ' font-weight="bold"' if style.get('bold') else ''
+                parts.append(f'<text x="{g[0]:.1f}" y="{g[1]:.1f}" font-size="{style.get("size", 12)}" '
+                             f'text-anchor="{style.get("anchor", "start")}"{weight}{attrs}>'
+                             f'{html.escape(g[2])}</text>')
+        parts.append('</svg>')
+        return ''.join(parts)
+
+    def draw(self, canvas, x=0, y=0):
+        """Draw on a reportlab canvas with the scene's bottom left corner at (x, y)"""
+        font = _reportlab_font()
+        top = y + self.height
+        for kind, g, style in self.shapes:
+            canvas.saveState()
+            fill = _set_paint(canvas, style.get('fill', TEXT if kind == 'text' else None),
+                              style.get('opacity', 1), canvas.setFillColor, canvas.setFillAlpha)
+            stroke = _set_paint(canvas, style.get('stroke'), 1, canvas.setStrokeColor, canvas.setStrokeAlpha)
+            canvas.setLineWidth(style.get('width', 1))
+            if kind == 'rect':
+                canvas.rect(x + g[0], top - g[1] - g[3], g[2], g[3], stroke=stroke, fill=fill)
+            elif kind == 'line':
+                canvas.line(x + g[0], top - g[1], x + g[2], top - g[3])
+            elif kind in ('polyline', 'polygon'):
+                rings = g[0] if kind == 'polygon' else [g[0]]
+                path = canvas.beginPath()
+                for ring in rings:
+                    path.moveTo(x + ring[0][0], top - ring[0][1])
+                    for px, py in ring[1:]:
+                        path.lineTo(x + px, top - py)
+                    if kind == 'polygon':
+                        path.close()
+                canvas.drawPath(path, stroke=stroke, fill=fill and kind == 'polygon', fillMode=0)
+            elif kind == 'circle':
+                canvas.circle(x + g[0], top - g[1], g[2], stroke=stroke, fill=fill)
+            elif kind == 'text':
+                size = style.get('size', 12)
+                left = x + g[0]
+                if style.get('anchor') in ('middle', 'end'):
+                    width = canvas.stringWidth(g[2], font, size)
+                    left -= width / 2 if style['anchor'] == 'middle' else width
+                text = canvas.beginText(left, top - g[1])
+                text.setFont(font, size)
+                if style.get('bold'):
+                    # CID 글꼴에는 굵은 서체가 없으므로 글자색 윤곽선을 덧그려 굵게 표시
+                    _set_paint(canvas, style.get('fill', TEXT), style.get('opacity', 1),
+                               canvas.setStrokeColor, canvas.setStrokeAlpha)
+                    canvas.setLineWidth(size * 0.04)
+                    text.setTextRenderMode(2)
+                text.textOut(g[2])
+                canvas.drawText(text)
+            canvas.restoreState()
+
+
+def _svg_paint(style, kind):
+    attrs = []
+    fill, alpha = _color(style.get('fill', TEXT if kind == 'text' else None))
+    attrs.append(f'fill="{fill or "none"}"')
+    opacity = alpha * style.get('opacity', 1)
+    if fill and opacity < 1:
+        attrs.append(f'fill-opacity="{opacity:.2f}"')
+    stroke, alpha = _color(style.get('stroke'))
+    if stroke:
+        attrs.append(f'stroke="{stroke}" stroke-width="{style.get("width", 1)}"')
+        if alpha < 1:
+            attrs.append(f'stroke-opacity="{alpha:.2f}"')
+    return ' ' + ' '.join(attrs)
+
+
+def _set_paint(canvas, value, opacity, set_color, set_alpha):
+    from reportlab.lib.colors import HexColor
+
+    color, alpha = _color(value)
+    if not color:
+        return 0
+    set_color(HexColor(color))
+    if alpha * opacity < 1:
+        set_alpha(alpha * opacity)
+    return 1
+
+
+@functools.lru_cache(maxsize=None)
+def _reportlab_font():
+    """A font with Hangul glyphs (reportlab's built-in CID font, no files needed)"""
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+
+    pdfmetrics.registerFont(UnicodeCIDFont('HYGothic-Medium'))
+    return 'HYGothic-Medium'
+
+
+def draw_timeline(scene, config, locale, **options):
+    events = sorted(config.get('data', []), key=lambda event: event['year'])
+    if not events:
+        return
+    colors = config.get('colors') or PALETTE
+    left, right, axis_y = 110, scene.width - 110, scene.height * 0.55
+    first, last = events[0]['year'], events[-1]['year']
+    span = (last - first) or 1
+    scene.add('line', left - 20, axis_y, right + 20, axis_y, stroke=AXIS, width=3)
+
+    for i, event in enumerate(events):
+        x = left + (event['year'] - first) / span * (right - left)
+        color = colors[i % len(colors)]
+        lines = wrap(_text(event.get('event'), locale), 150, 12)
+        # 이웃한 사건끼리 겹치지 않게 축 위/아래 번갈아 배치
+        above = i % 2 == 0
+        scene.add('line', x, axis_y, x, axis_y + (-26 if above else 26), stroke=color, width=2)
+        scene.add('circle', x, axis_y, 8, fill=color, stroke='#ffffff', width=2)
+        if above:
+            scene.add('text', x, axis_y - 34, str(event['year']), size=16, bold=True, fill=color, anchor='middle')
+            for k, line in enumerate(lines):
+                scene.add('text', x, axis_y - 56 - 15 * (len(lines) - 1 - k), line, size=12, anchor='middle')
+        else:
+            scene.add('text', x, axis_y + 48, str(event['year']), size=16, bold=True, fill=color, anchor='middle')
+            for k, line in enumerate(lines):
+                scene.add('text', x, axis_y + 68 + 15 * k, line, size=12, anchor='middle')
+
+
+def draw_bar(scene, config, locale, **options):
+    data = config.get('data', {})
+    labels = [_text(label, locale) for label in data.get('labels', [])]
+    values = data.get('values', [])
+    if not values:
+        return
+    unit = data.get('unit', '')
+    colors = config.get('colors') or PALETTE
+    horizontal = config.get('chartType') == 'horizontalBar' or config.get('indexAxis') == 'y'
+    ticks = nice_ticks(min(0, min(values)), max(values))
+    low, high = ticks[0], ticks[-1]
+    value_title = _text((config.get('xAxis' if horizontal else 'yAxis') or {}).get('title'), locale)
+    label_title = _text((config.get('yAxis' if horizontal else 'xAxis') or {}).get('title'), locale)
+
+    if horizontal:
+        left = min(max(text_width(label, 13) for label in labels) + 30, scene.width / 3)
+        right, top, bottom = scene.width - 50, 70, scene.height - 60
+        scale = lambda v: left + (v - low) / (high - low) * (right - left)
+        for tick in ticks:
+            scene.add('line', scale(tick), top, scale(tick), bottom, stroke=GRID)
+            scene.add('text', scale(tick), bottom + 18, _number(tick), size=11, fill=AXIS, anchor='middle')
+        band = (bottom - top) / len(values)
+        for i, (label, value) in enumerate(zip(labels, values)):
+            y = top + i * band + band * 0.2
+            start, end = sorted((scale(0), scale(value)))
+            scene.add('rect', start, y, end - start, band * 0.6, fill=colors[i % len(colors)])
+            scene.add('text', left - 10, y + band * 0.3 + 5, label, size=13, anchor='end')
+            scene.add('text', end + 6, y + band * 0.3 + 5, f'{_number(value)}{unit}', size=12, fill=AXIS)
+        scene.add('line', scale(0), top, scale(0), bottom, stroke=AXIS)
+        scene.add('text', (left + right) / 2, scene.height - 14, value_title, size=13, bold=True,
+                  fill=AXIS, anchor='middle')
+        scene.add('text', left - 10, top - 12, label_title, size=13, bold=True, fill=AXIS, anchor='end')
+        return
+
+    left, right, top, bottom = 70, scene.width - 30, 80, scene.height - 70
+    scale = lambda v: bottom - (v - low) / (high - low) * (bottom - top)
+    for tick in ticks:
+        scene.add('line', left, scale(tick), right, scale(tick), stroke=GRID)
+        scene.add('text', left - 8, scale(tick) + 4, _number(tick), size=11, fill=AXIS, anchor='end')
+    band = (right - left) / len(values)
+    for i, (label, value) in enumerate(zip(labels, values)):
+        x = left + i * band + band * 0.2
+        start, end = sorted((scale(0), scale(value)))
+        scene.add('rect', x, start, band * 0.6, end - start, fill=colors[i % len(colors)])
+        scene.add('text', x + band * 0.3, bottom + 18, label, size=12, anchor='middle')
+        scene.add('text', x + band * 0.3, start - 6, f'{_number(value)}{unit}', size=12, fill=AXIS, anchor='middle')
+    scene.add('line', left, scale(0), right, scale(0), stroke=AXIS)
+    scene.add('text', (left + right) / 2, scene.height - 20, label_title, size=13, bold=True,
+              fill=AXIS, anchor='middle')
+    scene.add('text', left, top - 20, value_title, size=13, bold=True, fill=AXIS)
+
+
+def draw_line(scene, config, locale, **options):
+    data = config.get('data', {})
+    labels = [_text(label, locale) for label in data.get('labels', [])]
+    datasets = data.get('datasets', [])
+    values = [value for dataset in datasets for value in dataset.get('data', []) if value is not None]
+    if not labels or not values:
+        return
+    ticks = nice_ticks(min(0, min(values)), max(values))
+    low, high = ticks[0], ticks[-1]
+    left, right, top, bottom = 70, scene.width - 40, 90, scene.height - 70
+    x_at = lambda i: left + (i / (len(labels) - 1) if len(labels) > 1 else 0.5) * (right - left)
+    y_at = lambda v: bottom - (v - low) / (high - low) * (bottom - top)
+
+    for tick in ticks:
+        scene.add('line', left, y_at(tick), right, y_at(tick), stroke=GRID)
+        scene.add('text', left - 8, y_at(tick) + 4, _number(tick), size=11, fill=AXIS, anchor='end')
+    for i, label in enumerate(labels):
+        scene.add('text', x_at(i), bottom + 20, label, size=12, anchor='middle')
+    scene.add('line', left, bottom, right, bottom, stroke=AXIS)
+
+    legend_x = left
+    for n, dataset in enumerate(datasets):
+        color = dataset.get('borderColor') or PALETTE[n % len(PALETTE)]
+        points = [(x_at(i), y_at(v)) for i, v in enumerate(dataset.get('data', [])) if v is not None]
+        if dataset.get('fill') and dataset.get('backgroundColor') and points:
+            area = points + [(points[-1][0], y_at(max(low, 0))), (points[0][0], y_at(max(low, 0)))]
+            scene.add('polygon', [area], fill=dataset['backgroundColor'])
+        scene.add('polyline', points, stroke=color, width=3)
+        for px, py in points:
+            scene.add('circle', px, py, 4, fill=color)
+        label = _text(dataset.get('label'), locale)
+        scene.add('rect', legend_x, 52, 14, 14, fill=color)
+        scene.add('text', legend_x + 20, 64, label, size=12)
+        legend_x += 40 + text_width(label, 12)
+
+    x_title = _text((config.get('xAxis') or {}).get('title'), locale)
+    y_title = _text((config.get('yAxis') or {}).get('title'), locale)
+    scene.add('text', (left + right) / 2, scene.height - 20, x_title, size=13, bold=True, fill=AXIS, anchor='middle')
+    scene.add('text', right, 64, y_title, size=13, bold=True, fill=AXIS, anchor='end')
+
+
+@functools.lru_cache(maxsize=None)
+def load_geodata(path=None):
+    """World country outlines: `path`, or the vendored copy of WORLD_GEOJSON"""
+    if path is None:
+        from .bundle import AssetBundle
+        path = AssetBundle().path(WORLD_GEOJSON)
+        if path is None:
+            raise FileNotFoundError('world GeoJSON is not vendored - run '
+                                    '"python -m slide_export.charts --vendor-geodata" or pass --geojson')
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _rings(geometry):
+    if geometry['type'] == 'Polygon':
+        return geometry['coordinates']
+    if geometry['type'] == 'MultiPolygon':
+        return [ring for polygon in geometry['coordinates'] for ring in polygon]
+    return []
+
+
+def draw_map(scene, config, locale, geodata=None, **options):
+    """Choropleth in equirectangular projection, coloured like LeafletRenderer.getColor"""
+    data = config.get('data', {})
+    values_by_country = dict(zip(data.get('countries', []), data.get('values', [])))
+    known = [value for value in values_by_country.values() if value is not None]
+    low, high = (min(known), max(known)) if known else (0, 1)
+    primary = (config.get('colors') or PALETTE)[0]
+    steps = (0x20, 0x40, 0x60, 0x80, 0xff)
+    geodata = geodata or load_geodata(config.get('geojson'))
+
+    # 위도 84°N ~ 58°S (남극 제외), 가로세로 비율 유지
+    left, top, width, height = 20, 50, scene.width - 40, scene.height - 110
+    scale = min(width / 360, height / 142)
+    left += (width - 360 * scale) / 2
+
+    def project(point):
+        return left + (point[0] + 180) * scale, top + (84 - point[1]) * scale
+
+    for feature in geodata.get('features', []):
+        properties = feature.get('properties') or {}
+        name = properties.get('NAME') or properties.get('name') or properties.get('NAME_EN')
+        value = values_by_country.get(name)
+        rings = []
+        for ring in _rings(feature.get('geometry') or {'type': None}):
+            points = [project(point) for point in ring]
+            # 0.5px 안의 점은 생략 (SVG/PDF 크기)
+            kept = points[:1]
+            for point in points[1:]:
+                if abs(point[0] - kept[-1][0]) + abs(point[1] - kept[-1][1]) >= 0.5:
+                    kept.append(point)
+            if len(kept) >= 3:
+                rings.append(kept)
+        if not rings:
+            continue
+        if value is None:
+            scene.add('polygon', rings, fill=NO_DATA, opacity=0.1, stroke='#666666', width=0.3)
+        else:
+            normalized = (value - low) / (high - low) if high > low else 1
+            step = steps[min(int(normalized * (len(steps) - 1)), len(steps) - 1)]
+            scene.add('polygon', rings, fill=primary, opacity=step / 255 * 0.7, stroke='#666666', width=0.3)
+
+    unit = data.get('unit', '')
+    for i, step in enumerate(steps):
+        value = low + (high - low) * i / (len(steps) - 1)
+        scene.add('rect', 30 + i * 90, scene.height - 40, 20, 14, fill=primary, opacity=step / 255 * 0.7)
+        scene.add('text', 56 + i * 90, scene.height - 29, f'{_number(round(value, 1))}{unit}', size=11, fill=AXIS)
+
+
+# config.chartType (또는 visualization type) -> 렌더러, JS registerRenderer와 같은 구성
+RENDERERS = {
+    'timeline': draw_timeline,
+    'bar': draw_bar,
+    'horizontalBar': draw_bar,
+    'line': draw_line,
+    'choropleth': draw_map,
+    'map': draw_map,
+}
+
+
+def load_visualizations(data_dir='data'):
+    """Visualization id -> record from data/visualizations.json ({} if missing)"""
+    try:
+        with open(os.path.join(data_dir, 'visualizations.json'), encoding='utf-8') as f:
+            return {v['id']: v for v in json.load(f).get('visualizations', [])}
+    except FileNotFoundError:
+        return {}
+
+
+def build_scene(visualization, locale='ko', width=WIDTH, height=HEIGHT, **options):
+    """Scene for one visualizations.json record"""
+    config = visualization.get('config', {})
+    draw = RENDERERS.get(config.get('chartType')) or RENDERERS.get(visualization.get('type'))
+    if draw is None:
+        raise ValueError(f"no renderer for chart type {config.get('chartType') or visualization.get('type')!r}")
+    scene = Scene(width, height)
+    title = _text(visualization.get('title'), locale)
+    if title:
+        scene.add('text', width / 2, 32, title, size=20, bold=True, anchor='middle')
+    draw(scene, config, locale, **options)
+    return scene
+
+
+def render_svg(visualization, locale='ko', **options):
+    return build_scene(visualization, locale, **options).to_svg()
+
+
+def render_pdf(visualizations, path, locale='ko', **options):
+    """One vector PDF page per chart (reportlab)"""
+    from reportlab.pdfgen import canvas as pdfcanvas
+
+    pdf = pdfcanvas.Canvas(path, pagesize=(WIDTH, HEIGHT))
+    for visualization in visualizations:
+        build_scene(visualization, locale, **options).draw(pdf)
+        pdf.showPage()
+    pdf.save()
+    return path
+
+
+def inline_svgs(visualizations, locale='ko', log=print):
+    """Visualization id -> SVG markup for print HTML; charts that cannot be drawn are skipped"""
+    svgs = {}
+    for chart_id, visualization in visualizations.items():
+        try:
+            svgs[chart_id] = render_svg(visualization, locale)
+        except (ValueError, OSError) as e:
+            if log:
+                log(f"Chart {chart_id} left out: {e}")
+    return svgs
+
+
+def _render_files(job):
+    visualization, output_dir, formats, locale, geojson = job
+    options = {'geodata': load_geodata(geojson)} if geojson else {}
+    base = os.path.join(output_dir, visualization['id'])
+    paths = []
+    if 'svg' in formats:
+        with open(base + '.svg', 'w', encoding='utf-8') as f:
+            f.write(render_svg(visualization, locale, **options))
+        paths.append(base + '.svg')
+    if 'pdf' in formats:
+        paths.append(render_pdf([visualization], base + '.pdf', locale, **options))
+    return paths
+
+
+def render_all(visualizations, output_dir=CHART_DIR, formats=('svg',), locale='ko',
+               processes=None, geojson=None):
+    """Write every chart to output_dir/<id>.<format>, charts spread over worker processes"""
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = [(visualization, output_dir, tuple(formats), locale, geojson) for visualization in visualizations]
+    processes = min(processes or os.cpu_count() or 1, len(jobs))
+    if processes <= 1:
+        return [path for job in jobs for path in _render_files(job)]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return [path for paths in pool.map(_render_files, jobs) for path in paths]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m slide_export.charts',
+                                     description='Render data/visualizations.json charts without a browser')
+    parser.add_argument('ids', nargs='*', help='visualization ids (default: all)')
+    parser.add_argument('-o', '--output-dir', default=CHART_DIR)
+    parser.add_argument('--format', type=lambda value: value.split(','), default=['svg'], help='svg,pdf')
+    parser.add_argument('--locale', default='ko', choices=['ko', 'en'])
+    parser.add_argument('--data-dir', default='data')
+    parser.add_argument('--geojson', help='world GeoJSON for map charts (default: vendored copy)')
+    parser.add_argument('--vendor-geodata', action='store_true', help='download the world GeoJSON into vendor/')
+    parser.add_argument('-j', '--processes', type=int, help='worker processes (default: CPU count)')
+    args = parser.parse_args(argv)
+
+    if args.vendor_geodata:
+        from .bundle import AssetBundle
+        bundle = AssetBundle()
+        bundle.fetch(WORLD_GEOJSON)
+        bundle.save()
+        return 0
+
+    visualizations = load_visualizations(args.data_dir)
+    unknown = [chart_id for chart_id in args.ids if chart_id not in visualizations]
+    if unknown:
+        parser.error(f"unknown visualization: {', '.join(unknown)}")
+    selected = [visualizations[chart_id] for chart_id in args.ids or visualizations]
+    paths = render_all(selected, args.output_dir, args.format, args.locale, args.processes, args.geojson)
+    for path in paths:
+        print(path)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
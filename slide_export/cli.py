@@ -0,0 +1,133 @@
+"""
+Unified slide export command line
+    python -m slide_export index.html -o deck.pdf --page-size 16:9 --mode vector
+    python -m slide_export index.html --slides 1-5,9 --dpi 150 --offline
+    python -m slide_export index.html --dry-run
+    python -m slide_export index.html --trace export.trace.json
+
+Only argparse, the page size table and the export options are loaded up
+front (enough for --dry-run); the pipeline and its backends are imported once
+an export actually runs.
+"""
+
+import argparse
+import os
+import time
+
+from .assemble import PAGE_SIZES
+
+
+def parse_slides(spec):
+    """'1-3,7' -> [1, 2, 3, 7] (1-based slide numbers)"""
+    slides = []
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            start, end = part.split('-', 1)
+            slides.extend(range(int(start), int(end) + 1))
+        else:
+            slides.append(int(part))
+    if not slides or min(slides) < 1:
+        raise argparse.ArgumentTypeError(f"invalid slide selection '{spec}'")
+    return slides
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m slide_export',
+                                     description='Export an HTML slide deck to PDF')
+    parser.add_argument('source', nargs='?', default='index.html', help='deck HTML file or URL')
+    parser.add_argument('-o', '--output', help='output PDF (default: <source>_<mode>_<size>.pdf)')
+    parser.add_argument('--page-size', choices=sorted(PAGE_SIZES), default='A4')
+    parser.add_argument('--mode', choices=('raster', 'vector'), default='raster',
+                        help='raster screenshots or one vector print (default: raster)')
+    parser.add_argument('--dpi', type=int,
+                        help='target raster resolution on the page; larger frames are downscaled')
+    parser.add_argument('--workers', type=int, help='parallel browser pages (default: CPU count)')
+    parser.add_argument('--slides', type=parse_slides, help="slide numbers, e.g. '1-5,9'")
+    parser.add_argument('--format', dest='screenshot_format', choices=('png', 'jpeg'), default='png',
+                        help='raster frame encoding')
+    parser.add_argument('--quality', type=int, default=90, help='JPEG quality')
+    parser.add_argument('--compress', dest='compression', choices=('auto', 'lossless', 'jpeg'),
+                        help='re-encode each page: auto picks palette PNG, Flate or JPEG per frame')
+    parser.add_argument('--budget', type=float, metavar='MB',
+                        help='target size of all page images in megabytes (implies --compress auto)')
+    parser.add_argument('--encode-workers', type=int,
+                        help='threads/processes preparing pages (default: CPU count)')
+    parser.add_argument('--processes', dest='executor', action='store_const', const='process',
+                        default='thread', help='prepare pages in worker processes')
+    parser.add_argument('--queue-depth', type=int, default=4,
+                        help='captured frames that may wait for the PDF writer (default: 4)')
+    parser.add_argument('--no-cache', dest='use_cache', action='store_false',
+                        help='ignore the capture cache')
+    parser.add_argument('--no-page-numbers', dest='page_numbers', action='store_false')
+    parser.add_argument('--offline', action='store_true',
+                        help='serve external assets from vendor/ (see slide_export.bundle; --record for map tiles)')
+    parser.add_argument('--trace', metavar='PATH',
+                        help='write per-stage spans: *.jsonl as JSON lines, otherwise Chrome '
+                             'trace format (default: $SLIDE_EXPORT_TRACE)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='print the export plan and missing dependencies without exporting')
+    return parser
+
+
+def requirements(options):
+    """Modules the export described by `options` imports"""
+    if options.mode == 'vector':
+        return ['playwright']
+    modules = ['playwright']
+    if options.dpi or options.compression or options.budget:
+        modules.append('PIL')
+    return modules
+
+
+def dry_run(options):
+    from .deps import install_hint, missing
+
+    slides = ', '.join(map(str, options.slides)) if options.slides else 'all'
+    print(f"source:    {options.source}")
+    print(f"output:    {options.output}")
+    print(f"mode:      {options.mode} ({options.page_size})")
+    print(f"slides:    {slides}")
+    if options.mode == 'raster':
+        print(f"dpi:       {options.dpi or 'capture size'} (scale {options.device_scale_factor})")
+        print(f"encoding:  {options.compression or options.screenshot_format}"
+              + (f", budget {options.budget} bytes" if options.budget else ''))
+        print(f"workers:   {options.workers or 'auto'} capture, "
+              f"{options.encode_workers or 'auto'} {options.executor} encode")
+    absent = missing(*requirements(options))
+    if absent:
+        print(f"missing:   {', '.join(absent)} ({install_hint(absent)})")
+        return 1
+    return 0
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    from .options import ExportOptions
+
+    if args.budget:
+        args.budget = int(args.budget * 1024 * 1024)
+    dry = args.__dict__.pop('dry_run')
+    trace_path = args.__dict__.pop('trace')
+    options = ExportOptions(**vars(args))
+    if dry:
+        return dry_run(options)
+
+    import asyncio
+
+    from .pipeline import Pipeline
+    from .trace import tracing
+
+    pipeline = Pipeline(options)
+    if os.name == 'nt':
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+    start = time.perf_counter()
+    print(f"Exporting {options.source} ({options.mode}, {options.page_size})...")
+    with tracing(trace_path):
+        asyncio.run(pipeline.run())
+    print(f"✓ {pipeline.sink.describe()} in {time.perf_counter() - start:.1f}s")
+    return 0
@@ -0,0 +1,54 @@
+"""
+Optional dependency checks
+Backends (playwright, Pillow, PyPDF2, pdfkit, ...) are imported only by the
+code path that uses them. Whether they are installed is answered with
+importlib's find_spec, which locates a package without importing it, and the
+answer is memoised per process; nothing is pip-installed at runtime.
+"""
+
+import functools
+import importlib.util
+
+# 모듈 이름 -> pip 패키지 이름 (설치 안내용)
+PACKAGES = {
+    'PIL': 'Pillow',
+    'PyPDF2': 'PyPDF2',
+    'aiohttp': 'aiohttp',
+    'lxml': 'lxml',
+    'pdfkit': 'pdfkit',
+    'playwright': 'playwright',
+    'reportlab': 'reportlab',
+    'weasyprint': 'weasyprint',
+}
+
+
+class MissingDependency(ImportError):
+    """Raised by require() with the pip command that installs what is missing"""
+
+    def __init__(self, modules):
+        self.modules = list(modules)
+        super().__init__(f"missing {', '.join(self.modules)} - install with: {install_hint(self.modules)}")
+
+
+@functools.lru_cache(maxsize=None)
+def available(module):
+    """True if `module` can be imported (checked without importing it)"""
+    try:
+        return importlib.util.find_spec(module) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def missing(*modules):
+    return [module for module in modules if not available(module)]
+
+
+def install_hint(modules):
+    return 'pip install ' + ' '.join(PACKAGES.get(module, module) for module in modules)
+
+
+def require(*modules):
+    """Raise MissingDependency unless every module is installed"""
+    absent = missing(*modules)
+    if absent:
+        raise MissingDependency(absent)
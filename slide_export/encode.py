@@ -0,0 +1,217 @@
+"""
+Adaptive frame encoding
+Analyzes each captured frame and picks the cheapest faithful encoding for its
+page: palette PNG for flat slides, Flate (lossless) for text-heavy ones and
+JPEG for photographic content, optionally within a global byte budget
+"""
+
+import io
+import math
+import threading
+
+from .pdfwriter import JPEG_SIGNATURE, PNG_SIGNATURE, jpeg_image, load_image, png_image
+from .store import StoredFrame
+
+# 분석용 축소 폭 (전체 해상도 분석은 불필요)
+ANALYSIS_WIDTH = 480
+# 사진으로 판단하는 기준: 밝기 엔트로피(bit)와 윤곽 픽셀 비율
+PHOTO_ENTROPY = 6.0
+TEXT_EDGE_DENSITY = 0.12
+EDGE_THRESHOLD = 48
+MIN_QUALITY = 40
+
+FORMATS = ('palette', 'flate', 'jpeg')
+
+
+class FrameStats:
+    """Colour count, luminance entropy and edge density of one frame"""
+
+    def __init__(self, colors, entropy, edge_density):
+        # colors는 256을 넘으면 None (정확히 셀 필요 없음)
+        self.colors = colors
+        self.entropy = entropy
+        self.edge_density = edge_density
+
+    @property
+    def photographic(self):
+        return self.entropy >= PHOTO_ENTROPY and self.edge_density < TEXT_EDGE_DENSITY
+
+    def choose(self):
+        """Best format for this frame: 'palette', 'flate' or 'jpeg'"""
+        if self.colors is not None:
+            return 'palette'
+        if self.photographic:
+            return 'jpeg'
+        return 'flate'
+
+    def __repr__(self):
+        return (f'FrameStats(colors={self.colors}, entropy={self.entropy:.2f}, '
+                f'edges={self.edge_density:.3f})')
+
+
+def analyze(img):
+    """FrameStats for a PIL image"""
+    from PIL import ImageFilter
+
+    rgb = img.convert('RGB')
+    # 색상 수는 원본에서 (축소하면 보간으로 색이 늘어남)
+    counted = rgb.getcolors(256)
+    colors = len(counted) if counted is not None else None
+
+    small = rgb
+    if rgb.width > ANALYSIS_WIDTH:
+        small = rgb.resize((ANALYSIS_WIDTH, max(1, rgb.height * ANALYSIS_WIDTH // rgb.width)))
+    gray = small.convert('L')
+
+    histogram = gray.histogram()
+    pixels = sum(histogram)
+    entropy = -sum(n / pixels * math.log2(n / pixels) for n in histogram if n)
+
+    edges = gray.filter(ImageFilter.FIND_EDGES).histogram()
+    edge_density = sum(edges[EDGE_THRESHOLD:]) / pixels
+    return FrameStats(colors, entropy, edge_density)
+
+
+def opaque(data):
+    """Opaque RGB PIL image for frame bytes, a decoded image or a store.StoredFrame"""
+    from PIL import Image
+
+    if isinstance(data, StoredFrame):
+        data = data.image()
+    img = Image.open(io.BytesIO(data)) if isinstance(data, bytes) else data
+    if img.mode in ('RGBA', 'LA', 'P') or 'transparency' in img.info:
+        rgba = img.convert('RGBA')
+        flat = Image.new('RGB', rgba.size, (255, 255, 255))
+        flat.paste(rgba, mask=rgba.split()[-1])
+        return flat
+    return img.convert('RGB')
+
+
+def encode_palette(img, colors=256):
+    """Palette PNG (lossless when the frame has at most `colors` colours)"""
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    img.convert('P', palette=Image.Palette.ADAPTIVE, colors=colors).save(buffer, 'PNG')
+    return png_image(buffer.getvalue())
+
+
+def encode_flate(img, source=None):
+    """Lossless Flate with PNG predictors; passes an opaque source PNG through"""
+    if isinstance(source, bytes) and source.startswith(PNG_SIGNATURE):
+        image = png_image(source)
+        if image.filter_name == 'FlateDecode' and image.decode_parms:
+            return image
+    buffer = io.BytesIO()
+    img.save(buffer, 'PNG', compress_level=6)
+    return png_image(buffer.getvalue())
+
+
+def encode_jpeg(img, quality=85):
+    buffer = io.BytesIO()
+    img.save(buffer, 'JPEG', quality=quality, optimize=True, subsampling='4:2:0')
+    return jpeg_image(buffer.getvalue())
+
+
+def _choose(img, mode):
+    fmt = 'jpeg' if mode == 'jpeg' else analyze(img).choose()
+    if fmt == 'jpeg' and mode == 'lossless':
+        fmt = 'flate'
+    return fmt
+
+
+def _encode_as(fmt, img, quality, source=None):
+    if fmt == 'palette':
+        return encode_palette(img)
+    if fmt == 'flate':
+        return encode_flate(img, source)
+    return encode_jpeg(img, quality)
+
+
+def encode_frame(data, mode='auto', quality=85):
+    """(format, ImageStream) for frame bytes or a decoded PIL image, without a budget
+
+    Stateless, so it can run in worker threads or processes.
+    """
+    # JPEG 입력은 다시 압축해도 화질만 떨어지므로 그대로 사용
+    if isinstance(data, bytes) and data.startswith(JPEG_SIGNATURE) and mode != 'lossless':
+        return 'jpeg', load_image(data)
+    img = opaque(data)
+    fmt = _choose(img, mode)
+    return fmt, _encode_as(fmt, img, quality, data)
+
+
+class AdaptiveEncoder:
+    """Chooses an encoding per frame and keeps the document under `budget` bytes
+
+    mode:
+        'auto'     - palette / flate / jpeg from FrameStats
+        'lossless' - palette or flate only (the budget cannot force JPEG)
+        'jpeg'     - always JPEG at `quality`
+
+    With a `budget`, every page gets an equal share of what is left; a page
+    that encodes larger than its share is re-encoded as JPEG at decreasing
+    quality down to MIN_QUALITY.
+    """
+
+    def __init__(self, mode='auto', quality=85, budget=None, total=None):
+        if mode not in ('auto', 'lossless', 'jpeg'):
+            raise ValueError(f"Unknown compression mode '{mode}'")
+        self.mode = mode
+        self.quality = quality
+        self.budget = budget
+        self.total = total
+        self.used = 0
+        self.pages = 0
+        self.formats = {name: 0 for name in FORMATS}
+        self._lock = threading.Lock()
+
+    def page_budget(self):
+        if not self.budget:
+            return None
+        remaining_pages = max(1, (self.total or self.pages + 1) - self.pages)
+        return max(0, self.budget - self.used) / remaining_pages
+
+    @property
+    def settings(self):
+        """(mode, quality) arguments for encode_frame()"""
+        return self.mode, self.quality
+
+    def encode(self, data):
+        """ImageStream for PNG/JPEG frame bytes or a decoded PIL image
+
+        Safe to call from several threads when no budget is set.
+        """
+        if not self.budget:
+            return self.record(*encode_frame(data, self.mode, self.quality))
+
+        img = opaque(data)
+        fmt = _choose(img, self.mode)
+        image = _encode_as(fmt, img, self.quality, data)
+
+        limit = self.page_budget()
+        if limit is not None and len(image.data) > limit and self.mode != 'lossless':
+            quality = self.quality if fmt != 'jpeg' else self.quality - 10
+            while quality >= MIN_QUALITY:
+                candidate = encode_jpeg(img, quality)
+                if len(candidate.data) < len(image.data):
+                    image, fmt = candidate, 'jpeg'
+                if len(image.data) <= limit:
+                    break
+                quality -= 10
+        return self.record(fmt, image)
+
+    def record(self, fmt, image):
+        """Account for a page encoded elsewhere (e.g. by encode_frame in a worker)"""
+        with self._lock:
+            self.pages += 1
+            self.used += len(image.data)
+            self.formats[fmt] += 1
+        return image
+
+    def summary(self):
+        used = ', '.join(f'{n} {name}' for name, n in self.formats.items() if n)
+        text = f"Encoded {self.pages} pages ({used}), {self.used / 1024 / 1024:.2f} MB of images"
+        if self.budget:
+            text += f" (budget {self.budget / 1024 / 1024:.2f} MB)"
+        return text
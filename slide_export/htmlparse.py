@@ -0,0 +1,189 @@
+"""
+Slide extraction from deck HTML without a browser
+Pulls the `.slide` sections out of a presentation file while it is read in
+chunks: each slide is handed out as soon as its closing tag is parsed and is
+then dropped, so the whole DOM is never held. lxml's incremental HTML parser
+is used when installed; otherwise the standard library's html.parser does
+the same job more slowly.
+
+    for slide in iter_slides('integrated-presentation.html'):
+        print(slide.number, slide.title)
+"""
+
+import codecs
+import html
+from html.parser import HTMLParser
+
+from .deps import available
+
+BACKENDS = ('lxml', 'html.parser')
+CHUNK_SIZE = 64 * 1024
+HEADINGS = ('h1', 'h2', 'h3')
+
+
+class SlideSection:
+    """One `.slide` element: attributes, first heading and inner HTML"""
+
+    def __init__(self, index, id=None, classes=(), title='', html=''):
+        self.index = index
+        self.id = id
+        self.classes = list(classes)
+        self.title = title
+        self.html = html
+
+    @property
+    def number(self):
+        return self.index + 1
+
+    def __repr__(self):
+        return f'SlideSection({self.index}, {self.title!r})'
+
+
+def _is_slide(class_attr):
+    return 'slide' in (class_attr or '').split()
+
+
+def _other_classes(class_attr):
+    return [name for name in (class_attr or '').split() if name not in ('slide', 'active')]
+
+
+def default_backend():
+    return 'lxml' if available('lxml') else 'html.parser'
+
+
+def _read_chunks(source, chunk_size):
+    with open(source, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _iter_lxml(source, chunk_size):
+    from lxml import etree
+
+    parser = etree.HTMLPullParser(events=('end',), encoding='utf-8')
+    index = 0
+
+    def finished():
+        nonlocal index
+        for _, element in parser.read_events():
+            if not _is_slide(element.get('class')):
+                continue
+            heading = next(element.iter(*HEADINGS), None)
+            inner = html.escape(element.text or '', quote=False) + ''.join(
+                etree.tostring(child, method='html', encoding='unicode') for child in element)
+            yield SlideSection(index, element.get('id'), _other_classes(element.get('class')),
+                               ' '.join(''.join(heading.itertext()).split()) if heading is not None else '',
+                               inner)
+            index += 1
+            # 처리한 슬라이드와 그 앞 형제들은 버려서 트리가 커지지 않게
+            element.clear()
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+
+    for chunk in _read_chunks(source, chunk_size):
+        parser.feed(chunk)
+        yield from finished()
+    parser.close()
+    yield from finished()
+
+
+class _SlideParser(HTMLParser):
+    """html.parser handler that re-serialises the markup inside each `.slide`"""
+
+    VOID = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+            'link', 'meta', 'source', 'track', 'wbr'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.slides = []
+        self.count = 0
+        self.tag = None         # 현재 슬라이드 요소의 태그 (보통 div)
+        self.depth = 0
+        self.parts = []
+        self.attrs = {}
+        self.title = None       # 첫 제목 태그의 텍스트 조각
+        self.heading = None
+
+    def handle_starttag(self, tag, attrs):
+        if self.tag is None:
+            attrs = dict(attrs)
+            if _is_slide(attrs.get('class')):
+                self.tag, self.depth, self.parts, self.attrs = tag, 1, [], attrs
+                self.title, self.heading = None, None
+            return
+        if tag == self.tag:
+            self.depth += 1
+        if self.title is None and tag in HEADINGS:
+            self.title, self.heading = [], tag
+        self.parts.append(self.get_starttag_text())
+
+    def handle_startendtag(self, tag, attrs):
+        if self.tag is not None:
+            self.parts.append(self.get_starttag_text())
+
+    def handle_endtag(self, tag):
+        if self.tag is None or tag in self.VOID:
+            return
+        if tag == self.heading:
+            self.heading = None
+        if tag == self.tag:
+            self.depth -= 1
+            if self.depth == 0:
+                title = html.unescape(''.join(self.title or ()))
+                self.slides.append(SlideSection(
+                    self.count, self.attrs.get('id'), _other_classes(self.attrs.get('class')),
+                    ' '.join(title.split()), ''.join(self.parts)))
+                self.count += 1
+                self.tag = None
+                return
+        self.parts.append(f'</{tag}>')
+
+    def take(self):
+        """Slides completed since the last call"""
+        slides, self.slides = self.slides, []
+        return slides
+
+    def handle_data(self, data):
+        if self.tag is not None:
+            self.parts.append(data)
+            if self.heading is not None:
+                self.title.append(data)
+
+    def handle_entityref(self, name):
+        self.handle_data(f'&{name};')
+
+    def handle_charref(self, name):
+        self.handle_data(f'&#{name};')
+
+    def handle_comment(self, data):
+        if self.tag is not None:
+            self.parts.append(f'<!--{data}-->')
+
+
+def _iter_stdlib(source, chunk_size):
+    parser = _SlideParser()
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    for chunk in _read_chunks(source, chunk_size):
+        parser.feed(decoder.decode(chunk))
+        yield from parser.take()
+    parser.feed(decoder.decode(b'', final=True))
+    parser.close()
+    yield from parser.take()
+
+
+def iter_slides(source, backend=None, chunk_size=CHUNK_SIZE):
+    """Yield a SlideSection for every `.slide` element of the HTML file `source`
+
+    `backend` is 'lxml' or 'html.parser' (default: lxml when installed).
+    """
+    backend = backend or default_backend()
+    if backend == 'lxml':
+        return _iter_lxml(source, chunk_size)
+    if backend == 'html.parser':
+        return _iter_stdlib(source, chunk_size)
+    raise ValueError(f"unknown HTML backend {backend!r} (choose from {', '.join(BACKENDS)})")
@@ -0,0 +1,252 @@
+"""
+Incremental PDF rebuilds
+A sidecar index (<output>.index.json) records, for every slide, the page
+object it was written to and a hash of its source. On re-run only slides
+whose hash changed are written again, appended as a PDF incremental update
+that replaces their page objects; the rest of the file is not touched.
+A full rebuild happens when the slide list or the settings change, or after
+MAX_UPDATES appended updates so superseded objects do not pile up.
+"""
+
+import hashlib
+import json
+import os
+import re
+from collections import deque
+
+from .assemble import A4_LANDSCAPE, StreamingAssembler
+from .pdfwriter import PdfUpdate, PdfWriter, Ref
+
+INDEX_VERSION = 1
+MAX_UPDATES = 16
+
+# 렌더링할 때마다 바뀌는 문서 정보 날짜 - 변경 판단에서 제외
+VOLATILE_DATES = re.compile(rb'/(?:CreationDate|ModDate)\s*\(D:[^)]*\)')
+
+
+def index_path(output_file):
+    return f'{output_file}.index.json'
+
+
+def _read(frame):
+    if isinstance(frame, (str, os.PathLike)):
+        with open(frame, 'rb') as f:
+            return f.read()
+    return frame
+
+
+class PdfIndex:
+    """Sidecar index of an incrementally maintained PDF"""
+
+    def __init__(self, path):
+        self.path = path
+        self.data = None
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == INDEX_VERSION:
+                self.data = data
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
+    def matches(self, output_file, keys, settings):
+        """True if `output_file` is exactly the file this index describes"""
+        data = self.data
+        if data is None or data['settings'] != settings:
+            return False
+        if [entry['key'] for entry in data['entries']] != list(keys):
+            return False
+        try:
+            return os.path.getsize(output_file) == data['length']
+        except OSError:
+            return False
+
+    @property
+    def entries(self):
+        return self.data['entries']
+
+    @property
+    def updates(self):
+        return self.data['updates']
+
+    def updater(self, fp):
+        """PdfUpdate that appends to the indexed file"""
+        data = self.data
+        return PdfUpdate(fp, data['catalog'], data['pages'], data['size'], data['startxref'],
+                         data['fonts'])
+
+    def save(self, output_file, writer, settings, entries, updates, extra=None):
+        self.data = {
+            'version': INDEX_VERSION,
+            'settings': settings,
+            'length': os.path.getsize(output_file),
+            'startxref': writer.startxref,
+            'size': writer.next_num,
+            'catalog': writer.catalog.num,
+            'pages': writer.pages.num,
+            'fonts': writer.fonts,
+            'updates': updates,
+            'entries': entries,
+        }
+        self.data.update(extra or {})
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, indent=1, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+
+class IncrementalAssembler(StreamingAssembler):
+    """StreamingAssembler that rewrites only the pages whose frame changed
+
+    Usage:
+        stats = IncrementalAssembler('deck.pdf').build(
+            (f'slide-{n}', f'slides/slide_{n:02d}.png') for n in range(1, 18))
+
+    Frames are keyed by a stable slide id so reordering is detected.
+    """
+
+    def __init__(self, output_file, page_size=A4_LANDSCAPE, page_numbers=None,
+                 encoder=None, dpi=None, workers=None, executor='thread', index_file=None):
+        super().__init__(output_file, page_size, page_numbers=page_numbers, encoder=encoder,
+                         dpi=dpi, workers=workers, executor=executor)
+        self.index = PdfIndex(index_file or index_path(output_file))
+        self._update = False
+        self._targets = deque()
+        self._page_nums = {}
+
+    def settings(self):
+        """Everything besides the frames that affects the written pages"""
+        numbers = vars(self.page_numbers) if self.page_numbers else None
+        encoding = None
+        if self.encoder is not None:
+            encoding = list(self.encoder.settings) + [self.encoder.budget]
+        return json.dumps([self.page_width, self.page_height, numbers, self.dpi, encoding],
+                          sort_keys=True)
+
+    def create_writer(self, fp):
+        if self._update:
+            return self.index.updater(fp)
+        return PdfWriter(fp)
+
+    def build(self, frames):
+        """Write (key, frame) pairs (bytes or image paths); returns rebuild statistics"""
+        items = []
+        for key, frame in frames:
+            data = _read(frame)
+            # 경로는 해시만 계산하고 다시 읽음 (모든 프레임을 메모리에 두지 않음)
+            items.append((str(key), hashlib.sha256(data).hexdigest(),
+                          frame if isinstance(frame, (str, os.PathLike)) else data))
+        keys = [key for key, _, _ in items]
+        settings = self.settings()
+        self.total = len(items)
+
+        if self.index.matches(self.output_file, keys, settings) and self.index.updates < MAX_UPDATES:
+            old = self.index.entries
+            changed = [i for i, (_, digest, _) in enumerate(items) if digest != old[i]['hash']]
+            if not changed:
+                return {'mode': 'unchanged', 'pages': len(items), 'rewritten': 0}
+            self._update = True
+            self.file_mode = 'ab'
+            for i in changed:
+                self._targets.append((i, old[i]['page']))
+                self.add_frame(_read(items[i][2]))
+            updates = self.index.updates + 1
+            pages = [entry['page'] for entry in old]
+        else:
+            changed = range(len(items))
+            for i, (_, _, frame) in enumerate(items):
+                self._targets.append((i, None))
+                self.add_frame(_read(frame))
+            updates = 0
+            pages = None
+
+        writer = self._writer
+        self.close()
+        if pages is None:
+            pages = [self._page_nums[i] for i in range(len(items))]
+        entries = [{'key': key, 'hash': digest, 'page': page}
+                   for (key, digest, _), page in zip(items, pages)]
+        self.index.save(self.output_file, writer, settings, entries, updates)
+        return {'mode': 'update' if self._update else 'full', 'pages': len(items),
+                'rewritten': len(changed)}
+
+    def add_image(self, image, ref=None):
+        number, target = self._targets.popleft()
+        # 페이지 번호는 갱신되는 페이지의 실제 위치 기준
+        self.count = number
+        page = super().add_image(image, ref=Ref(target) if target else ref)
+        self._page_nums[number] = page.num
+        return page
+
+
+def _reopen(source):
+    """Parser input for a merge source; file objects are rewound after hashing"""
+    from .merge import _read_source
+
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    return _read_source(source)
+
+
+def merge_incremental(sources, output_file, index_file=None):
+    """Merge keyed PDFs [(key, bytes, path or file object)] into `output_file`,
+    rewriting only changed ones
+
+    Objects shared through merge deduplication stay shared across updates:
+    the content hashes of copied objects are kept in the index.
+    """
+    from PyPDF2 import PdfReader
+
+    from .merge import _Merger
+
+    index = PdfIndex(index_file or index_path(output_file))
+    items = []
+    for key, source in sources:
+        data = _read(source) if not hasattr(source, 'read') else source.read()
+        digest = hashlib.sha256(VOLATILE_DATES.sub(b'', data)).hexdigest()
+        # 바이트가 아닌 소스(경로, 매핑된 reader)는 해시만 남기고 필요할 때 다시 읽음
+        items.append((str(key), digest, data if isinstance(source, bytes) else source))
+    keys = [key for key, _, _ in items]
+
+    update = index.matches(output_file, keys, 'merge') and index.updates < MAX_UPDATES
+    changed = list(range(len(items)))
+    if update:
+        old = index.entries
+        changed = [i for i, (_, digest, _) in enumerate(items) if digest != old[i]['hash']]
+        if not changed:
+            return {'mode': 'unchanged', 'pages': sum(len(e['page']) for e in old), 'rewritten': 0}
+        readers = {i: PdfReader(_reopen(items[i][2])) for i in changed}
+        # 페이지 수가 바뀐 슬라이드가 있으면 페이지 트리를 다시 써야 하므로 전체 재생성
+        if any(len(readers[i].pages) != len(old[i]['page']) for i in changed):
+            update = False
+            changed = list(range(len(items)))
+
+    with open(output_file, 'ab' if update else 'wb') as fp:
+        writer = index.updater(fp) if update else PdfWriter(fp)
+        merger = _Merger(writer)
+        pages = {}
+        if update:
+            merger.by_hash = {bytes.fromhex(h): Ref(n) for h, n in index.data['objects'].items()}
+            for i in changed:
+                pages[i] = [merger.add_page(page, ref=Ref(num)).num
+                            for page, num in zip(readers[i].pages, old[i]['page'])]
+        else:
+            readers = {}
+            for i, (_, _, source) in enumerate(items):
+                # 리더를 유지해야 id() 기반 키가 재사용되지 않음
+                readers[i] = PdfReader(_reopen(source))
+                pages[i] = [merger.add_page(page).num for page in readers[i].pages]
+        writer.close()
+
+    entries = []
+    for i, (key, digest, _) in enumerate(items):
+        entries.append({'key': key, 'hash': digest,
+                        'page': pages[i] if i in pages else index.entries[i]['page']})
+    # 주석처럼 공유하지 않는 객체(해시에 위치가 붙은 것)는 기록하지 않음
+    objects = dict(index.data['objects']) if update else {}
+    objects.update({digest.hex(): ref.num for digest, ref in merger.by_hash.items()
+                    if len(digest) == hashlib.sha256().digest_size})
+    index.save(output_file, writer, 'merge', entries, index.updates + 1 if update else 0,
+               {'objects': objects})
+    return {'mode': 'update' if update else 'full', 'pages': sum(len(e['page']) for e in entries),
+            'rewritten': len(changed), 'duplicates': merger.duplicates}
@@ -0,0 +1,147 @@
+"""
+Slide manifest
+Enumerates the slides of a loaded deck from the DOM once and joins them with
+data/slides.json, so capture is driven by what the presentation actually
+contains instead of a hard-coded slide count
+"""
+
+import json
+import os
+import re
+
+# 슬라이드가 디자인된 화면 크기
+VIEWPORT = {'width': 1920, 'height': 1080}
+
+# DOM 순서대로 슬라이드 목록 (id, 제목, 클래스)
+MANIFEST_SCRIPT = '''
+() => [...document.querySelectorAll('.slide')].map((slide, index) => {
+    const heading = slide.querySelector('h1, h2, h3');
+    return {
+        index,
+        id: slide.id || slide.dataset.slideId || null,
+        title: heading ? heading.textContent.replace(/\\s+/g, ' ').trim() : '',
+        classes: [...slide.classList].filter(name => name !== 'slide' && name !== 'active'),
+    };
+})
+'''
+
+
+class EmptyDeck(ValueError):
+    """The deck has no `.slide` elements to export"""
+
+
+class SlideInfo:
+    """One slide of the deck: its DOM position plus any data/slides.json record"""
+
+    def __init__(self, index, id=None, title='', classes=(), record=None):
+        self.index = index
+        self.id = id
+        self.title = title
+        self.classes = list(classes)
+        self.record = record
+
+    @property
+    def number(self):
+        return self.index + 1
+
+    @property
+    def visualizations(self):
+        return self.record.get('visualizations', []) if self.record else []
+
+    def to_dict(self):
+        return {
+            'index': self.index,
+            'number': self.number,
+            'id': self.id,
+            'title': self.title,
+            'classes': self.classes,
+            'data_id': self.record.get('id') if self.record else None,
+            'visualizations': self.visualizations,
+        }
+
+
+def load_slide_data(data_dir='data'):
+    """Slide records from data/slides.json sorted by `order` ([] if missing)"""
+    try:
+        with open(os.path.join(data_dir, 'slides.json'), encoding='utf-8') as f:
+            slides = json.load(f).get('slides', [])
+    except FileNotFoundError:
+        return []
+    return sorted(slides, key=lambda s: s.get('order', 0))
+
+
+class SlideManifest:
+    """Ordered list of SlideInfo for one deck
+
+    DOM slides are matched to data/slides.json records by element id (or
+    `data-slide-id`) first, then by `order` for slides without one. Records
+    that match no DOM slide are reported in `unmatched`.
+    """
+
+    def __init__(self, slides, unmatched=()):
+        self.slides = list(slides)
+        self.unmatched = list(unmatched)
+
+    def __len__(self):
+        return len(self.slides)
+
+    def __iter__(self):
+        return iter(self.slides)
+
+    def __getitem__(self, index):
+        return self.slides[index]
+
+    def indices(self, numbers=None):
+        """0-based indices for 1-based slide `numbers` (all slides by default)"""
+        if numbers is None:
+            return [slide.index for slide in self.slides]
+        missing = [n for n in numbers if not 1 <= n <= len(self.slides)]
+        if missing:
+            raise ValueError(f"Slides {missing} do not exist (deck has {len(self.slides)})")
+        return [n - 1 for n in numbers]
+
+    @classmethod
+    def build(cls, dom_slides, records=()):
+        by_id = {r['id']: r for r in records if r.get('id')}
+        by_order = {r.get('order', 0) - 1: r for r in records}
+        used = set()
+        slides = []
+        for item in dom_slides:
+            record = by_id.get(item.get('id')) or by_order.get(item['index'])
+            if record is not None and id(record) in used:
+                record = None
+            if record is not None:
+                used.add(id(record))
+            slides.append(SlideInfo(item['index'], item.get('id'), item.get('title', ''),
+                                    item.get('classes', ()), record))
+        unmatched = [r for r in records if id(r) not in used]
+        return cls(slides, unmatched)
+
+    @classmethod
+    async def from_page(cls, page, data_dir='data'):
+        """Enumerate the slides of a loaded Playwright page"""
+        return cls.build(await page.evaluate(MANIFEST_SCRIPT), load_slide_data(data_dir))
+
+    def to_list(self):
+        return [slide.to_dict() for slide in self.slides]
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'slides': self.to_list(),
+                       'unmatched': [r.get('id') for r in self.unmatched]},
+                      f, indent=2, ensure_ascii=False)
+
+
+def discover_images(directory, prefix='slide_', extension='.png'):
+    """Slide image files `<prefix>NN<extension>` in `directory`, in slide order"""
+    pattern = re.compile(rf'^{re.escape(prefix)}(\d+){re.escape(extension)}$')
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+    found = []
+    for name in names:
+        match = pattern.match(name)
+        if match:
+            found.append((int(match.group(1)), os.path.join(directory, name)))
+    return [path for _, path in sorted(found)]
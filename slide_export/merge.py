@@ -0,0 +1,196 @@
+"""
+In-memory PDF merge with shared-resource deduplication
+Takes PDF byte buffers (e.g. straight from `page.pdf()`), copies their pages
+into one document and stores identical fonts, images and other objects only
+once, keyed by a hash of their content
+"""
+
+import hashlib
+import io
+import os
+
+from .pdfwriter import PdfWriter, Raw
+from .store import map_file
+from .trace import span
+
+# /Parent는 페이지 트리로 되돌아가는 링크이므로 해시/복사에서 제외
+SKIP_KEYS = ('/Parent',)
+# 상위 페이지 트리 노드에서 상속될 수 있는 페이지 속성
+INHERITED_KEYS = ('/Resources', '/MediaBox', '/CropBox', '/Rotate')
+
+
+def _token(obj):
+    """PDF syntax for a leaf object (number, name, string...)"""
+    buf = io.BytesIO()
+    obj.write_to_stream(buf, None)
+    return buf.getvalue().decode('latin-1')
+
+
+class _Merger:
+    """Copies objects from PyPDF2 readers into a PdfWriter, sharing duplicates"""
+
+    def __init__(self, writer):
+        from PyPDF2.generic import ArrayObject, DictionaryObject, IndirectObject, StreamObject
+
+        self.types = (ArrayObject, DictionaryObject, IndirectObject, StreamObject)
+        self.writer = writer
+        self.by_hash = {}
+        self.by_source = {}
+        self.digests = {}
+        self.duplicates = 0
+        self.bytes_saved = 0
+
+    @staticmethod
+    def source_key(ref):
+        return (id(ref.pdf), ref.idnum, ref.generation)
+
+    def digest(self, obj, stack=()):
+        """Content hash of `obj`, following indirect references"""
+        ArrayObject, DictionaryObject, IndirectObject, StreamObject = self.types
+        h = hashlib.sha256()
+
+        if isinstance(obj, IndirectObject):
+            key = self.source_key(obj)
+            if key in self.digests:
+                return self.digests[key]
+            if key in stack:
+                # 순환 참조 - 위치로만 구분
+                return hashlib.sha256(repr(key).encode()).digest()
+            value = self.digest(obj.get_object(), stack + (key,))
+            self.digests[key] = value
+            return value
+
+        if isinstance(obj, StreamObject):
+            h.update(b'stream')
+            h.update(self._dict_digest(obj, stack, skip=SKIP_KEYS + ('/Length',)))
+            h.update(obj._data)
+        elif isinstance(obj, DictionaryObject):
+            h.update(b'dict')
+            h.update(self._dict_digest(obj, stack))
+        elif isinstance(obj, ArrayObject):
+            h.update(b'array')
+            for item in obj:
+                h.update(self.digest(item, stack))
+        else:
+            h.update(b'leaf')
+            h.update(_token(obj).encode('latin-1'))
+        return h.digest()
+
+    def _dict_digest(self, obj, stack, skip=SKIP_KEYS):
+        h = hashlib.sha256()
+        for key in sorted(k for k in obj.keys() if k not in skip):
+            h.update(_token(key).encode('latin-1'))
+            h.update(self.digest(obj.raw_get(key), stack))
+        return h.digest()
+
+    def translate(self, obj, skip=SKIP_KEYS):
+        """Python/pdfwriter value for `obj` with references remapped"""
+        ArrayObject, DictionaryObject, IndirectObject, StreamObject = self.types
+
+        if isinstance(obj, IndirectObject):
+            return self.copy_indirect(obj)
+        if isinstance(obj, DictionaryObject):
+            return {_token(k)[1:]: self.translate(obj.raw_get(k))
+                    for k in obj.keys() if k not in skip}
+        if isinstance(obj, ArrayObject):
+            return [self.translate(item) for item in obj]
+        return Raw(_token(obj))
+
+    def copy_indirect(self, ref):
+        """Copy the object behind `ref` once per distinct content"""
+        StreamObject = self.types[3]
+        key = self.source_key(ref)
+        if key in self.by_source:
+            return self.by_source[key]
+
+        target = ref.get_object()
+        digest = self.digest(ref)
+        # 주석(링크 등)은 페이지마다 별도 객체여야 하므로 공유하지 않음
+        if isinstance(target, self.types[1]) and '/Rect' in target and '/Subtype' in target:
+            digest += repr(key).encode()
+        if digest in self.by_hash:
+            self.duplicates += 1
+            if isinstance(target, StreamObject):
+                self.bytes_saved += len(target._data)
+            self.by_source[key] = self.by_hash[digest]
+            return self.by_source[key]
+
+        # 자식 객체보다 먼저 등록해서 순환 참조가 같은 객체를 가리키게 함
+        new_ref = self.writer.alloc()
+        self.by_hash[digest] = new_ref
+        self.by_source[key] = new_ref
+
+        if isinstance(target, StreamObject):
+            entries = self.translate(target, skip=SKIP_KEYS + ('/Length',))
+            self.writer.write_stream(new_ref, entries, target._data)
+        else:
+            self.writer.write_object(new_ref, self.translate(target))
+        return new_ref
+
+    def add_page(self, page, ref=None):
+        """Copy one PyPDF2 page, resolving inherited attributes
+
+        `ref` writes the page under an existing object number (incremental updates).
+        """
+        new_ref = ref or self.writer.alloc()
+        if page.indirect_reference is not None:
+            self.by_source[self.source_key(page.indirect_reference)] = new_ref
+
+        entries = self.translate(page)
+        node = page
+        while node is not None and any(k[1:] not in entries for k in INHERITED_KEYS):
+            for key in INHERITED_KEYS:
+                if key[1:] not in entries and key in node:
+                    entries[key[1:]] = self.translate(node.raw_get(key))
+            node = node.get('/Parent')
+            node = node.get_object() if node is not None else None
+
+        self.writer.add_page_object(new_ref, entries)
+        return new_ref
+
+
+def _read_source(source):
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    if isinstance(source, (str, os.PathLike)):
+        # 파일 전체를 읽지 않고 매핑 - 파서가 필요한 부분만 페이지 인
+        mapped = map_file(source)
+        return mapped if mapped else io.BytesIO()
+    return source
+
+
+def merge_pdf_buffers(sources, output):
+    """Merge PDFs (bytes, paths or file objects) into `output` (path or file object)
+
+    Fonts, images and other objects with identical content are written once
+    and shared by every page that uses them. Returns merge statistics.
+    """
+    from PyPDF2 import PdfReader
+
+    own_file = isinstance(output, (str, os.PathLike))
+    fp = open(output, 'wb') if own_file else output
+    try:
+        writer = PdfWriter(fp)
+        merger = _Merger(writer)
+        readers = []
+        for source in sources:
+            with span('merge', source=len(readers) + 1) as s:
+                reader = PdfReader(_read_source(source))
+                # 리더를 유지해야 id() 기반 키가 재사용되지 않음
+                readers.append(reader)
+                for page in reader.pages:
+                    merger.add_page(page)
+                s.set(pages=len(reader.pages))
+        with span('write') as s:
+            writer.close()
+            s.set(bytes=writer.tell())
+    finally:
+        if own_file:
+            fp.close()
+
+    return {
+        'pages': len(writer.page_refs),
+        'objects': writer.next_num - 1,
+        'duplicates': merger.duplicates,
+        'bytes_saved': merger.bytes_saved,
+    }
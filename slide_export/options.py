@@ -0,0 +1,68 @@
+"""
+Export options
+Settings shared by every pipeline stage, kept apart from the pipeline so the
+CLI can validate and print an export plan (--dry-run) without importing any
+stage or backend.
+"""
+
+import os
+
+from .assemble import PAGE_SIZES
+from .manifest import VIEWPORT
+
+# 캡처와 기록 사이에 대기할 수 있는 프레임 수
+QUEUE_DEPTH = 4
+
+
+class ExportOptions:
+    """Settings shared by every stage"""
+
+    def __init__(self, source='index.html', output=None, page_size='A4', mode='raster',
+                 dpi=None, workers=None, slides=None, use_cache=True, offline=False,
+                 page_numbers=True, screenshot_format='png', quality=90,
+                 compression=None, budget=None, encode_workers=None, executor='thread',
+                 queue_depth=QUEUE_DEPTH):
+        if page_size not in PAGE_SIZES:
+            raise ValueError(f"Unknown page size '{page_size}' (expected one of {', '.join(PAGE_SIZES)})")
+        if mode not in ('raster', 'vector'):
+            raise ValueError(f"Unknown mode '{mode}' (expected 'raster' or 'vector')")
+        self.source = source
+        self.output = output or default_output(source, mode, page_size)
+        self.page_size = page_size
+        self.mode = mode
+        self.dpi = dpi
+        self.workers = workers
+        self.slides = slides
+        self.use_cache = use_cache
+        self.offline = offline
+        self.page_numbers = page_numbers
+        self.screenshot_format = screenshot_format
+        self.quality = quality
+        # None이면 캡처한 프레임을 그대로 삽입 (encode.AdaptiveEncoder 참고)
+        self.compression = compression
+        self.budget = budget
+        # 페이지 준비(축소/인코딩) 병렬화 - 'process'는 공유 메모리로 프레임 전달
+        self.encode_workers = encode_workers
+        self.executor = executor
+        self.queue_depth = queue_depth
+
+    @property
+    def device_scale_factor(self):
+        """Browser scale that yields `dpi` once a frame is fitted to the page width"""
+        if not self.dpi:
+            return 1
+        page_width_in = PAGE_SIZES[self.page_size][0] / 72
+        return max(0.5, round(page_width_in * self.dpi / VIEWPORT['width'], 2))
+
+    def asset_bundle(self):
+        """bundle.AssetBundle serving vendor/ for offline exports, or None"""
+        if not self.offline:
+            return None
+        from .bundle import AssetBundle
+        return AssetBundle()
+
+
+def default_output(source, mode, page_size):
+    root = os.path.splitext(os.path.basename(source))[0]
+    suffix = '16x9' if page_size == '16:9' else page_size
+    return f'{root}_{mode}_{suffix}.pdf'
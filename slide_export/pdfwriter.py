@@ -0,0 +1,376 @@
+"""
+Minimal streaming PDF writer
+Writes objects to the output as they are produced, so only the current page
+has to be held in memory. Images are embedded without re-encoding where the
+source stream can be passed through (JPEG as DCTDecode, PNG IDAT as FlateDecode
+with PNG predictors).
+"""
+
+import struct
+import zlib
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+JPEG_SIGNATURE = b'\xff\xd8'
+
+# Helvetica 글리프 폭 (1/1000 em) - 페이지 번호 정렬용
+HELVETICA_WIDTHS = {' ': 278, '/': 278, '|': 260, '-': 333, '.': 278}
+HELVETICA_WIDTHS.update({str(d): 556 for d in range(10)})
+
+
+def helvetica_width(text, size):
+    """Width of `text` in points when set in Helvetica at `size`"""
+    return sum(HELVETICA_WIDTHS.get(ch, 556) for ch in text) * size / 1000
+
+
+def pdf_string(text):
+    """Escape `text` as a PDF literal string"""
+    escaped = text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+    return f'({escaped})'
+
+
+def format_value(value):
+    """Serialize a Python value as a PDF object"""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, Ref):
+        return str(value)
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        return f'{value:.4f}'.rstrip('0').rstrip('.') or '0'
+    if isinstance(value, (Name, Raw)):
+        return str(value)
+    if isinstance(value, (bytes, bytearray)):
+        return '<' + bytes(value).hex() + '>'
+    if isinstance(value, str):
+        return pdf_string(value)
+    if isinstance(value, (list, tuple)):
+        return '[' + ' '.join(format_value(v) for v in value) + ']'
+    if isinstance(value, dict):
+        items = ' '.join(f'/{k} {format_value(v)}' for k, v in value.items())
+        return '<< ' + items + ' >>'
+    if value is None:
+        return 'null'
+    raise TypeError(f'Cannot serialize {type(value).__name__} as PDF')
+
+
+class Raw(str):
+    """Token that is already serialized PDF syntax"""
+
+
+class Name(str):
+    """PDF name object (/Foo)"""
+
+    def __str__(self):
+        return '/' + str.__str__(self)
+
+
+class Ref:
+    """Indirect object reference (n 0 R)"""
+
+    def __init__(self, num):
+        self.num = num
+
+    def __str__(self):
+        return f'{self.num} 0 R'
+
+    def __eq__(self, other):
+        return isinstance(other, Ref) and other.num == self.num
+
+    def __hash__(self):
+        return hash(('Ref', self.num))
+
+
+class ImageStream:
+    """An image ready to be embedded: dictionary entries plus encoded data"""
+
+    def __init__(self, width, height, data, filter_name, color_space='DeviceRGB',
+                 bits=8, decode_parms=None):
+        self.width = width
+        self.height = height
+        self.data = data
+        self.filter_name = filter_name
+        self.color_space = color_space
+        self.bits = bits
+        self.decode_parms = decode_parms
+
+    def dictionary(self):
+        entries = {
+            'Type': Name('XObject'),
+            'Subtype': Name('Image'),
+            'Width': self.width,
+            'Height': self.height,
+            'BitsPerComponent': self.bits,
+        }
+        if isinstance(self.color_space, str):
+            entries['ColorSpace'] = Name(self.color_space)
+        else:
+            entries['ColorSpace'] = self.color_space
+        if self.filter_name:
+            entries['Filter'] = Name(self.filter_name)
+        if self.decode_parms:
+            entries['DecodeParms'] = self.decode_parms
+        return entries
+
+
+def png_chunks(data):
+    """Yield (type, payload) for every chunk of a PNG byte string"""
+    pos = len(PNG_SIGNATURE)
+    while pos < len(data):
+        length, = struct.unpack('>I', data[pos:pos + 4])
+        kind = data[pos + 4:pos + 8]
+        yield kind, data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+        if kind == b'IEND':
+            break
+
+
+def png_image(data):
+    """Build an ImageStream from PNG bytes, passing IDAT through when possible
+
+    Non-interlaced greyscale, RGB and palette PNGs are embedded as-is: the
+    concatenated IDAT payload is a valid FlateDecode stream with PNG
+    predictors. Images with an alpha channel are flattened once through PIL.
+    """
+    header = None
+    palette = None
+    idat = []
+    for kind, payload in png_chunks(data):
+        if kind == b'IHDR':
+            header = struct.unpack('>IIBBBBB', payload)
+        elif kind == b'PLTE':
+            palette = payload
+        elif kind == b'IDAT':
+            idat.append(payload)
+
+    if header is None:
+        raise ValueError('PNG has no IHDR chunk')
+    width, height, bits, color_type, _, _, interlace = header
+    colors = {0: 1, 2: 3, 3: 1}.get(color_type)
+
+    if colors is None or interlace or bits == 16:
+        return flattened_image(data)
+
+    if color_type == 0:
+        color_space = 'DeviceGray'
+    elif color_type == 2:
+        color_space = 'DeviceRGB'
+    else:
+        color_space = [Name('Indexed'), Name('DeviceRGB'), len(palette) // 3 - 1, palette]
+
+    return ImageStream(
+        width, height, b''.join(idat), 'FlateDecode',
+        color_space=color_space,
+        bits=bits,
+        decode_parms={'Predictor': 15, 'Colors': colors,
+                      'BitsPerComponent': bits, 'Columns': width}
+    )
+
+
+def jpeg_image(data):
+    """Build an ImageStream from JPEG bytes (DCTDecode passthrough)"""
+    pos = 2
+    while pos < len(data):
+        if data[pos] != 0xFF:
+            pos += 1
+            continue
+        marker = data[pos + 1]
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+            pos += 2
+            continue
+        length, = struct.unpack('>H', data[pos + 2:pos + 4])
+        # SOF0-SOF15 (C4 DHT, C8 JPG, CC DAC 제외)
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            bits, height, width, components = struct.unpack('>BHHB', data[pos + 4:pos + 10])
+            color_space = {1: 'DeviceGray', 3: 'DeviceRGB', 4: 'DeviceCMYK'}[components]
+            return ImageStream(width, height, data, 'DCTDecode',
+                               color_space=color_space, bits=bits)
+        pos += 2 + length
+    raise ValueError('JPEG has no SOF marker')
+
+
+def flattened_image(data, background=(255, 255, 255)):
+    """Decode an image with PIL, drop alpha onto `background` and Flate-encode once"""
+    import io
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as img:
+        if img.mode in ('RGBA', 'LA', 'P') or 'transparency' in img.info:
+            rgba = img.convert('RGBA')
+            flat = Image.new('RGB', rgba.size, background)
+            flat.paste(rgba, mask=rgba.split()[-1])
+        else:
+            flat = img.convert('RGB')
+        return ImageStream(flat.width, flat.height, zlib.compress(flat.tobytes(), 6),
+                           'FlateDecode')
+
+
+def load_image(data):
+    """ImageStream for PNG or JPEG bytes, sniffed from the signature"""
+    if data.startswith(PNG_SIGNATURE):
+        return png_image(data)
+    if data.startswith(JPEG_SIGNATURE):
+        return jpeg_image(data)
+    return flattened_image(data)
+
+
+class PdfWriter:
+    """Append-only PDF writer
+
+    Objects are serialized straight to `fp` as they are added; only the byte
+    offsets needed for the cross-reference table are kept.
+    """
+
+    def __init__(self, fp):
+        self.fp = fp
+        self.offsets = {}
+        self.page_refs = []
+        self.next_num = 1
+        self.catalog = self.alloc()
+        self.pages = self.alloc()
+        self._fonts = {}
+        self._write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+
+    def _write(self, data):
+        self.fp.write(data)
+
+    def tell(self):
+        return self.fp.tell()
+
+    def alloc(self):
+        """Reserve an object number"""
+        ref = Ref(self.next_num)
+        self.next_num += 1
+        return ref
+
+    def write_object(self, ref, value):
+        """Serialize `value` as indirect object `ref`"""
+        self.offsets[ref.num] = self.tell()
+        body = value if isinstance(value, bytes) else format_value(value).encode('latin-1')
+        self._write(f'{ref.num} 0 obj\n'.encode() + body + b'\nendobj\n')
+        return ref
+
+    def write_stream(self, ref, entries, data):
+        """Write a stream object with dictionary `entries` and raw `data`"""
+        entries = dict(entries)
+        entries['Length'] = len(data)
+        self.offsets[ref.num] = self.tell()
+        self._write(f'{ref.num} 0 obj\n{format_value(entries)}\nstream\n'.encode('latin-1'))
+        self._write(data)
+        self._write(b'\nendstream\nendobj\n')
+        return ref
+
+    def add_image(self, image):
+        """Embed an ImageStream and return its reference"""
+        return self.write_stream(self.alloc(), image.dictionary(), image.data)
+
+    @property
+    def fonts(self):
+        """Object numbers of the fonts written so far, by base font"""
+        return {name: ref.num for name, ref in self._fonts.items()}
+
+    def font(self, base_font='Helvetica'):
+        """Reference to a standard Type1 font, written once per document"""
+        if base_font not in self._fonts:
+            self._fonts[base_font] = self.write_object(self.alloc(), {
+                'Type': Name('Font'),
+                'Subtype': Name('Type1'),
+                'BaseFont': Name(base_font),
+                'Encoding': Name('WinAnsiEncoding'),
+            })
+        return self._fonts[base_font]
+
+    def add_page(self, width, height, content, resources, compress=True, ref=None):
+        """Write a page with content stream `content` (bytes) and return its reference
+
+        `ref` writes the page under an existing object number (incremental updates).
+        """
+        entries = {}
+        if compress:
+            content = zlib.compress(content)
+            entries['Filter'] = Name('FlateDecode')
+        contents = self.write_stream(self.alloc(), entries, content)
+        page = self.write_object(ref or self.alloc(), {
+            'Type': Name('Page'),
+            'Parent': self.pages,
+            'MediaBox': [0, 0, width, height],
+            'Resources': resources,
+            'Contents': contents,
+        })
+        self.page_refs.append(page)
+        return page
+
+    def add_page_object(self, ref, entries):
+        """Write a fully formed page dictionary (Parent is filled in) as `ref`"""
+        entries = dict(entries)
+        entries['Parent'] = self.pages
+        self.write_object(ref, entries)
+        self.page_refs.append(ref)
+        return ref
+
+    def close(self, info=None):
+        """Write the page tree, catalog, cross-reference table and trailer"""
+        self.write_object(self.pages, {
+            'Type': Name('Pages'),
+            'Kids': self.page_refs,
+            'Count': len(self.page_refs),
+        })
+        self.write_object(self.catalog, {'Type': Name('Catalog'), 'Pages': self.pages})
+        trailer = {'Size': self.next_num, 'Root': self.catalog}
+        if info:
+            trailer['Info'] = self.write_object(self.alloc(), info)
+            trailer['Size'] = self.next_num
+
+        xref = self.startxref = self.tell()
+        lines = [f'xref\n0 {self.next_num}\n', '0000000000 65535 f \n']
+        for num in range(1, self.next_num):
+            offset = self.offsets.get(num)
+            if offset is None:
+                lines.append('0000000000 65535 f \n')
+            else:
+                lines.append(f'{offset:010d} 00000 n \n')
+        self._write(''.join(lines).encode('ascii'))
+        self._write(f'trailer\n{format_value(trailer)}\nstartxref\n{xref}\n%%EOF\n'.encode('latin-1'))
+
+
+class PdfUpdate(PdfWriter):
+    """Incremental update appended to a PDF produced by PdfWriter
+
+    New and replaced objects are written after the existing file followed by a
+    cross-reference section covering only them, chained to the previous one
+    through /Prev. Everything already in the file is left untouched.
+    """
+
+    def __init__(self, fp, catalog, pages, size, prev_xref, fonts=None):
+        self.fp = fp
+        self.offsets = {}
+        self.page_refs = []
+        self.next_num = size
+        self.catalog = Ref(catalog)
+        self.pages = Ref(pages)
+        self.prev_xref = prev_xref
+        self._fonts = {name: Ref(num) for name, num in (fonts or {}).items()}
+        # 이전 내용이 개행으로 끝나지 않았을 경우 대비
+        self._write(b'\n')
+
+    def close(self, info=None):
+        """Write the update's cross-reference section and trailer"""
+        trailer = {'Size': self.next_num, 'Root': self.catalog, 'Prev': self.prev_xref}
+        if info:
+            trailer['Info'] = self.write_object(self.alloc(), info)
+            trailer['Size'] = self.next_num
+
+        xref = self.startxref = self.tell()
+        lines = ['xref\n', '0 1\n', '0000000000 65535 f \n']
+        nums = sorted(self.offsets)
+        start = 0
+        # 연속된 객체 번호끼리 하위 섹션으로 묶음
+        while start < len(nums):
+            end = start
+            while end + 1 < len(nums) and nums[end + 1] == nums[end] + 1:
+                end += 1
+            lines.append(f'{nums[start]} {end - start + 1}\n')
+            lines.extend(f'{self.offsets[n]:010d} 00000 n \n' for n in nums[start:end + 1])
+            start = end + 1
+        self._write(''.join(lines).encode('ascii'))
+        self._write(f'trailer\n{format_value(trailer)}\nstartxref\n{xref}\n%%EOF\n'.encode('latin-1'))
@@ -0,0 +1,247 @@
+"""
+Slide export pipeline
+One core that every export entry point goes through:
+
+    source -> capture -> transform -> assemble -> sink
+
+Each stage is a small object that can be swapped, so an optimization added to
+a stage applies to every script and to the `python -m slide_export` CLI.
+Capture and assembly run concurrently, connected by a bounded queue
+(stream_frames).
+"""
+
+import os
+
+from .assemble import PAGE_SIZES, StreamingAssembler
+from .cache import CaptureCache
+from .manifest import EmptyDeck
+from .options import QUEUE_DEPTH, ExportOptions, default_output
+from .trace import span, track
+
+_DONE = object()
+
+
+class Frame:
+    """One captured slide moving through the raster stages"""
+
+    def __init__(self, index, data, meta=None):
+        self.index = index
+        self.data = data
+        self.meta = meta or {}
+
+
+class HtmlSource:
+    """Source stage: a deck HTML file and the slides to export"""
+
+    def __init__(self, path, slides=None):
+        self.path = path
+        self.slides = slides
+
+    async def indices(self, engine):
+        """0-based slide indices to capture, checked against the deck's manifest"""
+        manifest = await engine.manifest()
+        if not len(manifest):
+            raise EmptyDeck(f"{self.path} has no .slide elements")
+        return manifest.indices(self.slides)
+
+
+class RasterCapture:
+    """Capture stage: screenshots from the parallel page pool"""
+
+    def __init__(self, options, browser=None):
+        self.options = options
+        self.browser = browser
+        self.engine = None
+        self.cache = CaptureCache() if options.use_cache else None
+
+    def create_engine(self, source):
+        # 캡처 엔진(asyncio, playwright)은 실제로 캡처할 때만 불러옴
+        from .capture import CaptureEngine
+
+        return CaptureEngine(source.path, workers=self.options.workers,
+                             device_scale_factor=self.options.device_scale_factor,
+                             assets=self.options.asset_bundle(), browser=self.browser)
+
+    async def frames(self, source):
+        """Yield Frame objects in slide order"""
+        options = {'type': self.options.screenshot_format}
+        if self.options.screenshot_format == 'jpeg':
+            options['quality'] = self.options.quality
+        async with self.create_engine(source) as engine:
+            self.engine = engine
+            manifest = await engine.manifest()
+            indices = await source.indices(engine)
+            async for index, data in engine.capture(indices, cache=self.cache,
+                                                    ahead=self.options.queue_depth, **options):
+                yield Frame(index, data, {'total': len(indices), 'slide': manifest[index]})
+
+
+class RasterAssemble:
+    """Assemble stage: stream frames into a PDF, one page at a time"""
+
+    def __init__(self, options):
+        self.options = options
+
+    def create_encoder(self):
+        if self.options.compression is None and not self.options.budget:
+            return None
+        from .encode import AdaptiveEncoder
+        return AdaptiveEncoder(self.options.compression or 'auto', self.options.quality,
+                               self.options.budget)
+
+    async def run(self, frames, sink):
+        page_numbers = None if self.options.page_numbers else False
+        encoder = self.create_encoder()
+        assembler = None
+
+        def write(frame):
+            nonlocal assembler
+            if assembler is None:
+                if encoder is not None:
+                    encoder.total = frame.meta.get('total')
+                assembler = StreamingAssembler(sink.open(), PAGE_SIZES[self.options.page_size],
+                                               total=frame.meta.get('total'),
+                                               page_numbers=page_numbers, encoder=encoder,
+                                               dpi=self.options.dpi,
+                                               workers=self.options.encode_workers,
+                                               executor=self.options.executor)
+                assembler.open()
+            if 'image' in frame.meta:
+                assembler.add_image(frame.meta['image'])
+            else:
+                assembler.add_frame(frame.data)
+
+        try:
+            await stream_frames(frames, write, self.options.queue_depth)
+        finally:
+            if assembler is not None:
+                assembler.close()
+        if encoder is not None:
+            print(encoder.summary())
+        return assembler.count if assembler else 0
+
+
+async def stream_frames(frames, write, depth=QUEUE_DEPTH):
+    """Feed an async iterator of frames to `write` on a dedicated writer thread
+
+    A queue of at most `depth` frames sits between the two, so page N is
+    encoded and written while slide N+1 is still rendering, and capture waits
+    when the writer falls behind. Returns the number of frames written.
+    """
+    import asyncio
+    import contextvars
+    from concurrent.futures import ThreadPoolExecutor
+
+    queue = asyncio.Queue(max(1, depth))
+    failure = []
+
+    async def produce():
+        try:
+            async for frame in frames:
+                await queue.put(frame)
+        except Exception as e:
+            failure.append(e)
+        await queue.put(_DONE)
+
+    loop = asyncio.get_running_loop()
+    producer = asyncio.create_task(produce())
+    # run_in_executor는 컨텍스트를 넘기지 않으므로 기록 스레드의 구간이 이 작업의 행에 오도록 복사
+    with track('writer'):
+        context = contextvars.copy_context()
+    count = 0
+    try:
+        # 기록은 한 스레드에서 순서대로 - 이벤트 루프(캡처)는 막지 않음
+        with ThreadPoolExecutor(1, thread_name_prefix='writer') as writer:
+            while True:
+                frame = await queue.get()
+                if frame is _DONE:
+                    break
+                await loop.run_in_executor(writer, context.run, write, frame)
+                count += 1
+    finally:
+        if not producer.done():
+            producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+    if failure:
+        raise failure[0]
+    return count
+
+
+class FileSink:
+    """Sink stage: the output file"""
+
+    def __init__(self, path):
+        self.path = path
+        self._fp = None
+
+    def open(self):
+        self._fp = open(self.path, 'wb')
+        return self._fp
+
+    def close(self):
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+    def describe(self):
+        return f"{self.path} ({os.path.getsize(self.path) / 1024 / 1024:.2f} MB)"
+
+
+class Pipeline:
+    """Runs source -> capture -> transforms -> assemble -> sink
+
+    Transforms are callables taking and returning a Frame (or an awaitable of
+    one); they run in order on every raster frame before assembly. A shared
+    `browser` (batch.BrowserPool) is used instead of launching one per export.
+    """
+
+    def __init__(self, options, source=None, capture=None, transforms=(), assemble=None, sink=None,
+                 browser=None):
+        self.options = options
+        self.browser = browser
+        self.source = source or HtmlSource(options.source, options.slides)
+        self.capture = capture or RasterCapture(options, browser)
+        self.transforms = list(transforms)
+        self.assemble = assemble or RasterAssemble(options)
+        self.sink = sink or FileSink(options.output)
+
+    async def transformed(self, frames):
+        for transform in self.transforms:
+            frames = self._apply(transform, frames)
+        async for frame in frames:
+            yield frame
+
+    @staticmethod
+    async def _apply(transform, frames):
+        async for frame in frames:
+            result = transform(frame)
+            if hasattr(result, '__await__'):
+                result = await result
+            yield result
+
+    async def run(self):
+        """Execute the export; returns the output path"""
+        with span('export', mode=self.options.mode, source=self.source.path):
+            if self.options.mode == 'vector':
+                from .capture import CaptureEngine
+                from .vector import export_vector_pdf
+
+                # --offline도 래스터와 같은 번들 라우팅으로 인쇄; 공유 브라우저면 컨텍스트만 닫힘
+                async with CaptureEngine(self.source.path, workers=1,
+                                         assets=self.options.asset_bundle(),
+                                         browser=self.browser) as engine:
+                    await export_vector_pdf(self.source.path, self.sink.path,
+                                            page_size=self.options.page_size, engine=engine)
+                return self.sink.path
+
+            try:
+                frames = self.transformed(self.capture.frames(self.source))
+                await self.assemble.run(frames, self.sink)
+            finally:
+                self.sink.close()
+        return self.sink.path
+
+
+async def export(source='index.html', **options):
+    """Convenience wrapper: build ExportOptions and run the default pipeline"""
+    return await Pipeline(ExportOptions(source, **options)).run()
@@ -0,0 +1,91 @@
+"""
+Page preparation workers
+Decode, resample and encode one frame into an ImageStream. Runs inline, on a
+thread pool or in worker processes; for processes the frame bytes travel
+through shared memory instead of being pickled into the task queue.
+"""
+
+import io
+from multiprocessing import shared_memory
+
+from .encode import encode_flate, encode_frame, encode_palette, opaque
+from .pdfwriter import load_image
+from .resample import downscale, downscale_frame
+from .store import StoredFrame
+
+
+def prepare_frame(data, page_size, dpi=None, encoding=None, encode=True):
+    """Resample and encode one frame; returns (format, ImageStream)
+
+    `encoding` is (mode, quality) for encode.encode_frame; without it the frame
+    is embedded losslessly, untouched ('passthrough') when no resampling was
+    needed. With `encode=False` the (possibly resampled) frame is returned as
+    (None, bytes or PIL image) for the caller to encode.
+    """
+    image = data
+    if isinstance(data, StoredFrame):
+        # 메모리 매핑된 원시 프레임 - 디코딩 없이 매핑 위의 이미지를 그대로 사용
+        if dpi:
+            mapped = data.image()
+            resampled = downscale(mapped, page_size, dpi)
+            if resampled is not mapped:
+                image = resampled
+    elif dpi:
+        resampled = downscale_frame(data, page_size, dpi)
+        if resampled is not None:
+            image = resampled
+    if not encode:
+        # StoredFrame은 위치만 돌려보내서 큰 이미지를 피클링하지 않음
+        return None, image
+    if encoding is not None:
+        return encode_frame(image, *encoding)
+    if image is data and not isinstance(data, StoredFrame):
+        return 'passthrough', load_image(data)
+    return resampled_stream(image, data)
+
+
+def resampled_stream(image, source):
+    """Lossless stream for a resampled frame that is never larger than `source`
+
+    Lanczos adds colours, so a paletted source (e.g. dithered) can grow
+    several times as RGB Flate; it is re-quantized to its palette size
+    instead, and when the source bytes are still smaller they are embedded
+    unchanged ('passthrough', at the higher resolution).
+    """
+    fmt, stream = 'flate', encode_flate(opaque(image))
+    if not isinstance(source, bytes):
+        return fmt, stream
+    original = load_image(source)
+    if isinstance(original.color_space, list):
+        # Indexed 색공간: [/Indexed /DeviceRGB hival palette]
+        palette = encode_palette(opaque(image), colors=original.color_space[2] + 1)
+        if len(palette.data) < len(stream.data):
+            fmt, stream = 'palette', palette
+    if len(original.data) <= len(stream.data):
+        return 'passthrough', original
+    return fmt, stream
+
+
+def share_frame(data):
+    """Copy frame bytes into a new shared memory block (caller unlinks it)"""
+    block = shared_memory.SharedMemory(create=True, size=max(1, len(data)))
+    block.buf[:len(data)] = data
+    return block
+
+
+def prepare_shared(name, size, page_size, dpi=None, encoding=None, encode=True):
+    """prepare_frame() for a frame stored in the shared memory block `name`"""
+    # 블록의 소유자(unlink 담당)는 부모 프로세스 - 워커는 읽고 닫기만 함
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        data = bytes(block.buf[:size])
+    finally:
+        block.close()
+
+    fmt, image = prepare_frame(data, page_size, dpi, encoding, encode)
+    if not encode and not isinstance(image, bytes):
+        # 예산 모드: 축소된 이미지를 빠른 무손실 PNG로 돌려보내고 인코딩은 기록 쪽에서
+        buffer = io.BytesIO()
+        image.save(buffer, 'PNG', compress_level=1)
+        image = buffer.getvalue()
+    return fmt, image
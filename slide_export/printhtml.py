@@ -0,0 +1,669 @@
+"""
+Print HTML layouts
+Print documents for the PDF converters (pdfkit, WeasyPrint, Chromium
+page.pdf) built from fixed layouts: A4 landscape, 16:9 full screen and an A4
+portrait handout with speaker notes. Each layout's document and slide
+templates are compiled once per process; slides are either records from
+data/slides.json or ready-made HTML fragments, and the document is produced
+as a stream of parts written with one writelines() call, so building a long
+archive is linear in the number of slides. Charts are inlined as SVG drawn by
+slide_export.charts, so the printed document needs no scripts.
+
+    layout = get_layout('handout')
+    layout.write('handout.html', slide_records(), citations=load_citations())
+
+    python -m slide_export.printhtml --layout 16:9 -o print.html
+"""
+
+import argparse
+import functools
+import html
+import json
+import os
+import re
+import sys
+
+from .manifest import load_slide_data
+
+TITLE = '가족계획: 미완의 과제 - PDF Version'
+FIELD = re.compile(r'\$(\w+)')
+
+DOCUMENT = '''<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$title</title>
+$links    <style>$css    </style>
+</head>
+<body>
+'''
+DOCUMENT_END = '''
+</body>
+</html>
+'''
+
+# data/slides.json 레코드 한 장
+SLIDE = '''
+    <div class="pdf-slide record $classes">
+        <h1>$title</h1>
+$subtitle$content$charts$notes$source        <span class="page-number">$number</span>
+    </div>
+'''
+
+# 레코드로 만든 슬라이드용 스타일 - 직접 작성한 슬라이드에는 적용되지 않도록 .record로 한정
+RECORD_CSS = '''
+        .record .subtitle {
+            font-size: 18pt;
+            margin-bottom: 10px;
+            opacity: 0.85;
+        }
+
+        .record .translation {
+            font-size: 11pt;
+            opacity: 0.75;
+        }
+
+        .record .notes {
+            display: none;
+        }
+
+        .record .chart svg {
+            display: block;
+            width: 100%;
+            height: auto;
+            max-height: 80mm;
+        }
+'''
+
+A4_CSS = '''
+        @page {
+            size: A4 landscape;
+            margin: 10mm;
+        }
+
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+
+        body {
+            font-family: 'Malgun Gothic', 'Segoe UI', sans-serif;
+            line-height: 1.6;
+            color: #333;
+            background: white;
+        }
+
+        .pdf-slide {
+            width: 277mm;
+            height: 190mm;
+            page-break-after: always;
+            page-break-inside: avoid;
+            padding: 20mm;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            position: relative;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+        }
+
+        .pdf-slide:nth-child(even) {
+            background: white;
+            color: #333;
+        }
+
+        .pdf-slide:last-child {
+            page-break-after: auto;
+        }
+
+        h1 {
+            font-size: 36pt;
+            margin-bottom: 20px;
+            text-align: center;
+        }
+
+        h2 {
+            font-size: 28pt;
+            margin-bottom: 15px;
+            color: #4a5568;
+        }
+
+        h3 {
+            font-size: 22pt;
+            margin-bottom: 10px;
+            color: #2d3748;
+        }
+
+        h4 {
+            font-size: 18pt;
+            margin-bottom: 8px;
+            color: #4a5568;
+        }
+
+        p {
+            font-size: 14pt;
+            margin-bottom: 10px;
+            line-height: 1.8;
+        }
+
+        ul, ol {
+            margin-left: 20px;
+            margin-bottom: 15px;
+        }
+
+        li {
+            font-size: 14pt;
+            margin-bottom: 8px;
+        }
+
+        .stats-box {
+            background: rgba(255,255,255,0.1);
+            padding: 15px;
+            border-radius: 10px;
+            margin: 10px 0;
+        }
+
+        .pdf-slide:nth-child(even) .stats-box {
+            background: #f7fafc;
+        }
+
+        .highlight {
+            background: #ffd93d;
+            color: #333;
+            padding: 2px 6px;
+            border-radius: 4px;
+            font-weight: bold;
+        }
+
+        .source {
+            position: absolute;
+            bottom: 20mm;
+            right: 20mm;
+            font-size: 10pt;
+            opacity: 0.8;
+        }
+
+        .page-number {
+            position: absolute;
+            bottom: 10mm;
+            right: 10mm;
+            font-size: 10pt;
+        }
+
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 20px 0;
+        }
+
+        th, td {
+            padding: 10px;
+            border: 1px solid rgba(255,255,255,0.3);
+            text-align: left;
+        }
+
+        .pdf-slide:nth-child(even) th,
+        .pdf-slide:nth-child(even) td {
+            border-color: #e2e8f0;
+        }
+'''
+
+FULLSCREEN_CSS = '''
+        @page {
+            size: 297mm 167mm;  /* 16:9 비율 */
+            margin: 0;
+        }
+
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+
+        body {
+            font-family: 'Malgun Gothic', '맑은 고딕', 'Apple SD Gothic Neo', sans-serif;
+            color: #333;
+            background: white;
+            margin: 0;
+            padding: 0;
+        }
+
+        .pdf-slide {
+            width: 297mm;
+            height: 167mm;  /* 16:9 비율 */
+            page-break-after: always;
+            page-break-inside: avoid;
+            position: relative;
+            overflow: hidden;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            align-items: center;
+            padding: 15mm;
+        }
+
+        .pdf-slide:last-child {
+            page-break-after: auto;
+        }
+
+        /* 슬라이드 1: 타이틀 */
+        .slide-title {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            text-align: center;
+        }
+
+        .slide-title h1 {
+            font-size: 48pt;
+            margin-bottom: 20mm;
+            font-weight: 700;
+        }
+
+        .slide-title .subtitle {
+            font-size: 24pt;
+            margin-bottom: 30mm;
+            opacity: 0.95;
+        }
+
+        .slide-title .features {
+            display: flex;
+            justify-content: space-around;
+            width: 100%;
+            gap: 10mm;
+        }
+
+        .slide-title .feature-box {
+            background: rgba(255,255,255,0.15);
+            padding: 10mm;
+            border-radius: 10px;
+            flex: 1;
+        }
+
+        .slide-title .feature-box h4 {
+            font-size: 18pt;
+            margin-bottom: 5mm;
+        }
+
+        .slide-title .feature-box p {
+            font-size: 12pt;
+        }
+
+        /* 일반 슬라이드 */
+        .slide-content {
+            background: white;
+            color: #333;
+        }
+
+        .slide-content h1 {
+            font-size: 36pt;
+            color: #2d3748;
+            margin-bottom: 15mm;
+            text-align: center;
+            border-bottom: 3px solid #667eea;
+            padding-bottom: 5mm;
+        }
+
+        .slide-content h2 {
+            font-size: 28pt;
+            color: #4a5568;
+            margin-bottom: 10mm;
+            margin-top: 10mm;
+        }
+
+        .slide-content h3 {
+            font-size: 22pt;
+            color: #4a5568;
+            margin-bottom: 8mm;
+            margin-top: 8mm;
+        }
+
+        .slide-content p {
+            font-size: 14pt;
+            line-height: 1.8;
+            margin-bottom: 8mm;
+        }
+
+        .slide-content ul, .slide-content ol {
+            font-size: 14pt;
+            line-height: 1.8;
+            margin-left: 10mm;
+            margin-bottom: 10mm;
+        }
+
+        .slide-content li {
+            margin-bottom: 5mm;
+        }
+
+        /* 통계 박스 */
+        .stats-container {
+            display: flex;
+            justify-content: space-around;
+            margin: 15mm 0;
+            gap: 10mm;
+        }
+
+        .stat-box {
+            background: #f7fafc;
+            border-left: 4px solid #667eea;
+            padding: 10mm;
+            flex: 1;
+            text-align: center;
+        }
+
+        .stat-number {
+            font-size: 36pt;
+            font-weight: bold;
+            color: #667eea;
+            display: block;
+            margin-bottom: 5mm;
+        }
+
+        .stat-label {
+            font-size: 12pt;
+            color: #4a5568;
+        }
+
+        /* 테이블 */
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 10mm 0;
+            font-size: 12pt;
+        }
+
+        th {
+            background: #667eea;
+            color: white;
+            padding: 5mm;
+            text-align: left;
+        }
+
+        td {
+            padding: 5mm;
+            border-bottom: 1px solid #e2e8f0;
+        }
+
+        tr:nth-child(even) {
+            background: #f7fafc;
+        }
+
+        /* 차트 컨테이너 */
+        .chart-container {
+            width: 100%;
+            height: 80mm;
+            margin: 10mm 0;
+            background: #f7fafc;
+            border-radius: 10px;
+            padding: 10mm;
+        }
+
+        /* 소스 표시 */
+        .source {
+            position: absolute;
+            bottom: 10mm;
+            right: 15mm;
+            font-size: 10pt;
+            color: #718096;
+            font-style: italic;
+        }
+
+        /* 페이지 번호 */
+        .page-number {
+            position: absolute;
+            bottom: 10mm;
+            left: 15mm;
+            font-size: 10pt;
+            color: #718096;
+        }
+
+        /* 강조 */
+        .highlight {
+            background: #ffd93d;
+            color: #333;
+            padding: 2px 6px;
+            border-radius: 4px;
+            font-weight: bold;
+        }
+
+        strong {
+            color: #667eea;
+            font-weight: 600;
+        }
+'''
+
+HANDOUT_CSS = '''
+        @page {
+            size: A4 portrait;
+            margin: 12mm;
+        }
+
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+
+        body {
+            font-family: 'Malgun Gothic', 'Segoe UI', sans-serif;
+            line-height: 1.5;
+            color: #333;
+            background: white;
+        }
+
+        /* 한 페이지에 슬라이드 세 장, 오른쪽에 메모 */
+        .pdf-slide {
+            height: 88mm;
+            page-break-inside: avoid;
+            display: grid;
+            grid-template-columns: 110mm 1fr;
+            grid-template-rows: auto auto 1fr auto;
+            column-gap: 8mm;
+            padding: 6mm;
+            margin-bottom: 3mm;
+            border: 1px solid #cbd5e0;
+            border-radius: 4px;
+            position: relative;
+        }
+
+        .pdf-slide > * {
+            grid-column: 1;
+        }
+
+        h1 {
+            font-size: 14pt;
+            color: #2d3748;
+        }
+
+        .pdf-slide .subtitle {
+            font-size: 10pt;
+            color: #4a5568;
+            margin-bottom: 3mm;
+        }
+
+        .content, .content li, .content p {
+            font-size: 9pt;
+        }
+
+        .content ul {
+            margin-left: 5mm;
+        }
+
+        .pdf-slide .translation {
+            font-size: 8pt;
+            color: #718096;
+        }
+
+        .pdf-slide .notes {
+            display: block;
+            grid-column: 2;
+            grid-row: 1 / 5;
+            font-size: 9pt;
+            color: #4a5568;
+            border-left: 1px solid #cbd5e0;
+            padding-left: 5mm;
+            background: repeating-linear-gradient(transparent 0, transparent 7mm, #e2e8f0 7mm, #e2e8f0 7.2mm);
+        }
+
+        .chart svg {
+            display: block;
+            width: 100%;
+            height: auto;
+            max-height: 35mm;
+        }
+
+        .source {
+            font-size: 7pt;
+            color: #718096;
+        }
+
+        .page-number {
+            position: absolute;
+            top: 3mm;
+            right: 4mm;
+            font-size: 8pt;
+            color: #a0aec0;
+        }
+'''
+
+LAYOUTS = {
+    'A4': {'css': A4_CSS + RECORD_CSS},
+    '16:9': {'css': FULLSCREEN_CSS + RECORD_CSS,
+             'links': ['https://unpkg.com/leaflet@1.9.4/dist/leaflet.css']},
+    'handout': {'css': HANDOUT_CSS},
+}
+
+
+def compile_template(text):
+    """Turn a `$name` template into a str.format_map renderer
+
+    Braces in the text (CSS) are kept literally; the text is scanned once here
+    instead of on every render.
+    """
+    return FIELD.sub(r'{\1}', text.replace('{', '{{').replace('}', '}}')).format_map
+
+
+def load_citations(data_dir='data'):
+    """Citation id -> short source line ("Cleland et al. (2006) The Lancet")"""
+    try:
+        with open(os.path.join(data_dir, 'citations.json'), encoding='utf-8') as f:
+            citations = json.load(f).get('citations', [])
+    except FileNotFoundError:
+        return {}
+    lines = {}
+    for citation in citations:
+        authors = citation.get('authors') or []
+        who = f"{authors[0].split()[-1]}{' et al.' if len(authors) > 1 else ''}" if authors else ''
+        year = f"({citation['year']})" if citation.get('year') else ''
+        where = citation.get('journal') or citation.get('source') or citation.get('title', '')
+        parts = (who, year, where) if who else (where, year)
+        lines[citation['id']] = ' '.join(part for part in parts if part)
+    return lines
+
+
+def slide_records(data_dir='data'):
+    """Slide records from data/slides.json in presentation order"""
+    return load_slide_data(data_dir)
+
+
+def _text_block(text, css_class):
+    """'• item' lines -> <ul>, other lines -> <p>"""
+    parts, items = [], []
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith(('•', '-')):
+            items.append(f'<li>{html.escape(line.lstrip("•- "))}</li>')
+            continue
+        if items:
+            parts.append(f"<ul>{''.join(items)}</ul>")
+            items = []
+        if line:
+            parts.append(f'<p>{html.escape(line)}</p>')
+    if items:
+        parts.append(f"<ul>{''.join(items)}</ul>")
+    return f'        <div class="{css_class}">{"".join(parts)}</div>\n' if parts else ''
+
+
+class PrintLayout:
+    """One print layout with its templates compiled
+
+    Usage:
+        layout = get_layout('A4')
+        layout.write('print.html', slide_records(), citations=load_citations())
+    """
+
+    def __init__(self, name, css, links=()):
+        self.name = name
+        self.css = css
+        self.links = list(links)
+        self._document = compile_template(DOCUMENT)
+        self._slide = compile_template(SLIDE)
+
+    def head(self, title=TITLE):
+        links = ''.join(f'    <link rel="stylesheet" href="{html.escape(url)}">\n' for url in self.links)
+        return self._document({'title': html.escape(title), 'links': links, 'css': self.css})
+
+    def slide(self, record, number, citations=None, charts=None):
+        """HTML of one data/slides.json record (`charts`: visualization id -> SVG)"""
+        content = record.get('content') or {}
+        notes = record.get('notes') or {}
+        sources = [citations[cite] for cite in record.get('citations', []) if citations and cite in citations]
+        subtitle = record.get('subtitle')
+        return self._slide({
+            'classes': 'slide-title' if number == 1 else 'slide-content',
+            'title': html.escape(record.get('title', '')),
+            'subtitle': f'        <p class="subtitle">{html.escape(subtitle)}</p>\n' if subtitle else '',
+            'content': _text_block(content.get('ko', ''), 'content')
+                       + _text_block(content.get('en', ''), 'content translation'),
+            'charts': ''.join(f'        <div class="chart">{charts[chart]}</div>\n'
+                              for chart in record.get('visualizations', []) if charts and chart in charts),
+            'notes': _text_block(notes.get('ko', ''), 'notes'),
+            'source': f'        <p class="source">{html.escape("; ".join(sources))}</p>\n' if sources else '',
+            'number': number,
+        })
+
+    def render(self, slides, citations=None, title=TITLE, charts=None):
+        """Yield the document in parts; `slides` holds records (dicts) or HTML fragments (str)"""
+        yield self.head(title)
+        for number, slide in enumerate(slides, 1):
+            yield slide if isinstance(slide, str) else self.slide(slide, slide.get('order') or number,
+                                                                  citations, charts)
+        yield DOCUMENT_END
+
+    def write(self, path, slides, citations=None, title=TITLE, charts=None):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.writelines(self.render(slides, citations, title, charts))
+        return path
+
+
+@functools.lru_cache(maxsize=None)
+def get_layout(name='A4'):
+    """Compiled PrintLayout for 'A4', '16:9' or 'handout' (built once per process)"""
+    if name not in LAYOUTS:
+        raise ValueError(f"unknown print layout {name!r} (choose from {', '.join(LAYOUTS)})")
+    return PrintLayout(name, **LAYOUTS[name])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m slide_export.printhtml',
+                                     description='Write print HTML for data/slides.json')
+    parser.add_argument('--layout', default='A4', choices=list(LAYOUTS))
+    parser.add_argument('-o', '--output', default='print_slides.html')
+    parser.add_argument('--data-dir', default='data')
+    parser.add_argument('--no-charts', dest='charts', action='store_false',
+                        help='leave out the charts drawn by slide_export.charts')
+    args = parser.parse_args(argv)
+
+    records = slide_records(args.data_dir)
+    charts = None
+    if args.charts:
+        from .charts import inline_svgs, load_visualizations
+        charts = inline_svgs(load_visualizations(args.data_dir))
+    get_layout(args.layout).write(args.output, records, load_citations(args.data_dir), charts=charts)
+    print(f"{len(records)} slides ({args.layout}) -> {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
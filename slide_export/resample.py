@@ -0,0 +1,57 @@
+"""
+Downscale-on-assembly
+Frames captured at a high device scale factor carry far more pixels than a
+printed page can use; resample them with Lanczos to a target DPI for the
+placement they get on the page before embedding
+"""
+
+import io
+
+from .assemble import fit_image
+
+DEFAULT_DPI = 200
+# 목표보다 이 비율 이하로만 크면 리샘플링하지 않음 (품질 손실 대비 이득이 적음)
+TOLERANCE = 0.1
+
+
+def effective_dpi(width, height, page_size):
+    """Pixels per inch of a `width` x `height` frame once fitted onto `page_size`"""
+    _, _, placed_width, _ = fit_image(width, height, *page_size)
+    return width / (placed_width / 72)
+
+
+def target_size(width, height, page_size, dpi):
+    """Pixel size for the frame at `dpi`, or None when it is already small enough"""
+    current = effective_dpi(width, height, page_size)
+    if current <= dpi * (1 + TOLERANCE):
+        return None
+    scale = dpi / current
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def downscale(img, page_size, dpi=DEFAULT_DPI):
+    """Lanczos-resample a PIL image to `dpi` on `page_size` (returned as-is if not needed)"""
+    from PIL import Image
+
+    size = target_size(img.width, img.height, page_size, dpi)
+    if size is None:
+        return img
+    if img.mode not in ('RGB', 'L'):
+        # 알파/팔레트는 먼저 흰 배경 RGB로 (팔레트 상태로 보간하면 색이 깨짐)
+        rgba = img.convert('RGBA')
+        flat = Image.new('RGB', rgba.size, (255, 255, 255))
+        flat.paste(rgba, mask=rgba.split()[-1])
+        img = flat
+    return img.resize(size, Image.Resampling.LANCZOS)
+
+
+def downscale_frame(data, page_size, dpi=DEFAULT_DPI):
+    """PIL image for encoded frame bytes at `dpi`, or None when no resampling is needed"""
+    from PIL import Image
+
+    img = Image.open(io.BytesIO(data))
+    # 헤더만 읽어서 판단 - 필요 없으면 디코딩하지 않음
+    if target_size(img.width, img.height, page_size, dpi) is None:
+        return None
+    img.load()
+    return downscale(img, page_size, dpi)
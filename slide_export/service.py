@@ -0,0 +1,193 @@
+"""
+Persistent warm capture service
+Keeps one browser with the presentation preloaded and accepts export jobs over
+a local HTTP API, so repeated exports only pay for rendering.
+
+Run:
+    python -m slide_export.service --port 8765 --workers 4
+
+Jobs:
+    curl -o deck.pdf   -X POST localhost:8765/export -d '{"format": "pdf"}'
+    curl -o deck.pdf   -X POST localhost:8765/export -d '{"format": "vector", "page_size": "A4"}'
+    curl -o slide3.png localhost:8765/slides/3.png
+    curl localhost:8765/health
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import time
+
+from aiohttp import web
+
+from .assemble import PAGE_SIZES as RASTER_PAGE_SIZES, StreamingAssembler
+from .cache import CaptureCache
+from .capture import CaptureEngine, default_workers
+from .settle import wait_for_settle
+from .vector import PAGE_SIZES, render_deck_pdf
+
+PORT = 8765
+STATIC_PREFIX = '/deck'
+
+
+class CaptureService:
+    """Warm CaptureEngine plus the job handlers exposed over HTTP"""
+
+    def __init__(self, source='index.html', port=PORT, workers=None, root=None, use_cache=True):
+        self.source = source
+        self.port = port
+        self.root = os.path.abspath(root or os.getcwd())
+        self.url = f'http://localhost:{port}{STATIC_PREFIX}/{source}'
+        self.engine = CaptureEngine(self.url, workers=workers)
+        self.cache = CaptureCache() if use_cache else None
+        self.lock = asyncio.Lock()
+        self.jobs = 0
+        self._source_mtime = None
+
+    def source_mtime(self):
+        try:
+            return os.path.getmtime(os.path.join(self.root, self.source))
+        except OSError:
+            return None
+
+    async def warm_up(self):
+        """Launch the browser and preload the page pool"""
+        await self.engine.start()
+        workers = self.engine.workers or default_workers(await self.engine.slide_count())
+        await self.engine.ensure_pages(workers)
+        self._source_mtime = self.source_mtime()
+
+    async def refresh(self):
+        """Reload preloaded pages if the presentation changed on disk"""
+        mtime = self.source_mtime()
+        if mtime == self._source_mtime:
+            return
+        print(f"{self.source} changed, reloading {len(self.engine.pages)} pages...")
+        await asyncio.gather(*(self._reload(page) for page in self.engine.pages))
+        self.engine.invalidate_manifest()
+        self._source_mtime = mtime
+
+    async def _reload(self, page):
+        await page.reload(wait_until='networkidle')
+        await wait_for_settle(page, timeout=self.engine.settle_timeout)
+
+    async def raster_pdf(self, indices, page_size='A4'):
+        buffer = io.BytesIO()
+        with StreamingAssembler(buffer, RASTER_PAGE_SIZES[page_size], total=len(indices)) as pdf:
+            async for _, png in self.engine.capture(indices, cache=self.cache):
+                pdf.add_frame(png)
+        return buffer.getvalue()
+
+    async def vector_pdf(self, page_size='16:9'):
+        # 인쇄 레이아웃은 페이지를 변경하므로 일회용 페이지에서 렌더링
+        page = await self.engine.open_page()
+        try:
+            return await render_deck_pdf(page, page_size, navigation=self.engine.navigation)
+        finally:
+            await page.context.close()
+
+    async def run_job(self, job):
+        """Execute one export job; returns (content_type, body)"""
+        async with self.lock:
+            await self.refresh()
+            self.jobs += 1
+            fmt = job.get('format', 'pdf')
+
+            if fmt == 'vector':
+                page_size = job.get('page_size', '16:9')
+                if page_size not in PAGE_SIZES:
+                    raise web.HTTPBadRequest(text=f'unknown page_size {page_size}')
+                return 'application/pdf', await self.vector_pdf(page_size)
+
+            slides = job.get('slides')
+            manifest = await self.engine.manifest()
+            try:
+                indices = manifest.indices(None if slides is None else [int(n) for n in slides])
+            except ValueError as e:
+                raise web.HTTPNotFound(text=str(e))
+
+            if fmt == 'png':
+                if len(indices) != 1:
+                    raise web.HTTPBadRequest(text='png export takes exactly one slide')
+                _, png = [item async for item in self.engine.capture(indices, cache=self.cache)][0]
+                return 'image/png', png
+
+            if fmt == 'pdf':
+                page_size = job.get('page_size', 'A4')
+                if page_size not in RASTER_PAGE_SIZES:
+                    raise web.HTTPBadRequest(text=f'unknown page_size {page_size}')
+                return 'application/pdf', await self.raster_pdf(indices, page_size)
+
+            raise web.HTTPBadRequest(text=f'unknown format {fmt}')
+
+    async def handle_export(self, request):
+        try:
+            job = await request.json() if request.can_read_body else {}
+        except json.JSONDecodeError:
+            raise web.HTTPBadRequest(text='job must be JSON')
+        start = time.perf_counter()
+        content_type, body = await self.run_job(job)
+        return web.Response(body=body, content_type=content_type, headers={
+            'X-Render-Seconds': f'{time.perf_counter() - start:.3f}'
+        })
+
+    async def handle_slide(self, request):
+        content_type, body = await self.run_job({
+            'format': 'png', 'slides': [request.match_info['number']]
+        })
+        return web.Response(body=body, content_type=content_type)
+
+    async def handle_health(self, request):
+        return web.json_response({
+            'source': self.source,
+            'pages': len(self.engine.pages),
+            'jobs': self.jobs,
+            'settle': self.engine.metrics.summary(),
+        })
+
+    def app(self):
+        app = web.Application()
+        app.router.add_post('/export', self.handle_export)
+        app.router.add_get(r'/slides/{number:\d+}.png', self.handle_slide)
+        app.router.add_get('/health', self.handle_health)
+        # 프레젠테이션 파일 정적 서비스 (capture_slides_as_pdf와 동일한 방식)
+        app.router.add_static(STATIC_PREFIX, path=self.root, name='static')
+        return app
+
+    async def serve(self):
+        """Start the HTTP server, warm the browser and run until cancelled"""
+        runner = web.AppRunner(self.app())
+        await runner.setup()
+        site = web.TCPSite(runner, 'localhost', self.port)
+        try:
+            await site.start()
+            print(f"Capture service listening on http://localhost:{self.port}")
+            await self.warm_up()
+            print(f"Browser warm with {len(self.engine.pages)} preloaded pages of {self.source}")
+            await asyncio.Event().wait()
+        finally:
+            await self.engine.close()
+            await runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Warm browser service for slide exports')
+    parser.add_argument('--source', default='index.html')
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--no-cache', action='store_true')
+    args = parser.parse_args()
+
+    service = CaptureService(args.source, args.port, args.workers, use_cache=not args.no_cache)
+    try:
+        asyncio.run(service.serve())
+    except KeyboardInterrupt:
+        print("\nCapture service stopped.")
+
+
+if __name__ == '__main__':
+    if os.name == 'nt':
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    main()
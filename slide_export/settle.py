@@ -0,0 +1,203 @@
+"""
+Slide settle detection
+Waits for concrete render signals on the active slide instead of fixed sleeps
+"""
+
+import os
+import time
+import urllib.parse
+
+from .trace import span
+
+# 활성 슬라이드가 안정될 때까지 프레임 단위로 확인하는 스크립트
+# Resolves with {elapsed, frames, timedOut, pending} once the active slide has
+# no running animations, pending images/fonts/tiles or chart renders and the
+# DOM has been quiet for `quietFrames` consecutive frames.
+SETTLE_SCRIPT = '''
+({ timeout, quietFrames, scope }) => new Promise(resolve => {
+    const start = performance.now();
+    const root = document.querySelector(scope) || document.body;
+    let mutated = true;
+    let quiet = 0;
+    let frames = 0;
+
+    const observer = new MutationObserver(() => { mutated = true; });
+    observer.observe(root, { subtree: true, childList: true, attributes: true, characterData: true });
+
+    const pending = () => {
+        const reasons = [];
+
+        if (document.fonts && document.fonts.status === 'loading') reasons.push('fonts');
+
+        const running = document.getAnimations ? document.getAnimations().filter(a => {
+            const target = a.effect && a.effect.target;
+            return a.playState === 'running' && target && root.contains(target)
+                && a.effect.getTiming().iterations !== Infinity;
+        }) : [];
+        if (running.length) reasons.push('transitions');
+
+        if ([...root.querySelectorAll('img')].some(img => !img.complete)) reasons.push('images');
+
+        // 오류/차단된 타일은 leaflet-tile-loaded가 붙지 않지만 complete이므로 완료로 간주
+        const tiles = root.querySelectorAll('.leaflet-tile-container img:not(.leaflet-tile-loaded)');
+        if ([...tiles].some(img => !img.complete)) reasons.push('leaflet');
+
+        if (window.Chart && Chart.getChart) {
+            const busy = [...root.querySelectorAll('canvas')].some(canvas => {
+                const chart = Chart.getChart(canvas);
+                return chart && Chart.animator && Chart.animator.running(chart);
+            });
+            if (busy) reasons.push('chartjs');
+        }
+
+        const plots = [...root.querySelectorAll('.js-plotly-plot')];
+        if (plots.some(el => !el._fullLayout || el._transitioning || !el.querySelector('.main-svg'))) {
+            reasons.push('plotly');
+        }
+
+        return reasons;
+    };
+
+    const nextFrame = callback => {
+        // 숨겨진 창에서는 rAF가 멈추므로 타이머로 보완
+        let done = false;
+        const once = () => { if (!done) { done = true; callback(); } };
+        requestAnimationFrame(once);
+        setTimeout(once, 50);
+    };
+
+    const check = () => {
+        frames += 1;
+        const elapsed = performance.now() - start;
+        const reasons = pending();
+
+        if (reasons.length || mutated) {
+            quiet = 0;
+        } else {
+            quiet += 1;
+        }
+        mutated = false;
+
+        if (quiet >= quietFrames || elapsed >= timeout) {
+            observer.disconnect();
+            resolve({ elapsed, frames, timedOut: quiet < quietFrames, pending: reasons });
+            return;
+        }
+        nextFrame(check);
+    };
+
+    nextFrame(check);
+})
+'''
+
+
+# 덱마다 슬라이드를 바꾸는 방법 ({index}: DOM의 .slide 순서, 0부터)
+NAVIGATION = {
+    # index.html, integrated-presentation.html, consolidated-presentation.html
+    'index': 'showSlide({index})',
+    # index2.html, slides_integrated.html: showSlide(n)은 n 대신 전역 currentSlide(1부터)를
+    # 표시하고 차트는 100ms 뒤에 초기화하므로 직접 호출 (초기화 함수는 중복 호출을 무시)
+    'current': 'currentSlide = {index} + 1; showSlide(currentSlide); initializeVisualizations()',
+}
+DECK_NAVIGATION = {
+    'index2.html': 'current',
+    'slides_integrated.html': 'current',
+}
+
+
+def deck_navigation(source):
+    """NAVIGATION style for a deck file or URL ('index' unless listed in DECK_NAVIGATION)"""
+    name = os.path.basename(urllib.parse.urlsplit(source.replace(os.sep, '/')).path)
+    return DECK_NAVIGATION.get(name, 'index')
+
+
+class SettleResult:
+    """Outcome of waiting for one slide to settle"""
+
+    def __init__(self, index, elapsed, frames=0, timed_out=False, pending=None):
+        self.index = index
+        self.elapsed = elapsed
+        self.frames = frames
+        self.timed_out = timed_out
+        self.pending = pending or []
+
+    def to_dict(self):
+        return {
+            'index': self.index,
+            'elapsed': round(self.elapsed, 4),
+            'frames': self.frames,
+            'timed_out': self.timed_out,
+            'pending': self.pending
+        }
+
+
+class SettleMetrics:
+    """Collects how long each slide actually took to settle"""
+
+    def __init__(self):
+        self.results = []
+
+    def record(self, result):
+        self.results.append(result)
+
+    @property
+    def total(self):
+        return sum(r.elapsed for r in self.results)
+
+    @property
+    def timed_out(self):
+        return [r for r in self.results if r.timed_out]
+
+    def summary(self):
+        """One-line summary suitable for the scripts' progress output"""
+        if not self.results:
+            return "No slides settled"
+        slowest = max(self.results, key=lambda r: r.elapsed)
+        line = (f"Settled {len(self.results)} slides in {self.total:.2f}s "
+                f"(avg {self.total / len(self.results):.2f}s, "
+                f"slowest #{slowest.index + 1} {slowest.elapsed:.2f}s)")
+        if self.timed_out:
+            slides = ', '.join(f"#{r.index + 1}" for r in self.timed_out)
+            line += f", timed out: {slides}"
+        return line
+
+    def to_list(self):
+        return [r.to_dict() for r in sorted(self.results, key=lambda r: r.index)]
+
+
+async def wait_for_settle(page, index=None, timeout=10.0, quiet_frames=3,
+                          scope='.slide.active'):
+    """Wait until the active slide on `page` (or the `scope` element) stops changing
+
+    `timeout` is in seconds. Returns a SettleResult; a slide that never goes
+    quiet is reported with timed_out=True rather than raising, so one stuck
+    map does not abort the whole export.
+    """
+    start = time.perf_counter()
+    state = await page.evaluate(SETTLE_SCRIPT, {
+        'timeout': timeout * 1000,
+        'quietFrames': quiet_frames,
+        'scope': scope
+    })
+    return SettleResult(
+        index,
+        time.perf_counter() - start,
+        frames=state.get('frames', 0),
+        timed_out=state.get('timedOut', False),
+        pending=state.get('pending', [])
+    )
+
+
+async def show_slide(page, index, timeout=10.0, metrics=None, navigation='index'):
+    """Switch `page` to slide `index` and wait for it to settle
+
+    `navigation` names the deck's convention in NAVIGATION (see deck_navigation).
+    """
+    with span('navigate', slide=index + 1):
+        await page.evaluate(NAVIGATION[navigation].format(index=index))
+    with span('settle', slide=index + 1) as s:
+        result = await wait_for_settle(page, index, timeout=timeout)
+        s.set(frames=result.frames, timed_out=result.timed_out)
+    if metrics is not None:
+        metrics.record(result)
+    return result
@@ -0,0 +1,248 @@
+"""
+Memory-mapped frame and page stores
+Large decks are kept on disk and read through mmap, so assembly and merge
+stages take zero-copy slices instead of holding every frame or PDF in RAM:
+
+    FrameStore - raw RGBA/RGB frames in a fixed-stride on-disk array
+    PageStore  - PDF byte strings packed into one file, addressed by offset
+"""
+
+import io
+import json
+import mmap
+import os
+import struct
+
+FRAME_MAGIC = b'SLFRAME1'
+# magic, width, height, channels, count
+FRAME_HEADER = struct.Struct('<8sIIII')
+FRAME_HEADER_SIZE = 64
+MODES = {3: 'RGB', 4: 'RGBA'}
+
+# 프로세스마다 열어둔 매핑 (워커 프로세스에서 프레임마다 다시 열지 않도록)
+_maps = {}
+
+
+def map_file(path):
+    """Read-only mmap of a whole file (b'' for an empty file)"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _mapped(path, size):
+    """Shared read-only mapping of `path` covering at least `size` bytes"""
+    mapped = _maps.get(path)
+    if mapped is None or len(mapped) < size:
+        # 파일이 커졌으면 다시 매핑 (이전 매핑은 참조가 없어지면 해제됨)
+        mapped = _maps[path] = map_file(path)
+    return mapped
+
+
+class MappedReader(io.RawIOBase):
+    """Seekable file object over a slice of a mapping (no copy until read)"""
+
+    def __init__(self, buffer, offset=0, length=None):
+        self._view = memoryview(buffer)[offset:None if length is None else offset + length]
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, b):
+        n = min(len(b), len(self._view) - self._pos)
+        b[:n] = self._view[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: len(self._view)}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def close(self):
+        self._view.release()
+        super().close()
+
+
+class StoredFrame:
+    """Reference to one frame of a FrameStore; cheap to pickle to worker processes"""
+
+    def __init__(self, path, index, width, height, channels):
+        self.path = path
+        self.index = index
+        self.width = width
+        self.height = height
+        self.channels = channels
+
+    @property
+    def stride(self):
+        return self.width * self.height * self.channels
+
+    @property
+    def offset(self):
+        return FRAME_HEADER_SIZE + self.index * self.stride
+
+    def view(self):
+        """memoryview of the raw pixels inside the mapping"""
+        mapped = _mapped(self.path, self.offset + self.stride)
+        return memoryview(mapped)[self.offset:self.offset + self.stride]
+
+    def image(self):
+        """PIL image backed directly by the mapping (read-only)"""
+        from PIL import Image
+
+        mode = MODES[self.channels]
+        return Image.frombuffer(mode, (self.width, self.height), self.view(), 'raw', mode, 0, 1)
+
+
+class FrameStore:
+    """Fixed-stride on-disk array of raw frames
+
+    Usage:
+        with FrameStore('frames.bin', 1920, 1080, create=True) as store:
+            store.append(png_bytes)
+        assemble_pdf(FrameStore('frames.bin'), 'deck.pdf')
+    """
+
+    def __init__(self, path, width=None, height=None, channels=4, create=False):
+        self.path = os.path.abspath(path)
+        self._fp = None
+        if create:
+            self.width, self.height, self.channels, self.count = width, height, channels, 0
+            self._fp = open(self.path, 'w+b')
+            self._write_header()
+        else:
+            with open(self.path, 'rb') as f:
+                magic, self.width, self.height, self.channels, self.count = \
+                    FRAME_HEADER.unpack(f.read(FRAME_HEADER.size))
+            if magic != FRAME_MAGIC:
+                raise ValueError(f'{path} is not a frame store')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def stride(self):
+        return self.width * self.height * self.channels
+
+    def _write_header(self):
+        self._fp.seek(0)
+        header = FRAME_HEADER.pack(FRAME_MAGIC, self.width, self.height, self.channels, self.count)
+        self._fp.write(header.ljust(FRAME_HEADER_SIZE, b'\0'))
+
+    def append(self, frame):
+        """Store a frame (encoded bytes or PIL image), converted to the store's size and mode"""
+        from PIL import Image
+
+        img = Image.open(io.BytesIO(frame)) if isinstance(frame, (bytes, bytearray)) else frame
+        img = img.convert(MODES[self.channels])
+        if img.size != (self.width, self.height):
+            img = img.resize((self.width, self.height), Image.Resampling.LANCZOS)
+        self._fp.seek(FRAME_HEADER_SIZE + self.count * self.stride)
+        self._fp.write(img.tobytes())
+        self.count += 1
+        self._write_header()
+        return self.count - 1
+
+    def close(self):
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if not -self.count <= index < self.count:
+            raise IndexError(index)
+        if self._fp is not None:
+            self._fp.flush()
+        return StoredFrame(self.path, index % self.count, self.width, self.height, self.channels)
+
+    def __iter__(self):
+        return (self[i] for i in range(self.count))
+
+
+class PageStore:
+    """PDF byte strings (e.g. one `page.pdf()` per slide) packed into one file
+
+    Offsets and lengths live in a JSON sidecar; `open(i)` returns a seekable
+    reader over the mapped bytes, which PyPDF2 can parse without a copy.
+    """
+
+    def __init__(self, path, create=False):
+        self.path = os.path.abspath(path)
+        self.index_path = self.path + '.json'
+        self.entries = []
+        self._fp = None
+        self._map = None
+        if create:
+            self._fp = open(self.path, 'wb')
+        else:
+            with open(self.index_path, encoding='utf-8') as f:
+                self.entries = json.load(f)['entries']
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def append(self, data, key=None):
+        """Store one PDF; returns its position"""
+        offset = self._fp.tell()
+        self._fp.write(data)
+        self.entries.append({'key': key, 'offset': offset, 'length': len(data)})
+        return len(self.entries) - 1
+
+    def _save(self):
+        tmp = self.index_path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'entries': self.entries}, f)
+        os.replace(tmp, self.index_path)
+
+    def close(self):
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+            self._save()
+        # 매핑은 열린 reader가 모두 사라질 때 해제됨
+        self._map = None
+
+    def discard(self):
+        """Close the store and delete its files"""
+        self.close()
+        for path in (self.path, self.index_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def open(self, index):
+        """Buffered, seekable reader over the bytes of entry `index`"""
+        if self._fp is not None:
+            self._fp.flush()
+            if self._map is not None and len(self._map) < self._fp.tell():
+                self._map = None
+        if self._map is None:
+            self._map = map_file(self.path)
+        entry = self.entries[index]
+        return io.BufferedReader(MappedReader(self._map, entry['offset'], entry['length']))
+
+    def __iter__(self):
+        return (self.open(i) for i in range(len(self.entries)))
+
+    def keys(self):
+        return [entry['key'] for entry in self.entries]
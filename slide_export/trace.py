@@ -0,0 +1,248 @@
+"""
+Export tracing
+Spans for browser launch, page load, per-slide navigate/settle/capture,
+encode and write, each recording its duration, byte count and change in
+resident memory. Nothing is recorded unless a Tracer is active, so the span()
+calls in the stages cost one global lookup when tracing is off.
+
+    with Tracer() as tracer:
+        await pipeline.run()
+    tracer.write_jsonl('export.trace.jsonl')
+    tracer.write_chrome('export.trace.json')   # chrome://tracing or ui.perfetto.dev
+
+Concurrent capture pages get their own rows through track(); spans recorded
+in worker processes are sent back with the result (see call_traced).
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+
+TRACE_ENV = 'SLIDE_EXPORT_TRACE'
+
+_active = None
+# 비동기 작업마다 따로 보이도록 (캡처 페이지별 행)
+_track = contextvars.ContextVar('slide_export_track', default=None)
+
+try:
+    _PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+except (AttributeError, ValueError, OSError):
+    _PAGE_SIZE = None
+
+
+def current_rss():
+    """Resident set size of this process in bytes (None where /proc is unavailable)"""
+    if _PAGE_SIZE is None:
+        return None
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+class Tracer:
+    """Collects spans from every thread of this process while active"""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+        self.spans = []
+        self._lock = threading.Lock()
+        self._previous = None
+
+    def __enter__(self):
+        global _active
+        self._previous, _active = _active, self
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        global _active
+        _active = self._previous
+
+    def add(self, name, start, end, args=None, rss=None, track=None, pid=None):
+        """Record a finished span (`start`/`end` are time.perf_counter() values)"""
+        span = {
+            'name': name,
+            'start': round(start - self.origin, 6),
+            'duration': round(end - start, 6),
+            'rss_delta': rss,
+            'pid': pid or self.pid,
+            'track': track or threading.current_thread().name,
+            'args': args or {},
+        }
+        with self._lock:
+            self.spans.append(span)
+
+    def totals(self):
+        """{name: {'count', 'total', 'max'}} in seconds"""
+        totals = {}
+        for span in self.spans:
+            total = totals.setdefault(span['name'], {'count': 0, 'total': 0.0, 'max': 0.0})
+            total['count'] += 1
+            total['total'] = round(total['total'] + span['duration'], 6)
+            total['max'] = max(total['max'], span['duration'])
+        return totals
+
+    def slowest(self, count=5):
+        """The longest per-slide/per-page spans"""
+        items = [span for span in self.spans if 'slide' in span['args'] or 'page' in span['args']]
+        return sorted(items, key=lambda span: span['duration'], reverse=True)[:count]
+
+    def summary(self, count=5):
+        """Human readable lines: time per stage, then the slowest individual spans"""
+        lines = [f"{name:>14}  {t['total']:8.2f}s  x{t['count']:<5} max {t['max']:.2f}s"
+                 for name, t in sorted(self.totals().items(), key=lambda item: -item[1]['total'])]
+        for span in self.slowest(count):
+            detail = ' '.join(f'{key}={value}' for key, value in span['args'].items())
+            lines.append(f"  slow: {span['name']} {span['duration']:.2f}s {detail}".rstrip())
+        return lines
+
+    def write_jsonl(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            for span in sorted(self.spans, key=lambda span: span['start']):
+                f.write(json.dumps(span, ensure_ascii=False) + '\n')
+
+    def write_chrome(self, path):
+        """Chrome trace-event format ('X' complete events, one row per track)"""
+        tids = {}
+        events = []
+        for span in sorted(self.spans, key=lambda span: span['start']):
+            key = (span['pid'], span['track'])
+            if key not in tids:
+                tids[key] = len(tids) + 1
+                events.append({'ph': 'M', 'name': 'thread_name', 'pid': span['pid'],
+                               'tid': tids[key], 'args': {'name': span['track']}})
+            args = dict(span['args'])
+            if span['rss_delta'] is not None:
+                args['rss_delta'] = span['rss_delta']
+            events.append({'ph': 'X', 'name': span['name'], 'cat': 'export',
+                           'ts': round(span['start'] * 1e6), 'dur': round(span['duration'] * 1e6),
+                           'pid': span['pid'], 'tid': tids[key], 'args': args})
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+
+    def write(self, path):
+        """JSON lines for *.jsonl, Chrome trace format otherwise"""
+        if path.endswith('.jsonl'):
+            self.write_jsonl(path)
+        else:
+            self.write_chrome(path)
+
+
+class Span:
+    """Context manager for one span; set() attaches byte counts and other details"""
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def set(self, **args):
+        self.args.update(args)
+
+    def __enter__(self):
+        self.rss = current_rss()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        rss = current_rss()
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.tracer.add(self.name, self.start, end, self.args,
+                        None if rss is None or self.rss is None else rss - self.rss, _track.get())
+
+
+class _NoSpan:
+    def set(self, **args):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+def active():
+    return _active
+
+
+def span(name, **args):
+    """Span on the active tracer (a no-op when tracing is off)"""
+    if _active is None:
+        return _NO_SPAN
+    return Span(_active, name, args)
+
+
+class track:
+    """Put spans of the current task/thread on their own row, e.g. track('page 2')
+
+    Nested tracks are joined ('job 3 / page 2') so rows stay distinct when
+    several exports run at once.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        parent = _track.get()
+        self._token = _track.set(f'{parent} / {self.name}' if parent else self.name)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _track.reset(self._token)
+
+
+def call_traced(name, args, fn, *fn_args):
+    """Run fn on a pool worker and return (result, span) for Tracer.add
+
+    Works for thread and process pools; in a process the active tracer of the
+    parent is not available, so the span travels back with the result.
+    """
+    import multiprocessing
+
+    rss = current_rss()
+    start = time.perf_counter()
+    result = fn(*fn_args)
+    end = time.perf_counter()
+    after = current_rss()
+    # perf_counter는 시스템 전체 단조 시계라 부모 프로세스 기준으로 바로 변환 가능
+    return result, {'name': name, 'start': start, 'end': end, 'args': args,
+                    'rss': None if rss is None or after is None else after - rss,
+                    'track': f'worker {os.getpid()}' if multiprocessing.parent_process()
+                    else threading.current_thread().name,
+                    'pid': os.getpid()}
+
+
+class tracing:
+    """Trace the enclosed block and write the result to `path` (no-op without a path)
+
+    Used by the CLI (--trace) and the scripts (SLIDE_EXPORT_TRACE=<path>).
+    """
+
+    def __init__(self, path=None, summary=True):
+        self.path = path if path is not None else os.environ.get(TRACE_ENV)
+        self.summary = summary
+        self.tracer = None
+
+    def __enter__(self):
+        if self.path:
+            self.tracer = Tracer().__enter__()
+        return self.tracer
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.tracer is None:
+            return
+        self.tracer.__exit__(exc_type, exc, tb)
+        self.tracer.write(self.path)
+        if self.summary:
+            print('\n'.join(self.tracer.summary()))
+            print(f"Trace written to {self.path}")
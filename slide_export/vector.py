@@ -0,0 +1,186 @@
+"""
+Vector-native single-pass PDF export
+Switches the loaded deck into a print layout (every `.slide` visible, one per
+page) and emits the whole presentation from a single `page.pdf()` call, so
+fonts are subset and embedded once for the document. export_slide_pdfs keeps
+the older per-slide print for decks that need it: each slide is printed on
+the capture engine's page pool and the pages are merged in memory.
+"""
+
+from .manifest import EmptyDeck
+from .settle import wait_for_settle
+from .trace import span
+
+SLIDE_WIDTH = 1920
+SLIDE_HEIGHT = 1080
+
+# page.pdf() 옵션 - 16:9는 슬라이드 픽셀 크기 그대로, A4는 가로 방향으로 축소
+PAGE_SIZES = {
+    '16:9': {'width': f'{SLIDE_WIDTH}px', 'height': f'{SLIDE_HEIGHT}px', 'scale': 1},
+    'A4': {'format': 'A4', 'landscape': True, 'scale': round(1122.52 / SLIDE_WIDTH, 4)},
+}
+
+PRINT_CSS = '''
+@page { margin: 0; }
+html, body {
+    width: auto !important;
+    height: auto !important;
+    overflow: visible !important;
+    background: #fff !important;
+}
+.presentation-container, .presentation-viewport {
+    position: static !important;
+    display: block !important;
+    width: auto !important;
+    height: auto !important;
+    max-width: none !important;
+    max-height: none !important;
+    overflow: visible !important;
+    box-shadow: none !important;
+    background: none !important;
+}
+.slide {
+    position: relative !important;
+    display: flex !important;
+    flex-direction: column;
+    width: %(width)dpx !important;
+    height: %(height)dpx !important;
+    break-after: page;
+    page-break-after: always;
+    break-inside: avoid;
+}
+.slide.print-last {
+    break-after: auto;
+    page-break-after: auto;
+}
+.pdf-export-btn, .pdf-progress, .page-counter, .nav-dots, .slide-counter {
+    display: none !important;
+}
+'''
+
+# 모든 슬라이드를 보이게 한 뒤 차트/지도를 한 번씩 초기화
+# ('current' 덱은 전역 currentSlide 기준으로 initializeVisualizations가 초기화 - settle.NAVIGATION)
+PRINT_LAYOUT_SCRIPT = '''
+([css, navigation]) => {
+    const style = document.createElement('style');
+    style.id = 'print-layout';
+    style.textContent = css;
+    document.head.appendChild(style);
+
+    const slides = [...document.querySelectorAll('.slide')];
+    slides.forEach(slide => slide.classList.add('active'));
+    if (slides.length) slides[slides.length - 1].classList.add('print-last');
+
+    // 인쇄용이므로 차트 애니메이션 없이 최종 상태로 그림
+    if (window.Chart && Chart.defaults) Chart.defaults.animation = false;
+
+    if (navigation === 'current' && typeof initializeVisualizations === 'function') {
+        slides.forEach((_, i) => {
+            try {
+                currentSlide = i + 1;
+                initializeVisualizations();
+            } catch (e) { console.warn('initializeVisualizations', i, e); }
+        });
+    } else if (typeof initSlideContent === 'function') {
+        slides.forEach((_, i) => {
+            try { initSlideContent(i); } catch (e) { console.warn('initSlideContent', i, e); }
+        });
+    }
+    if (typeof maps !== 'undefined') {
+        Object.values(maps).forEach(map => map && map.invalidateSize && map.invalidateSize());
+    }
+    return slides.length;
+}
+'''
+
+
+async def apply_print_layout(page, timeout=30.0, navigation='index'):
+    """Put the deck loaded in `page` into print layout; returns the slide count
+
+    `navigation` is the deck's settle.NAVIGATION style, which decides how
+    each slide's charts and maps are initialised.
+    """
+    css = PRINT_CSS % {'width': SLIDE_WIDTH, 'height': SLIDE_HEIGHT}
+    await page.emulate_media(media='print')
+    count = await page.evaluate(PRINT_LAYOUT_SCRIPT, [css, navigation])
+    await wait_for_settle(page, timeout=timeout, scope='body')
+    return count
+
+
+async def render_deck_pdf(page, page_size='16:9', path=None, navigation='index'):
+    """Render the whole deck in `page` to one vector PDF; returns the PDF bytes"""
+    if page_size not in PAGE_SIZES:
+        raise ValueError(f"Unknown page size '{page_size}' (expected one of {', '.join(PAGE_SIZES)})")
+    with span('print layout') as s:
+        count = await apply_print_layout(page, navigation=navigation)
+        s.set(slides=count)
+    if not count:
+        raise EmptyDeck(f"{page.url} has no .slide elements")
+    with span('print', page_size=page_size) as s:
+        pdf = await page.pdf(
+            path=path,
+            print_background=True,
+            margin={'top': '0', 'right': '0', 'bottom': '0', 'left': '0'},
+            display_header_footer=False,
+            prefer_css_page_size=False,
+            **PAGE_SIZES[page_size]
+        )
+        s.set(bytes=len(pdf))
+    return pdf
+
+
+async def print_slide(page, index, page_size='16:9'):
+    """Render step for CaptureEngine.capture: the slide shown in `page` as a one-page PDF"""
+    with span('print', slide=index + 1, page_size=page_size) as s:
+        pdf = await page.pdf(
+            print_background=True,
+            margin={'top': '0', 'right': '0', 'bottom': '0', 'left': '0'},
+            display_header_footer=False,
+            prefer_css_page_size=False,
+            page_ranges='1',
+            **PAGE_SIZES[page_size]
+        )
+        s.set(bytes=len(pdf))
+    return pdf
+
+
+async def export_slide_pdfs(source='index.html', output_file='FamilyPlanning_Native.pdf',
+                            page_size='A4', slides=None, workers=None, assets=None):
+    """Print every slide on its own page and merge them into `output_file`
+
+    `slides` are 1-based slide numbers (default: all). Returns the
+    merge.merge_pdf_buffers statistics.
+    """
+    from .capture import CaptureEngine
+    from .merge import merge_pdf_buffers
+
+    if page_size not in PAGE_SIZES:
+        raise ValueError(f"Unknown page size '{page_size}' (expected one of {', '.join(PAGE_SIZES)})")
+    async with CaptureEngine(source, workers=workers, assets=assets) as engine:
+        indices = (await engine.manifest()).indices(slides)
+        pages = [pdf async for _, pdf in engine.capture(indices, render=print_slide, page_size=page_size)]
+    if not pages:
+        raise EmptyDeck(f"{source} has no .slide elements")
+    return merge_pdf_buffers(pages, output_file)
+
+
+async def export_vector_pdf(source='index.html', output_file='FamilyPlanning_NativePresentation.pdf',
+                            page_size='16:9', engine=None, assets=None):
+    """Export `source` as a single vector PDF with one browser print
+
+    `assets` (bundle.AssetBundle) serves external requests from vendor/ when
+    no `engine` is given.
+    """
+    from .capture import CaptureEngine
+
+    if engine is None:
+        async with CaptureEngine(source, workers=1, assets=assets) as engine:
+            return await export_vector_pdf(source, output_file, page_size, engine)
+
+    # 인쇄 레이아웃은 페이지를 변경하므로 풀과 별도의 페이지를 사용
+    page = await engine.open_page()
+    try:
+        await render_deck_pdf(page, page_size, path=output_file, navigation=engine.navigation)
+    finally:
+        await page.context.close()
+    return output_file
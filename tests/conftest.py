@@ -0,0 +1,51 @@
+"""
+Shared fixtures for the Python tests (slide_export and the root scripts)
+    python -m pytest -q
+"""
+
+import io
+import os
+import random
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def png_bytes(img, **options):
+    buffer = io.BytesIO()
+    img.save(buffer, 'PNG', **options)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def flat_image():
+    """Slide-like frame with a handful of colours"""
+    from PIL import Image
+
+    img = Image.new('RGB', (320, 180), (20, 40, 200))
+    img.paste((255, 255, 255), (40, 40, 200, 120))
+    img.paste((230, 120, 30), (220, 60, 300, 160))
+    return img
+
+
+@pytest.fixture
+def photo_image():
+    """Smooth, colourful frame (high entropy, few edges)"""
+    from PIL import Image, ImageFilter
+
+    gray = Image.effect_noise((40, 24), 80)
+    small = Image.merge('RGB', [gray, gray.rotate(90), gray.transpose(Image.FLIP_LEFT_RIGHT)])
+    return small.resize((640, 384), Image.BICUBIC).filter(ImageFilter.GaussianBlur(2))
+
+
+@pytest.fixture
+def noise_image():
+    """Many colours and sharp edges everywhere (text-like for the encoder)"""
+    from PIL import Image
+
+    rng = random.Random(1)
+    return Image.frombytes('RGB', (320, 192), bytes(rng.getrandbits(8) for _ in range(320 * 192 * 3)))
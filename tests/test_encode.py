@@ -0,0 +1,76 @@
+"""
+slide_export.encode: per-frame format choice and the byte budget
+"""
+
+import io
+
+import pytest
+
+from conftest import png_bytes
+from slide_export.encode import AdaptiveEncoder, analyze, encode_frame
+from slide_export.pdfwriter import png_image
+
+pytest.importorskip('PIL')
+
+
+def test_frame_analysis(flat_image, photo_image, noise_image):
+    assert analyze(flat_image).choose() == 'palette'
+    assert analyze(photo_image).choose() == 'jpeg'
+    assert analyze(noise_image).choose() == 'flate'
+
+
+@pytest.mark.parametrize('mode, expected', [
+    ('auto', {'palette': 1, 'flate': 1, 'jpeg': 1}),
+    ('lossless', {'palette': 1, 'flate': 2, 'jpeg': 0}),
+    ('jpeg', {'palette': 0, 'flate': 0, 'jpeg': 3}),
+])
+def test_mode_choices(flat_image, photo_image, noise_image, mode, expected):
+    encoder = AdaptiveEncoder(mode)
+    for img in (flat_image, photo_image, noise_image):
+        encoder.encode(png_bytes(img))
+    assert encoder.pages == 3
+    assert encoder.formats == expected
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        AdaptiveEncoder('webp')
+
+
+def test_opaque_png_is_passed_through(noise_image):
+    data = png_bytes(noise_image)
+    fmt, image = encode_frame(data, 'lossless')
+    assert fmt == 'flate'
+    # IDAT 청크를 이어 붙인 그대로
+    assert image.data == png_image(data).data
+
+
+def test_jpeg_input_is_not_recompressed(photo_image):
+    buffer = io.BytesIO()
+    photo_image.save(buffer, 'JPEG', quality=70)
+    fmt, image = encode_frame(buffer.getvalue())
+    assert fmt == 'jpeg'
+    assert image.data == buffer.getvalue()
+
+
+def test_budget_is_shared_between_pages(noise_image):
+    frames = [png_bytes(noise_image)] * 4
+    unlimited = AdaptiveEncoder('auto')
+    for frame in frames:
+        unlimited.encode(frame)
+
+    budget = unlimited.used // 4
+    encoder = AdaptiveEncoder('auto', budget=budget, total=len(frames))
+    assert encoder.page_budget() == budget / 4
+    for frame in frames:
+        encoder.encode(frame)
+    # 예산을 넘는 페이지는 JPEG 품질을 낮춰 다시 인코딩
+    assert encoder.formats['jpeg'] == 4
+    assert encoder.used <= budget
+    assert 'budget' in encoder.summary()
+
+
+def test_lossless_ignores_budget(noise_image):
+    encoder = AdaptiveEncoder('lossless', budget=1, total=1)
+    encoder.encode(png_bytes(noise_image))
+    assert encoder.formats == {'palette': 0, 'flate': 1, 'jpeg': 0}
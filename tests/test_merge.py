@@ -0,0 +1,86 @@
+"""
+slide_export.merge / incremental: shared-object deduplication and
+incremental merges
+"""
+
+import io
+
+import pytest
+
+from conftest import png_bytes
+from slide_export.incremental import merge_incremental
+from slide_export.merge import merge_pdf_buffers
+from slide_export.pdfwriter import PdfWriter, load_image
+
+# 병합은 PyPDF2로 읽고, 결과는 pypdf strict 모드로 검증
+pytest.importorskip('PyPDF2')
+pypdf = pytest.importorskip('pypdf')
+
+
+def slide_pdf(img, label):
+    """One-page PDF showing `img` with a Helvetica caption, as page.pdf() would return"""
+    buffer = io.BytesIO()
+    writer = PdfWriter(buffer)
+    image = load_image(png_bytes(img))
+    xobject = writer.add_image(image)
+    content = (f'q {image.width} 0 0 {image.height} 0 0 cm /Im0 Do Q '
+               f'BT /F1 12 Tf 10 10 Td ({label}) Tj ET').encode()
+    writer.add_page(image.width, image.height, content,
+                    {'XObject': {'Im0': xobject}, 'Font': {'F1': writer.font()}})
+    writer.close()
+    return buffer.getvalue()
+
+
+def xobject_ref(page):
+    return page['/Resources'].raw_get('/XObject').get_object().raw_get('/Im0').idnum
+
+
+def test_identical_resources_are_stored_once(tmp_path, flat_image, photo_image):
+    sources = [slide_pdf(flat_image, 'one'), slide_pdf(flat_image, 'two'), slide_pdf(photo_image, 'three')]
+    output = tmp_path / 'merged.pdf'
+    stats = merge_pdf_buffers(sources, str(output))
+
+    assert stats['pages'] == 3
+    # 같은 이미지와 글꼴은 한 번만 (2번 슬라이드의 이미지, 2·3번 슬라이드의 글꼴)
+    assert stats['duplicates'] >= 3
+    assert stats['bytes_saved'] >= len(load_image(png_bytes(flat_image)).data)
+
+    reader = pypdf.PdfReader(str(output), strict=True)
+    assert len(reader.pages) == 3
+    first, second, third = reader.pages
+    assert xobject_ref(first) == xobject_ref(second) != xobject_ref(third)
+    assert [page.extract_text() for page in reader.pages] == ['one', 'two', 'three']
+
+
+def test_merge_accepts_paths_and_file_objects(tmp_path, flat_image):
+    path = tmp_path / 'slide.pdf'
+    path.write_bytes(slide_pdf(flat_image, 'a'))
+    output = io.BytesIO()
+    stats = merge_pdf_buffers([str(path), io.BytesIO(slide_pdf(flat_image, 'b'))], output)
+    assert stats['pages'] == 2
+    assert len(pypdf.PdfReader(io.BytesIO(output.getvalue()), strict=True).pages) == 2
+
+
+def test_incremental_merge_appends_changed_slides(tmp_path, flat_image, photo_image):
+    output = str(tmp_path / 'deck.pdf')
+    slides = [('slide-1', slide_pdf(flat_image, 'one')), ('slide-2', slide_pdf(flat_image, 'two'))]
+
+    assert merge_incremental(slides, output)['mode'] == 'full'
+    first = open(output, 'rb').read()
+    assert merge_incremental(slides, output)['mode'] == 'unchanged'
+
+    slides[1] = ('slide-2', slide_pdf(photo_image, 'changed'))
+    stats = merge_incremental(slides, output)
+    assert (stats['mode'], stats['rewritten']) == ('update', 1)
+
+    data = open(output, 'rb').read()
+    assert data.startswith(first)
+    reader = pypdf.PdfReader(io.BytesIO(data), strict=True)
+    assert [page.extract_text() for page in reader.pages] == ['one', 'changed']
+    assert reader.trailer['/Prev'] == int(first.rsplit(b'startxref', 1)[1].split()[0])
+
+    # 슬라이드 목록이 바뀌면 전체 재생성 (/Prev 없음)
+    stats = merge_incremental(slides[:1], output)
+    assert stats['mode'] == 'full'
+    assert '/Prev' not in pypdf.PdfReader(output, strict=True).trailer
+    assert (tmp_path / 'deck.pdf.index.json').exists()
@@ -0,0 +1,105 @@
+"""
+slide_export.pdfwriter: image passthrough and incremental updates, checked
+with pypdf in strict mode
+"""
+
+import io
+
+import pytest
+
+from conftest import png_bytes
+from slide_export.pdfwriter import PdfUpdate, PdfWriter, jpeg_image, load_image, png_image
+
+pypdf = pytest.importorskip('pypdf')
+
+
+def image_page(writer, image, ref=None):
+    xobject = writer.add_image(image)
+    content = f'q {image.width} 0 0 {image.height} 0 0 cm /Im0 Do Q'.encode()
+    return writer.add_page(image.width, image.height, content, {'XObject': {'Im0': xobject}}, ref=ref)
+
+
+def write_pdf(*images):
+    buffer = io.BytesIO()
+    writer = PdfWriter(buffer)
+    for image in images:
+        image_page(writer, image)
+    writer.close()
+    return buffer.getvalue(), writer
+
+
+def read_strict(data):
+    return pypdf.PdfReader(io.BytesIO(data), strict=True)
+
+
+def decoded(reader, page=0):
+    return reader.pages[page].images[0].image.convert('RGB')
+
+
+@pytest.mark.parametrize('mode', ['RGB', 'L', 'P'])
+def test_png_idat_is_passed_through(flat_image, mode):
+    source = flat_image.convert(mode)
+    data = png_bytes(source)
+    image = png_image(data)
+    assert image.filter_name == 'FlateDecode'
+    assert image.decode_parms['Predictor'] == 15
+    # IDAT 그대로 - 다시 압축하지 않음
+    assert image.data in data
+
+    pdf, _ = write_pdf(image)
+    assert decoded(read_strict(pdf)).tobytes() == source.convert('RGB').tobytes()
+
+
+def test_png_with_alpha_is_flattened(flat_image):
+    rgba = flat_image.convert('RGBA')
+    rgba.putpixel((0, 0), (0, 0, 0, 0))
+    image = png_image(png_bytes(rgba))
+    assert image.decode_parms is None
+    pdf, _ = write_pdf(image)
+    assert decoded(read_strict(pdf)).getpixel((0, 0)) == (255, 255, 255)
+
+
+def test_jpeg_is_passed_through(photo_image):
+    buffer = io.BytesIO()
+    photo_image.save(buffer, 'JPEG', quality=80)
+    data = buffer.getvalue()
+    image = jpeg_image(data)
+    assert (image.width, image.height) == photo_image.size
+    assert image.filter_name == 'DCTDecode'
+    assert image.data == data
+
+    pdf, _ = write_pdf(image)
+    page = read_strict(pdf).pages[0]
+    stream = page['/Resources']['/XObject']['/Im0'].get_object()
+    assert stream['/Filter'] == '/DCTDecode'
+    assert stream._data == data
+    assert page.images[0].image.size == photo_image.size
+
+
+def test_load_image_sniffs_format(flat_image):
+    assert load_image(png_bytes(flat_image)).filter_name == 'FlateDecode'
+    buffer = io.BytesIO()
+    flat_image.save(buffer, 'JPEG')
+    assert load_image(buffer.getvalue()).filter_name == 'DCTDecode'
+
+
+def test_incremental_update_replaces_page(flat_image, photo_image):
+    first, writer = write_pdf(load_image(png_bytes(flat_image)), load_image(png_bytes(flat_image)))
+    second_page = writer.page_refs[1]
+
+    buffer = io.BytesIO(first)
+    buffer.seek(0, io.SEEK_END)
+    update = PdfUpdate(buffer, writer.catalog.num, writer.pages.num, writer.next_num,
+                       writer.startxref, writer.fonts)
+    image_page(update, load_image(png_bytes(photo_image)), ref=second_page)
+    update.close()
+    data = buffer.getvalue()
+
+    # 기존 내용은 그대로 두고 뒤에 덧붙임
+    assert data.startswith(first)
+    reader = read_strict(data)
+    assert len(reader.pages) == 2
+    assert reader.trailer['/Prev'] == writer.startxref
+    assert reader.trailer['/Size'] == update.next_num
+    assert decoded(reader, 0).tobytes() == flat_image.tobytes()
+    assert decoded(reader, 1).size == photo_image.size
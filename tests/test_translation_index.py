@@ -0,0 +1,116 @@
+"""
+translation_index.AlignmentIndex: lookups and incremental rescans
+"""
+
+import os
+
+import pytest
+
+import translation_index
+from translation_index import AlignmentIndex
+
+RAW = """# Family Planning: The Unfinished Agenda
+## 가족계획: 미완의 과제
+
+## Abstract
+### 요약
+
+| English Original | 한글 번역 |
+|------------------|----------|
+| Family planning saves lives. Access varies, e.g. by region. | 가족계획은 생명을 구한다. 접근성은 지역마다 다르다. |
+| Unmet need remains high. | 충족되지 않은 수요는 여전히 높다. |
+
+## Health Benefits
+### 건강상의 혜택
+
+| Contraception reduces maternal deaths. | 피임은 모성 사망을 줄인다. |
+"""
+
+UNIFIED = """| English Original | 한글 번역 |
+|------------------|----------|
+| **ABSTRACT** | **요약** |
+| Family planning saves lives. Access varies, e.g. by region. | 가족계획은 생명을 구한다. 접근성은 지역마다 다르다. |
+| Funding has stalled. | 재정 지원이 정체되었다. |
+"""
+
+
+@pytest.fixture
+def sources(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'translate.md').write_text(RAW, encoding='utf-8')
+    (tmp_path / 'translate_unified.md').write_text(UNIFIED, encoding='utf-8')
+    return ('translate.md', 'translate_unified.md')
+
+
+def test_lookups(sources):
+    index = AlignmentIndex.open(sources)
+    assert index.translate('Unmet need remains high.') == '충족되지 않은 수요는 여전히 높다.'
+    # 대소문자, 공백, 끝 문장부호는 무시
+    assert index.translate('  unmet NEED remains   high ') == '충족되지 않은 수요는 여전히 높다.'
+    # 문장 하나로도 행을 찾음 (약어 뒤에서 나누지 않음)
+    assert index.row('Access varies, e.g. by region.')['en'].startswith('Family planning saves lives.')
+    assert index.translate('Not in the tables', default='-') == '-'
+
+    assert [row['ko'] for row in index.section('ABSTRACT')][-1] == '재정 지원이 정체되었다.'
+    assert index.section('건강상의 혜택')[1]['en'] == 'Contraception reduces maternal deaths.'
+    assert index.section('Nonexistent') == []
+
+    assert [row['en'] for row in index.search('need unmet')] == ['Unmet need remains high.']
+    assert index.search('') == []
+
+
+def test_rows_shared_between_files(sources):
+    index = AlignmentIndex.open(sources)
+    row = index.row('Family planning saves lives.')
+    assert [path for path, _, _ in row['locations']] == list(sources)
+    # 위치는 줄 번호와 바이트 오프셋
+    path, line, offset = row['locations'][0]
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        assert f.readline().decode('utf-8').startswith('| Family planning saves lives.')
+    assert RAW.splitlines()[line - 1].startswith('| Family planning')
+
+
+def test_saved_index_is_reused(sources):
+    index = AlignmentIndex.open(sources)
+    assert not index.dirty
+    # mkstemp(0600)이 아니라 umask를 따르는 일반 파일 권한
+    open('probe', 'w').close()
+    assert os.stat(translation_index.INDEX_PATH).st_mode == os.stat('probe').st_mode
+
+    loaded = AlignmentIndex.load()
+    assert loaded.rows == index.rows
+    assert loaded.update(sources) == []
+    assert not loaded.dirty
+
+
+def test_only_changed_files_are_rescanned(sources, monkeypatch):
+    index = AlignmentIndex.open(sources)
+    scanned = []
+    scan_rows = translation_index.scan_rows
+    monkeypatch.setattr(translation_index, 'scan_rows', lambda path: scanned.append(path) or scan_rows(path))
+
+    # 내용이 같으면 stat만 갱신
+    os.utime('translate.md', ns=(0, 0))
+    assert index.update(sources) == []
+    assert scanned == ['translate.md']
+    assert index.dirty
+
+    with open('translate_unified.md', 'a', encoding='utf-8') as f:
+        f.write('| Access must improve. | 접근성이 개선되어야 한다. |\n')
+    scanned.clear()
+    assert index.update(sources) == ['translate_unified.md']
+    assert scanned == ['translate_unified.md']
+    assert index.translate('Access must improve.') == '접근성이 개선되어야 한다.'
+
+    os.remove('translate_unified.md')
+    assert index.update(sources) == ['translate_unified.md']
+    assert index.translate('Funding has stalled.') is None
+    assert index.translate('Unmet need remains high.') == '충족되지 않은 수요는 여전히 높다.'
+
+
+def test_other_version_is_ignored(sources):
+    with open(translation_index.INDEX_PATH, 'w', encoding='utf-8') as f:
+        f.write('{"version": 0}')
+    assert AlignmentIndex.load().rows == []
+    assert AlignmentIndex.open(sources).translate('Funding has stalled.') == '재정 지원이 정체되었다.'
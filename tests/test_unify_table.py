@@ -0,0 +1,109 @@
+"""
+unify_table: the streaming iter_unified must produce exactly what the
+original list-based implementation wrote
+"""
+
+import os
+
+import pytest
+
+from conftest import ROOT
+from unify_table import TITLE, SUBTITLE, iter_unified, unify_files, unify_markdown_table
+
+
+def legacy_unify(lines):
+    """The original unify_markdown_table loop (whole file in memory)"""
+    new_content = [f"{TITLE}\n", f"{SUBTITLE}\n\n",
+                   "| English Original | 한글 번역 |\n", "|------------------|----------|\n"]
+    for i, line in enumerate(lines):
+        if line.strip() == "":
+            continue
+        if line.startswith("# Family Planning:") or line.startswith("## 가족계획:"):
+            continue
+        if line.strip() == "---":
+            continue
+        if line.startswith("## ") and not line.startswith("## 가족계획:"):
+            section_eng = line.strip().replace("## ", "")
+            if i + 1 < len(lines) and lines[i + 1].startswith("### "):
+                section_kor = lines[i + 1].strip().replace("### ", "")
+                new_content.append(f"| **{section_eng.upper()}** | **{section_kor}** |\n")
+            continue
+        if line.startswith("### "):
+            continue
+        if "English Original" in line or "English" in line and "Korean" in line:
+            continue
+        if line.startswith("|---") or line.startswith("|-"):
+            continue
+        if line.startswith("|"):
+            new_content.append(line.rstrip() + "\n")
+    return new_content
+
+
+SAMPLE = """# Family Planning: The Unfinished Agenda
+## 가족계획: 미완의 과제
+
+---
+
+## Abstract
+### 요약
+
+| English | Korean |
+|---------|--------|
+| Family planning saves lives. | 가족계획은 생명을 구한다. |
+| Second row   | 두 번째 행 |
+
+## Heading without subtitle
+| Row after lone heading | 외톨이 제목 다음 행 |
+### 고아 부제목
+not a table line
+## Trailing heading"""
+
+
+@pytest.mark.parametrize('text', [
+    SAMPLE,
+    SAMPLE + '\n',
+    '',
+    '## Last\n### 마지막',
+    '## Last\n### 마지막\n',
+])
+def test_matches_legacy_on_samples(text):
+    lines = text.splitlines(keepends=True)
+    assert list(iter_unified(lines)) == legacy_unify(lines)
+
+
+@pytest.mark.parametrize('name', ['translate.md', 'translate_backup.md', 'references_continued.md'])
+def test_matches_legacy_on_repo_files(name):
+    path = os.path.join(ROOT, name)
+    if not os.path.exists(path):
+        pytest.skip(f'{name} not in this checkout')
+    with open(path, encoding='utf-8') as f:
+        lines = f.readlines()
+    with open(path, encoding='utf-8') as f:
+        # 파일 객체를 그대로 넘겨도 같은 결과
+        assert list(iter_unified(f)) == legacy_unify(lines)
+
+
+def test_files_are_written_in_parallel(tmp_path):
+    inputs = []
+    for n in range(3):
+        path = tmp_path / f'paper{n}.md'
+        path.write_text(SAMPLE.replace('Second row', f'Row {n}'), encoding='utf-8')
+        inputs.append(str(path))
+
+    results = unify_files(inputs, output_dir=str(tmp_path / 'out'), processes=2, log=None)
+    assert [os.path.basename(output) for _, output, _ in results] == [f'paper{n}_unified.md' for n in range(3)]
+    for input_file, output, rows in results:
+        with open(input_file, encoding='utf-8') as f:
+            expected = legacy_unify(f.readlines())
+        with open(output, encoding='utf-8') as f:
+            assert f.read() == ''.join(expected)
+        assert rows == len(expected) - 4
+
+
+def test_single_file(tmp_path):
+    source = tmp_path / 'paper.md'
+    source.write_text(SAMPLE, encoding='utf-8')
+    output = tmp_path / 'paper_unified.md'
+    rows = unify_markdown_table(str(source), str(output), quiet=True)
+    assert rows == 4
+    assert output.read_text(encoding='utf-8') == ''.join(legacy_unify(SAMPLE.splitlines(True)))
@@ -0,0 +1,278 @@
+"""
+Bilingual alignment index
+Persistent lookup tables over the English | 한글 translation tables
+(translate.md, translate_unified.md): normalised English sentence -> Korean
+row, section title -> rows, and an inverted token index. The index is stored
+as JSON and only files that changed since the last build are re-scanned, so
+slide building and citation checks can look a sentence up with a dict access
+instead of scanning the markdown.
+
+    python translation_index.py                               # build / update
+    python translation_index.py --lookup "Family planning: the unfinished agenda"
+    python translation_index.py --search unmet need
+    python translation_index.py --section ABSTRACT
+
+As a library:
+    index = AlignmentIndex.open()       # loads, updates changed files, saves
+    index.translate("Promotion of family planning in countries ...")
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import re
+import sys
+import unicodedata
+
+from unify_table import unify_line
+
+SOURCES = ('translate.md', 'translate_unified.md')
+INDEX_PATH = '.translation-index.json'
+VERSION = 1
+
+# 약어(e.g., Prof.) 뒤에서 잘리지 않도록 다음 문장이 대문자/숫자로 시작할 때만 분리
+SENTENCE_END = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9"(])')
+TOKEN = re.compile(r'\w+')
+
+
+def normalize(text):
+    """Comparison form of a cell: NFKC, no markdown emphasis, single spaces, lower case"""
+    text = unicodedata.normalize('NFKC', text).replace('*', '')
+    return ' '.join(text.split()).lower().rstrip('.!?;: ')
+
+
+def sentence_key(text):
+    return hashlib.sha1(normalize(text).encode('utf-8')).hexdigest()[:16]
+
+
+def sentences(text):
+    return [part for part in SENTENCE_END.split(text.strip()) if part]
+
+
+def tokens(text):
+    return {token for token in TOKEN.findall(normalize(text)) if len(token) > 1}
+
+
+def is_heading(english):
+    """Rows written entirely in bold (| **ABSTRACT** | **요약** |) start a section"""
+    return len(english) > 4 and english.startswith('**') and english.endswith('**')
+
+
+def scan_rows(path):
+    """Read a translation file once; returns (sha256, [[line, byte offset, english, korean]])
+
+    Raw translation files and unify_table output are both accepted: lines are
+    classified with unify_table.unify_line, so '## Section' / '### 섹션'
+    heading pairs become bold rows exactly as in the unified table.
+    """
+    digest = hashlib.sha256()
+    rows = []
+    pending = None
+    offset = 0
+    with open(path, 'rb') as f:
+        for number, raw in enumerate(itertools.chain(f, [None]), 1):
+            line = None if raw is None else raw.decode('utf-8')
+            if pending is not None:
+                row = unify_line(pending[2], line)
+                if row is not None:
+                    cells = [cell.strip() for cell in row.strip()[1:-1].split('|')]
+                    if len(cells) >= 2:
+                        rows.append([pending[0], pending[1], cells[0], cells[-1]])
+            if raw is None:
+                break
+            digest.update(raw)
+            pending = (number, offset, line)
+            offset += len(raw)
+    return digest.hexdigest(), rows
+
+
+class AlignmentIndex:
+    """English -> Korean alignment of the translation tables
+
+    Usage:
+        index = AlignmentIndex.open()
+        index.translate("Health benefits")          # '**건강상의 혜택**'
+        index.section("ABSTRACT")                   # rows of that section
+        index.search("unmet need")                  # rows containing every token
+    """
+
+    def __init__(self, path=INDEX_PATH):
+        self.path = path
+        self.files = {}
+        self.rows = []
+        self.sections = []
+        self.section_names = {}
+        self.sentences = {}
+        self.tokens = {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path=INDEX_PATH):
+        """Index saved at `path` (empty if there is none or it is from another version)"""
+        index = cls(path)
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return index
+        if data.get('version') != VERSION:
+            return index
+        for name in ('files', 'rows', 'sections', 'section_names', 'sentences', 'tokens'):
+            setattr(index, name, data[name])
+        return index
+
+    @classmethod
+    def open(cls, sources=SOURCES, path=INDEX_PATH):
+        """Load, bring up to date with `sources` and save if anything changed"""
+        index = cls.load(path)
+        index.update(sources)
+        if index.dirty:
+            index.save()
+        return index
+
+    def update(self, sources=SOURCES):
+        """Re-scan the sources that changed since the last update; returns their paths
+
+        A file whose size and mtime are unchanged is not read at all; one that
+        was touched but has the same content only gets its stat refreshed.
+        """
+        changed = []
+        for path in sources:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entry = self.files.get(path)
+            if entry and (entry['size'], entry['mtime_ns']) == (stat.st_size, stat.st_mtime_ns):
+                continue
+            digest, rows = scan_rows(path)
+            if entry and entry['digest'] == digest:
+                entry.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+            else:
+                self.files[path] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                                    'digest': digest, 'rows': rows}
+                changed.append(path)
+            self.dirty = True
+        removed = [path for path in self.files if path not in sources or not os.path.exists(path)]
+        # 앞 파일의 행이 우선하므로 sources 순서대로 다시 정렬
+        order = [path for path in sources if path in self.files and path not in removed]
+        if changed or removed or list(self.files) != order:
+            self.files = {path: self.files[path] for path in order}
+            self._build()
+            self.dirty = True
+        return changed + removed
+
+    def _build(self):
+        """Derive the lookup tables from the stored rows of every file (no file access)"""
+        self.rows, self.sections = [], []
+        self.section_names, self.sentences, self.tokens = {}, {}, {}
+        row_ids = {}
+        for path, entry in self.files.items():
+            section = None
+            for line, offset, english, korean in entry['rows']:
+                if is_heading(english):
+                    name = normalize(english)
+                    section = self.section_names.get(name)
+                    if section is None:
+                        section = len(self.sections)
+                        self.sections.append({'en': english.strip('*'), 'ko': korean.strip('*'), 'rows': []})
+                        self.section_names[name] = section
+                        self.section_names.setdefault(normalize(korean), section)
+
+                # 같은 행이 여러 파일에 있으면 (translate.md / translate_unified.md) 위치만 추가
+                key = (normalize(english), normalize(korean))
+                row_id = row_ids.get(key)
+                if row_id is not None:
+                    self.rows[row_id]['locations'].append([path, line, offset])
+                    continue
+                row_id = row_ids[key] = len(self.rows)
+                self.rows.append({'en': english, 'ko': korean, 'section': section,
+                                  'locations': [[path, line, offset]]})
+                if section is not None:
+                    self.sections[section]['rows'].append(row_id)
+                self.sentences.setdefault(sentence_key(english), row_id)
+                for sentence in sentences(english):
+                    self.sentences.setdefault(sentence_key(sentence), row_id)
+                for token in tokens(english) | tokens(korean):
+                    self.tokens.setdefault(token, []).append(row_id)
+
+    def save(self):
+        """Write the index (atomic rename)"""
+        data = {'version': VERSION, 'files': self.files, 'rows': self.rows,
+                'sections': self.sections, 'section_names': self.section_names,
+                'sentences': self.sentences, 'tokens': self.tokens}
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+    def row(self, english):
+        """Row dict (en, ko, section, locations) for an English cell or sentence, or None"""
+        row_id = self.sentences.get(sentence_key(english))
+        return None if row_id is None else self.rows[row_id]
+
+    def translate(self, english, default=None):
+        """Korean cell aligned with `english`"""
+        row = self.row(english)
+        return default if row is None else row['ko']
+
+    def section(self, title):
+        """Rows of the section titled `title` (English or Korean)"""
+        section = self.section_names.get(normalize(title))
+        if section is None:
+            return []
+        return [self.rows[row_id] for row_id in self.sections[section]['rows']]
+
+    def search(self, text):
+        """Rows containing every token of `text`, in document order"""
+        postings = sorted((self.tokens.get(token, []) for token in tokens(text)), key=len)
+        if not postings:
+            return []
+        found = set(postings[0])
+        for posting in postings[1:]:
+            found.intersection_update(posting)
+        return [self.rows[row_id] for row_id in sorted(found)]
+
+
+def _print_rows(rows):
+    for row in rows:
+        path, line, _ = row['locations'][0]
+        print(f"{path}:{line}: {row['en']} | {row['ko']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build and query the English/Korean alignment index')
+    parser.add_argument('sources', nargs='*', default=list(SOURCES),
+                        help='translation markdown files (default: %(default)s)')
+    parser.add_argument('--index', default=INDEX_PATH, help='index file (default: %(default)s)')
+    parser.add_argument('--lookup', metavar='ENGLISH', help='print the Korean row for a sentence')
+    parser.add_argument('--search', nargs='+', metavar='WORD', help='rows containing every word')
+    parser.add_argument('--section', metavar='TITLE', help='rows of a section')
+    args = parser.parse_args(argv)
+
+    index = AlignmentIndex.load(args.index)
+    changed = index.update(args.sources)
+    if index.dirty:
+        index.save()
+    if changed:
+        print(f"Indexed {', '.join(changed)}: {len(index.rows)} rows, "
+              f"{len(index.sections)} sections, {len(index.tokens)} tokens -> {args.index}")
+
+    if args.lookup:
+        row = index.row(args.lookup)
+        if row is None:
+            print('No aligned row found')
+            return 1
+        _print_rows([row])
+    if args.search:
+        _print_rows(index.search(' '.join(args.search)))
+    if args.section:
+        _print_rows(index.section(args.section))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,73 +1,209 @@
-import re
-
-def unify_markdown_table(input_file, output_file):
-    with open(input_file, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
-    # 새로운 내용을 저장할 리스트
-    new_content = []
-
-    # 제목 추가
-    new_content.append("# Family Planning: The Unfinished Agenda\n")
-    new_content.append("## 가족계획: 미완의 과제\n\n")
-
-    # 표 헤더 추가
-    new_content.append("| English Original | 한글 번역 |\n")
-    new_content.append("|------------------|----------|\n")
-
-    # 섹션 제목을 저장할 변수
-    current_section = ""
-    in_table = False
-    skip_next_separator = False
-
-    for i, line in enumerate(lines):
-        # 빈 줄 건너뛰기
-        if line.strip() == "":
-            continue
-
-        # 메인 제목들은 건너뛰기
-        if line.startswith("# Family Planning:") or line.startswith("## 가족계획:"):
-            continue
-
-        # 구분선 건너뛰기
-        if line.strip() == "---":
-            continue
-
-        # 섹션 제목 처리
-        if line.startswith("## ") and not line.startswith("## 가족계획:"):
+"""
+Unify translated markdown tables
+Turns a translation file (section headings plus English | 한글 table rows)
+into one continuous two-column table. Input is read line by line and the
+output is written as it is produced, so memory stays flat however long the
+paper is; several files are processed in parallel, one per process.
+
+    python unify_table.py translate.md                        # -> translate_unified.md
+    python unify_table.py translate.md translate_backup.md references_continued.md
+    python unify_table.py "papers/*.md" -o unified/ -j 4
+
+As a library:
+    from unify_table import iter_unified, unify_markdown_table, unify_files
+"""
+
+import argparse
+import glob
+import itertools
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+TITLE = "# Family Planning: The Unfinished Agenda"
+SUBTITLE = "## 가족계획: 미완의 과제"
+SUFFIX = '_unified'
+
+
+def header_lines(title=TITLE, subtitle=SUBTITLE):
+    """Title and table header written before the rows"""
+    return [
+        f"{title}\n",
+        f"{subtitle}\n\n",
+        "| English Original | 한글 번역 |\n",
+        "|------------------|----------|\n",
+    ]
+
+
+def unify_line(line, next_line):
+    """Output row for one input line (None if the line is dropped)
+
+    `next_line` is the following input line (None at the end), needed to pair
+    an English section heading with its Korean subtitle.
+    """
+    # 빈 줄 건너뛰기
+    if line.strip() == "":
+        return None
+
+    # 메인 제목들은 건너뛰기
+    if line.startswith("# Family Planning:") or line.startswith("## 가족계획:"):
+        return None
+
+    # 구분선 건너뛰기
+    if line.strip() == "---":
+        return None
+
+    # 섹션 제목 처리: 다음 줄의 한글 제목과 한 행으로
+    if line.startswith("## "):
+        if next_line is not None and next_line.startswith("### "):
             section_eng = line.strip().replace("## ", "")
-            # 다음 줄에서 한글 제목 찾기
-            if i+1 < len(lines) and lines[i+1].startswith("### "):
-                section_kor = lines[i+1].strip().replace("### ", "")
-                new_content.append(f"| **{section_eng.upper()}** | **{section_kor}** |\n")
-                skip_next_separator = True
-            continue
-
-        # 한글 부제목 건너뛰기
-        if line.startswith("### "):
-            continue
-
-        # 표 헤더 줄 건너뛰기
-        if "English Original" in line or "English" in line and "Korean" in line:
-            continue
-
-        # 표 구분선 건너뛰기
-        if line.startswith("|---") or line.startswith("|-"):
-            continue
-
-        # 실제 표 내용만 추가
-        if line.startswith("|"):
-            # 줄 끝의 개행 문자 제거 후 추가
-            new_content.append(line.rstrip() + "\n")
-
-    # 파일에 쓰기
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.writelines(new_content)
-
-    print(f"통합된 파일이 {output_file}에 저장되었습니다.")
-
-# 실행
-unify_markdown_table(
-    r"C:\Users\Administrator\OneDrive\Onedrive\SNU\박사과정\[2025-2] 인구정책론\2_발제\translate.md",
-    r"C:\Users\Administrator\OneDrive\Onedrive\SNU\박사과정\[2025-2] 인구정책론\2_발제\translate_unified.md"
-)
\ No newline at end of file
+            section_kor = next_line.strip().replace("### ", "")
+            return f"| **{section_eng.upper()}** | **{section_kor}** |\n"
+        return None
+
+    # 한글 부제목 건너뛰기
+    if line.startswith("### "):
+        return None
+
+    # 표 헤더 줄 건너뛰기
+    if "English Original" in line or "English" in line and "Korean" in line:
+        return None
+
+    # 표 구분선 건너뛰기
+    if line.startswith("|-"):
+        return None
+
+    # 실제 표 내용만 추가
+    if line.startswith("|"):
+        return line.rstrip() + "\n"
+    return None
+
+
+def iter_unified(lines, title=TITLE, subtitle=SUBTITLE):
+    """Yield the unified file line by line from any iterable of input lines
+
+    Only the current line and the one after it are held, so a file object can
+    be passed straight in.
+    """
+    yield from header_lines(title, subtitle)
+    lines = iter(lines)
+    line = next(lines, None)
+    # 한 줄 앞을 미리 읽어 '## 영어 제목' 다음의 '### 한글 제목'을 짝지음
+    for next_line in itertools.chain(lines, [None]):
+        if line is None:
+            break
+        row = unify_line(line, next_line)
+        if row is not None:
+            yield row
+        line = next_line
+
+
+def unify_markdown_table(input_file, output_file, title=TITLE, subtitle=SUBTITLE, quiet=False):
+    """Stream input_file into output_file; returns the number of table rows written
+
+    The output is written to a temporary file next to it and moved into place
+    when complete, so an interrupted run never leaves a truncated table.
+    """
+    temp_file = f"{output_file}.tmp{os.getpid()}"
+    rows = 0
+    try:
+        with open(input_file, 'r', encoding='utf-8') as src, \
+                open(temp_file, 'w', encoding='utf-8') as dst:
+            for line in iter_unified(src, title, subtitle):
+                dst.write(line)
+                rows += 1
+        os.replace(temp_file, output_file)
+    except BaseException:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        raise
+    rows -= len(header_lines(title, subtitle))
+
+    if not quiet:
+        print(f"통합된 파일이 {output_file}에 저장되었습니다.")
+    return rows
+
+
+def expand_inputs(patterns, suffix=SUFFIX):
+    """Input files for the given paths and glob patterns, in order, without duplicates
+
+    Files that are themselves unify output (name ending in `suffix`) are
+    skipped when they come from a glob.
+    """
+    files = []
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            matches = sorted(path for path in glob.glob(pattern, recursive=True)
+                             if not os.path.splitext(path)[0].endswith(suffix))
+        else:
+            matches = [pattern]
+        for path in matches:
+            if path not in files:
+                files.append(path)
+    return files
+
+
+def output_path(input_file, output_dir=None, suffix=SUFFIX):
+    """translate.md -> translate_unified.md (in output_dir if given)"""
+    stem, ext = os.path.splitext(os.path.basename(input_file))
+    directory = output_dir if output_dir is not None else os.path.dirname(input_file)
+    return os.path.join(directory, f"{stem}{suffix}{ext or '.md'}")
+
+
+def _unify_job(job):
+    input_file, output_file, title, subtitle = job
+    return input_file, output_file, unify_markdown_table(input_file, output_file, title, subtitle, quiet=True)
+
+
+def unify_files(inputs, output_dir=None, suffix=SUFFIX, processes=None,
+                title=TITLE, subtitle=SUBTITLE, log=print):
+    """Unify every input file (paths or globs), several processes at once
+
+    Returns [(input_file, output_file, rows)] in input order.
+    """
+    files = expand_inputs(inputs, suffix)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    jobs = [(path, output_path(path, output_dir, suffix), title, subtitle) for path in files]
+    processes = min(processes or os.cpu_count() or 1, len(jobs))
+
+    results = []
+    if processes <= 1:
+        outcomes = map(_unify_job, jobs)
+    else:
+        # 파일 하나가 작업 하나 - 프로세스마다 한 파일씩 스트리밍
+        pool = ProcessPoolExecutor(max_workers=processes)
+        outcomes = pool.map(_unify_job, jobs)
+    try:
+        for input_file, output_file, rows in outcomes:
+            if log:
+                log(f"통합된 파일이 {output_file}에 저장되었습니다. ({rows} rows)")
+            results.append((input_file, output_file, rows))
+    finally:
+        if processes > 1:
+            pool.shutdown(cancel_futures=True)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Unify translated markdown tables into one table per file')
+    parser.add_argument('inputs', nargs='+', help='markdown files or glob patterns')
+    parser.add_argument('-o', '--output-dir', help='directory for the unified files (default: next to each input)')
+    parser.add_argument('--suffix', default=SUFFIX, help='added to the input name (default: %(default)s)')
+    parser.add_argument('-j', '--processes', type=int, help='files processed at once (default: CPU count)')
+    parser.add_argument('--title', default=TITLE)
+    parser.add_argument('--subtitle', default=SUBTITLE)
+    args = parser.parse_args(argv)
+
+    missing = [path for path in expand_inputs(args.inputs, args.suffix) if not os.path.exists(path)]
+    if missing:
+        parser.error(f"not found: {', '.join(missing)}")
+    results = unify_files(args.inputs, args.output_dir, args.suffix, args.processes,
+                          args.title, args.subtitle)
+    if not results:
+        parser.error('no input files matched')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())